@@ -83,6 +83,7 @@ DATABASE SETUP CREATION
 # Database import:
 from utilities.database import DATABASE
 from utilities.database import environment
+from utilities.database import scripts
 
 # Utilities import:
 from utilities import verification
@@ -99,12 +100,23 @@ log.info("Database instance created")
 # Database model import:
 from utilities.database.models.word import Word
 from utilities.database.models.input import Input
+from utilities.database.models.form import Form
+from utilities.database.models.root import Root
+from utilities.database.models.link import Link
+from utilities.database.models.similar import Similar
+from utilities.database.models.statistic import Statistic
+from utilities.database.models.user import User
+from utilities.database.models.state import UserWordState
+from utilities.database.models.review import Review
 
 # Initializing database:
 environment.initialize_database_environment()
 with application.app_context():
     DATABASE.create_all()
     log.info("Database tables created")
+    scripts.upgrade_database_schema()
+    scripts.migrate_legacy_statuses()
+    scripts.initialize_search_index()
 
     
 """
@@ -123,6 +135,10 @@ from routes.random import RANDOM_BLUEPRINT
 from routes.search import SEARCH_BLUEPRINT
 from routes.word import WORD_BLUEPRINT
 from routes.practice import PRACTICE_BLUEPRINT
+from routes.analyze import ANALYZE_BLUEPRINT
+from routes.root import ROOT_BLUEPRINT
+from routes.assets import ASSETS_BLUEPRINT
+from routes.api import API_BLUEPRINT
 
 
 # Registering blueprints:
@@ -134,11 +150,54 @@ application.register_blueprint(blueprint = PRACTICE_BLUEPRINT)
 application.register_blueprint(blueprint = RANDOM_BLUEPRINT)
 application.register_blueprint(blueprint = SEARCH_BLUEPRINT)
 application.register_blueprint(blueprint = WORD_BLUEPRINT)
+application.register_blueprint(blueprint = ANALYZE_BLUEPRINT)
+application.register_blueprint(blueprint = ROOT_BLUEPRINT)
+application.register_blueprint(blueprint = ASSETS_BLUEPRINT)
+application.register_blueprint(blueprint = API_BLUEPRINT)
 
 # Logging:
 log.info("Routing blueprints registered")
 
 
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+REGISTERING RESPONSE HOOKS
+
+"""
+
+
+# Importing response hooks:
+from utilities import responses
+
+# Tagging, revalidating and compressing dynamic responses:
+application.after_request(responses.finalize_response)
+
+# Logging:
+log.info("Response hooks registered")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BUILDING STATIC ASSETS
+
+"""
+
+
+# Importing assets and fonts builders:
+from utilities import assets, fonts
+
+# Subsetting fonts on first start, then fingerprinting static assets:
+fonts.initialize_fonts()
+assets.build_assets()
+
+# Exposing asset URLs to templates:
+application.add_template_global(assets.asset_url, name = "asset_url")
+application.add_template_global(fonts.font_stylesheet, name = "font_stylesheet")
+
+# Logging:
+log.info("Static assets built")
+
+
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 APPLICATION RUN BLOCK
@@ -0,0 +1,113 @@
+"""
+Benchmarks dictionary listing latency of `OFFSET` paging against keyset (seek) paging over the
+page boundary index, on a synthetic dictionary of 100k entries, from the first to the last page.
+Run from the repository root:
+
+    python -m benchmarks.paginate
+"""
+
+# System-management, timing and database imports:
+import os
+import sqlite3
+import tempfile
+import time
+
+# Database-related import:
+from sqlalchemy import create_engine
+from utilities.database.models.word import Word
+from utilities.paginate import PageBoundaryIndex
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK VARIABLES BLOCK
+
+"""
+
+
+# Benchmark configuration:
+BENCHMARK_ROW_COUNT: int = 100_000
+BENCHMARK_PER_PAGE: int = 100
+BENCHMARK_PAGES: tuple[int, ...] = (1, 10, 90, 250, 500, 1000)
+BENCHMARK_REPEATS: int = 5
+
+# Listing queries, as issued by the dictionary page:
+SQL_PAGE_OFFSET: str = 'SELECT * FROM words ORDER BY "INDEX" LIMIT ? OFFSET ?'
+SQL_PAGE_SEEK: str = 'SELECT * FROM words WHERE "INDEX" >= ? ORDER BY "INDEX" LIMIT ?'
+SQL_PAGE_KEYS: str = 'SELECT "INDEX" FROM words ORDER BY "INDEX"'
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK FUNCTIONS BLOCK
+
+"""
+
+
+def __populate(database_filepath: str) -> None:
+    """
+    Creates the `words` table from the model and fills it with synthetic entries (containers
+    padded to a realistic size, Pealim indexes with gaps).
+    """
+
+    # Creating table from model:
+    engine = create_engine(f"sqlite:///{database_filepath}")
+    Word.__table__.create(bind = engine)
+    engine.dispose()
+
+    # Inserting synthetic rows:
+    html_padding: str = "<div>" + "x" * 4000 + "</div>"
+    connection = sqlite3.connect(database_filepath)
+    connection.executemany(
+        'INSERT INTO words (ID, "INDEX", HTML_CONTAINER_LANG_RU, HTML_CONTAINER_LANG_EN, HTML_CONTAINER_LANG_HE) VALUES (?, ?, ?, ?, ?)',
+        ((row_index, row_index * 3, html_padding, html_padding, html_padding) for row_index in range(1, BENCHMARK_ROW_COUNT + 1)),
+        )
+    connection.commit()
+    connection.close()
+
+
+def __measure(callback) -> float:
+    """
+    Returns median wall time of the callback in milliseconds.
+    """
+
+    timings: list[float] = []
+    for _ in range(BENCHMARK_REPEATS):
+        start_time: float = time.perf_counter()
+        callback()
+        timings.append((time.perf_counter() - start_time) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def run() -> None:
+    """
+    Builds the synthetic dictionary and prints a per-page latency table for both paging modes.
+    """
+
+    with tempfile.TemporaryDirectory() as temporary_folder:
+        database_filepath: str = os.path.join(temporary_folder, "benchmark.db")
+        __populate(database_filepath = database_filepath)
+        connection = sqlite3.connect(database_filepath)
+
+        # Building the boundary index the same way `build_page_boundaries` does:
+        start_time: float = time.perf_counter()
+        key_list: list[int] = [key for (key,) in connection.execute(SQL_PAGE_KEYS)]
+        boundary_index = PageBoundaryIndex(
+            per_page = BENCHMARK_PER_PAGE,
+            boundary_list = key_list[::BENCHMARK_PER_PAGE],
+            total_count = len(key_list)
+            )
+        print(f"Built {boundary_index.total_pages} page boundaries in {(time.perf_counter() - start_time) * 1000:.1f}ms (once per dictionary version)")
+
+        # Measuring both modes on every page:
+        print(f"{'page':>6}{'OFFSET, ms':>14}{'seek, ms':>12}")
+        for page in BENCHMARK_PAGES:
+            offset_time = __measure(lambda: connection.execute(SQL_PAGE_OFFSET, (BENCHMARK_PER_PAGE, (page - 1) * BENCHMARK_PER_PAGE)).fetchall())
+            seek_time = __measure(lambda: connection.execute(SQL_PAGE_SEEK, (boundary_index.boundary(page), BENCHMARK_PER_PAGE)).fetchall())
+            print(f"{page:>6}{offset_time:>14.2f}{seek_time:>12.2f}")
+        connection.close()
+
+
+if __name__ == "__main__":
+    run()
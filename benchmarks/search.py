@@ -0,0 +1,162 @@
+"""
+Benchmarks search latency of the legacy `LIKE` scan against the FTS5 search index on a synthetic
+dictionary of 10k and 100k entries. Run from the repository root:
+
+    python -m benchmarks.search
+"""
+
+# System-management, timing and randomization imports:
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+# Database-related import:
+from sqlalchemy import create_engine
+from utilities.database.models.word import Word
+from utilities.database.models.form import Form
+from utilities.database.models.state import UserWordState
+from utilities.database import scripts
+from utilities.search import SQL_SEARCH_COUNT, SQL_SEARCH_PAGE, SEARCH_RESULTS_PER_PAGE, compose_match_expression
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK VARIABLES BLOCK
+
+"""
+
+
+# Benchmark configuration:
+BENCHMARK_ROW_COUNTS: tuple[int, ...] = (10_000, 100_000)
+BENCHMARK_REPEATS: int = 5
+BENCHMARK_QUERIES: tuple[str, ...] = (
+    "tova",         # <- English hit
+    "лито",         # <- Russian hit (English misses first)
+    "zzzz",         # <- miss in every language, worst case for the legacy path
+    )
+
+# Syllables for synthetic vocabulary:
+SYLLABLES_EN: tuple[str, ...] = ("ka", "to", "va", "li", "me", "ro", "sa", "ne", "di", "pu")
+SYLLABLES_RU: tuple[str, ...] = ("ка", "то", "ва", "ли", "ме", "ро", "са", "не", "ди", "пу")
+
+# Legacy search, one full scan per language:
+SQL_SEARCH_LIKE: str = "SELECT * FROM words WHERE lower(TRANSLATION_LANG_{language}) LIKE ?"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK FUNCTIONS BLOCK
+
+"""
+
+
+def __generate_term(syllables: tuple[str, ...]) -> str:
+    return "".join(random.choice(syllables) for _ in range(random.randint(2, 4)))
+
+
+def __populate(database_filepath: str, row_count: int) -> None:
+    """
+    Creates the tables search reads from the models and fills `words` with synthetic entries,
+    then builds the search index with the same script the converter uses.
+    """
+
+    # Creating tables from models:
+    engine = create_engine(f"sqlite:///{database_filepath}")
+    Word.__table__.create(bind = engine)
+    Form.__table__.create(bind = engine)
+    UserWordState.__table__.create(bind = engine)
+    engine.dispose()
+
+    # Inserting synthetic rows (HTML containers are padded to a realistic size):
+    random.seed(row_count)
+    html_padding: str = "<div>" + "x" * 8000 + "</div>"
+    connection = sqlite3.connect(database_filepath)
+    connection.executemany(
+        "INSERT INTO words (ID, \"INDEX\", HTML_CONTAINER_LANG_RU, HTML_CONTAINER_LANG_EN, HTML_CONTAINER_LANG_HE, "
+        "TRANSLATION_LANG_EN, TRANSLATION_LANG_RU, TRANSLATION_LANG_HE, SEARCH_LANG_EN, SEARCH_LANG_RU) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, '[]', '[]')",
+        (
+            (
+                row_index, row_index, html_padding, html_padding, html_padding,
+                f"to {__generate_term(SYLLABLES_EN)}, {__generate_term(SYLLABLES_EN)}",
+                f"{__generate_term(SYLLABLES_RU)}, {__generate_term(SYLLABLES_RU)}",
+                "כָּתַב",
+            )
+            for row_index in range(1, row_count + 1)
+        ),
+        )
+    scripts.register_search_functions(driver_connection = connection)
+    connection.execute(scripts.SQL_CREATE_SEARCH_INDEX)
+    connection.execute(scripts.SQL_POPULATE_SEARCH_INDEX)
+    connection.commit()
+    connection.close()
+
+
+def __measure(callback) -> float:
+    """
+    Returns median wall time of the callback in milliseconds.
+    """
+
+    timings: list[float] = []
+    for _ in range(BENCHMARK_REPEATS):
+        start_time: float = time.perf_counter()
+        callback()
+        timings.append((time.perf_counter() - start_time) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def __search_like(connection: sqlite3.Connection, query_text: str) -> list:
+    for language in ("EN", "RU", "HE"):
+        search_results = connection.execute(
+            SQL_SEARCH_LIKE.format(language = language), (f"%{query_text.lower()}%",)
+            ).fetchall()
+        if search_results:
+            return search_results
+    return []
+
+
+def __search_index(connection: sqlite3.Connection, query_text: str) -> list:
+    search_parameters: dict = {
+        "expression": compose_match_expression(query_text = query_text),
+        "key": None,
+        "key_end": None,
+        "folded_key": None,
+        "folded_key_end": None,
+        "form": None,
+        "term": query_text.lower(),
+        "prefix": f"{query_text.lower()}%",
+        "user": None,
+        "limit": SEARCH_RESULTS_PER_PAGE,
+        "offset": 0,
+        }
+    connection.execute(SQL_SEARCH_COUNT, search_parameters).fetchone()
+    return connection.execute(SQL_SEARCH_PAGE, search_parameters).fetchall()
+
+
+def run() -> None:
+    """
+    Runs the benchmark for every configured row count and prints a median latency table.
+    """
+
+    for row_count in BENCHMARK_ROW_COUNTS:
+        with tempfile.TemporaryDirectory() as temporary_folder:
+            database_filepath: str = os.path.join(temporary_folder, "benchmark.db")
+            __populate(database_filepath = database_filepath, row_count = row_count)
+            connection = sqlite3.connect(database_filepath)
+
+            # Measuring both paths on every query:
+            print(f"\n{row_count} rows")
+            print(f"{'query':<10}{'LIKE, ms':>12}{'FTS5, ms':>12}{'rows':>8}")
+            for query_text in BENCHMARK_QUERIES:
+                like_time = __measure(lambda: __search_like(connection, query_text))
+                index_time = __measure(lambda: __search_index(connection, query_text))
+                row_total = len(__search_index(connection, query_text))     # <- first page only
+                print(f"{query_text:<10}{like_time:>12.2f}{index_time:>12.2f}{row_total:>8}")
+            connection.close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,61 @@
+"""
+Benchmarks the offline similar-words precompute on a synthetic dictionary of 10k entries with a
+skewed (Zipf-like) vocabulary, as real translations have. Run from the repository root:
+
+    python -m benchmarks.similar
+"""
+
+# Randomization and timing imports:
+import random
+import time
+
+# Similarity import:
+from utilities.similar import compute_similar_words
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK VARIABLES BLOCK
+
+"""
+
+
+# Benchmark configuration:
+BENCHMARK_ENTRY_COUNT: int = 10_000
+BENCHMARK_VOCABULARY_SIZE: int = 8_000
+BENCHMARK_TOKENS_PER_ENTRY: tuple[int, int] = (1, 5)
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK FUNCTIONS BLOCK
+
+"""
+
+
+def run() -> None:
+    """
+    Builds synthetic search token lists and times the full neighbour precompute.
+    """
+
+    # Building synthetic entries, term rank drawn with 1/rank weights:
+    random.seed(0)
+    vocabulary: list[str] = [f"term{term_rank}" for term_rank in range(BENCHMARK_VOCABULARY_SIZE)]
+    term_weights: list[float] = [1 / (term_rank + 1) for term_rank in range(BENCHMARK_VOCABULARY_SIZE)]
+    entry_list: list[tuple] = [
+        (
+            entry_index,
+            random.choices(vocabulary, weights = term_weights, k = random.randint(*BENCHMARK_TOKENS_PER_ENTRY)),
+            random.choices(vocabulary, weights = term_weights, k = random.randint(*BENCHMARK_TOKENS_PER_ENTRY)),
+            )
+        for entry_index in range(BENCHMARK_ENTRY_COUNT)
+        ]
+
+    # Timing precompute:
+    start_time: float = time.perf_counter()
+    similar_list = compute_similar_words(entry_list = entry_list)
+    print(f"Computed {len(similar_list)} pairs for {BENCHMARK_ENTRY_COUNT} entries in {time.perf_counter() - start_time:.2f}s")
+
+
+if __name__ == "__main__":
+    run()
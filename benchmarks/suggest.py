@@ -0,0 +1,71 @@
+"""
+Benchmarks autocomplete latency of the in-memory prefix index on a synthetic dictionary of 100k
+entries and reports median and p99 lookup time per keystroke. Run from the repository root:
+
+    python -m benchmarks.suggest
+"""
+
+# Randomization and timing imports:
+import random
+import time
+
+# Suggest index import:
+from utilities.suggest import SuggestIndex, SUGGEST_LIMIT_DEFAULT
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK VARIABLES BLOCK
+
+"""
+
+
+# Benchmark configuration:
+BENCHMARK_ENTRY_COUNT: int = 100_000
+BENCHMARK_KEYS_PER_ENTRY: int = 4
+BENCHMARK_LOOKUPS: int = 20_000
+
+# Syllables for synthetic vocabulary:
+SYLLABLES: tuple[str, ...] = ("ka", "to", "va", "li", "me", "ro", "sa", "ne", "di", "pu", "ка", "то", "ва", "ли")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BENCHMARK FUNCTIONS BLOCK
+
+"""
+
+
+def run() -> None:
+    """
+    Builds a synthetic index, replays typed prefixes of random keys and prints latency percentiles.
+    """
+
+    # Building synthetic index:
+    random.seed(0)
+    entry_list: list[tuple] = [(entry_index, "", "", "") for entry_index in range(BENCHMARK_ENTRY_COUNT)]
+    key_pair_list: list[tuple[str, int]] = [
+        ("".join(random.choice(SYLLABLES) for _ in range(random.randint(2, 5))), entry_index)
+        for entry_index in range(BENCHMARK_ENTRY_COUNT)
+        for _ in range(BENCHMARK_KEYS_PER_ENTRY)
+        ]
+    start_time: float = time.perf_counter()
+    suggest_index = SuggestIndex(entry_list = entry_list, key_pair_list = key_pair_list)
+    print(f"Built index of {len(suggest_index.key_list)} keys in {(time.perf_counter() - start_time) * 1000:.0f}ms")
+
+    # Replaying keystrokes (every prefix of a random key):
+    timings: list[float] = []
+    for _ in range(BENCHMARK_LOOKUPS):
+        key: str = random.choice(suggest_index.key_list)
+        prefix: str = key[:random.randint(1, len(key))]
+        start_time = time.perf_counter()
+        suggest_index.lookup(prefix = prefix, limit = SUGGEST_LIMIT_DEFAULT)
+        timings.append((time.perf_counter() - start_time) * 1000)
+
+    # Reporting percentiles:
+    timings.sort()
+    print(f"p50 {timings[len(timings) // 2]:.4f}ms, p99 {timings[int(len(timings) * 0.99)]:.4f}ms, max {timings[-1]:.4f}ms")
+
+
+if __name__ == "__main__":
+    run()
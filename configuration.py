@@ -31,6 +31,8 @@ _FOLDER_IMAGES_NAME: str = "images"
 _FOLDER_IMAGES_PATH: str = os.path.join(_FOLDER_STATIC_PATH, _FOLDER_IMAGES_NAME)
 _FOLDER_FONTS_NAME: str = "fonts"
 _FOLDER_FONTS_PATH: str = os.path.join(_FOLDER_STATIC_PATH, _FOLDER_FONTS_NAME)
+_FOLDER_BUILD_NAME: str = "build"
+_FOLDER_BUILD_PATH: str = os.path.join(_FOLDER_STATIC_PATH, _FOLDER_BUILD_NAME)
 
 # Database filename and -path variables:
 _DB_COMMON_FILENAME: str = "common.db"
@@ -84,6 +86,7 @@ class SETTINGS:
     FOLDER_JS_PATH:           str = _FOLDER_JS_PATH             # /static/js/
     FOLDER_IMAGES_PATH:       str = _FOLDER_IMAGES_PATH         # /static/images/
     FOLDER_FONTS_PATH:        str = _FOLDER_FONTS_PATH          # /static/fonts/
+    FOLDER_BUILD_PATH:        str = _FOLDER_BUILD_PATH          # /static/build/
     
     # Database and collection configuration:
     DATABASE_FILEPATH:        str = _DB_COMMON_FILEPATH
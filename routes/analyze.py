@@ -0,0 +1,93 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Flask-related imports:
+from flask import Blueprint, jsonify, render_template, request
+from typing import Any
+
+# Settings import:
+from configuration import SETTINGS
+
+# Text analysis import:
+from utilities.analyze import ANALYZE_TEXT_LENGTH_MAX, analyze_text
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BLUEPRINT AND VARIABLES BLOCK
+
+"""
+
+
+# Generating blueprint:
+ANALYZE_BLUEPRINT: Blueprint = Blueprint(
+    name = "analyze",
+    import_name = __name__,
+    template_folder = SETTINGS.FOLDER_TEMPLATES_PATH,
+    static_folder = SETTINGS.FOLDER_STATIC_PATH,
+    )
+
+# Getting constants:
+ANALYZE_PAGE_URL: str = "/analyze"
+ANALYZE_PAGE_HTML: str = "analyze.html"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROUTING AND LOGIC BLOCK
+
+"""
+
+
+@ANALYZE_BLUEPRINT.route(rule = ANALYZE_PAGE_URL, methods = ["GET", "POST"])
+def analyze() -> Any:
+    """
+    Look up every word of a pasted Hebrew text. Form posts render the analysis page, JSON posts
+    (`{"text": "..."}`) return the analysis as JSON.
+    """
+
+    # Getting submitted text:
+    analyze_input: str = ""
+    if request.method == "POST":
+        if request.is_json:
+            payload: Any = request.get_json(silent = True)
+            if not isinstance(payload, dict) or not isinstance(payload.get("text", ""), str):
+                return jsonify(error = 'Body must be a JSON object with a "text" string'), 400
+            analyze_input = payload.get("text", "")
+        else:
+            analyze_input = request.form.get("text", "")
+    analyze_input = str(analyze_input).strip()
+
+    # Analyzing text:
+    analysis_list: list[dict] = []
+    if analyze_input:
+        try:
+            analysis_list = analyze_text(
+                text = analyze_input
+                )
+        except Exception as exception_error:
+            log.error(f"Text analysis failed: {exception_error}")
+
+    # Returning JSON for API clients:
+    if request.is_json:
+        return jsonify(
+            text = analyze_input[:ANALYZE_TEXT_LENGTH_MAX],
+            tokens = analysis_list
+            )
+
+    # Preparing template context:
+    context: dict[str, Any] = {
+        "text": analyze_input,
+        "analysis": analysis_list,
+        "text_length_max": ANALYZE_TEXT_LENGTH_MAX,
+        }
+
+    # Generating page route:
+    page_route: str = render_template(
+        ANALYZE_PAGE_HTML,
+        **context
+        )
+
+    # Returning:
+    return page_route
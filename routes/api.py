@@ -0,0 +1,505 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# JSON-related library (orjson is optional and several times faster when installed):
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Flask-related imports:
+from flask import abort, Blueprint, g, request, Response
+from typing import Any, Optional
+
+# Database and search imports:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities import search as search_engine
+from utilities import srs, status, users
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BLUEPRINT AND VARIABLES BLOCK
+
+"""
+
+
+# Generating blueprint:
+API_BLUEPRINT: Blueprint = Blueprint(
+    name = "api",
+    import_name = __name__,
+    url_prefix = "/api/v1",
+    )
+
+# Getting constants:
+API_WORD_URL: str = "/words/<int:word_index>"
+API_WORDS_URL: str = "/words"
+API_SEARCH_URL: str = "/search"
+API_WORD_STATUS_URL: str = "/words/<int:word_index>/status/<status_name>"
+API_STATUS_URL: str = "/words/status"
+API_REVIEWS_URL: str = "/reviews"
+API_REVIEWS_DUE_URL: str = "/reviews/due"
+API_REVIEW_URL: str = "/reviews/<item_kind>/<int:item_id>"
+API_BATCH_MAX: int = 500
+API_LIMIT_DEFAULT: int = 100
+API_LIMIT_MAX: int = 500
+
+# Columns returned for every entry (no HTML containers), statuses are the requesting learner's:
+API_CORE_COLUMNS: tuple = (
+    Word.INDEX,
+    Word.TRANSLATION_LANG_HE,
+    Word.TRANSLATION_LANG_EN,
+    Word.TRANSLATION_LANG_RU,
+    Word.TRANSCRIPTION_LANG_HE,
+    Word.TRANSCRIPTION_LANG_EN,
+    Word.TRANSCRIPTION_LANG_RU,
+    Word.TYPE_LANG_HE,
+    Word.TYPE_LANG_EN,
+    Word.TYPE_LANG_RU,
+    Word.ROOT_LANG_HE,
+    *status.state_columns(),
+    )
+
+# Optional column groups, requested with `?include=paradigm,html`:
+API_OPTIONAL_COLUMNS: dict[str, tuple] = {
+    "paradigm": (Word.PARADIGM,),
+    "html": (Word.HTML_CONTAINER_LANG_RU, Word.HTML_CONTAINER_LANG_EN, Word.HTML_CONTAINER_LANG_HE),
+    }
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SERIALIZATION FUNCTIONS
+
+"""
+
+
+def __json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Serializes a payload with orjson when it is installed, compact standard JSON otherwise.
+    Tagging, 304 answers and compression are left to `responses.finalize_response`.
+    """
+
+    # Serializing payload:
+    if orjson is not None:
+        body: bytes = orjson.dumps(payload)
+    else:
+        body: bytes = json.dumps(payload, ensure_ascii = False, separators = (",", ":")).encode("utf-8")
+
+    # Returning:
+    return Response(body, status = status, mimetype = "application/json")
+
+
+def __read_payload() -> Optional[dict]:
+    """
+    JSON object posted in the request body, empty for a request without a body. Anything else
+    (malformed JSON, an array or a scalar) gives None, answered with 400 by the caller.
+    """
+
+    # Reading body:
+    if not request.get_data(cache = True):
+        return {}
+    payload: Any = request.get_json(force = True, silent = True)
+
+    # Returning:
+    return payload if isinstance(payload, dict) else None
+
+
+def __read_id_list(payload: dict) -> Optional[list[int]]:
+    """
+    The `ids` list of a payload, None unless it is a list of integers (JSON booleans, numeric
+    strings and floats are rejected rather than coerced).
+    """
+
+    # Validating ids:
+    id_list: Any = payload.get("ids", [])
+    if not isinstance(id_list, list) or not all(type(item_id) is int for item_id in id_list):
+        return None
+
+    # Returning:
+    return id_list
+
+
+def __projected_columns() -> tuple:
+    """
+    Columns selected for the request: the core ones plus the groups listed in `?include=`,
+    aborting with 400 on an unknown group.
+    """
+
+    # Adding requested groups:
+    column_list: list = list(API_CORE_COLUMNS)
+    for group_name in filter(None, request.args.get("include", "").split(",")):
+        if group_name not in API_OPTIONAL_COLUMNS:
+            abort(__json_response({"error": f"Unknown include '{group_name}', expected one of {sorted(API_OPTIONAL_COLUMNS)}"}, status = 400))
+        column_list.extend(API_OPTIONAL_COLUMNS[group_name])
+
+    # Returning:
+    return tuple(column_list)
+
+
+def __serialize_row(word_row, column_list: tuple) -> dict[str, Any]:
+    """
+    Converts a projected row into a JSON object keyed by lowercase column name, with the
+    learner's buffered status changes applied.
+    """
+
+    # Serializing columns:
+    word_entry: dict[str, Any] = {
+        column.key.lower(): value
+        for column, value in zip(column_list, word_row)
+        }
+
+    # Replacing stored statuses by buffered ones:
+    for status_name, status_value in g.pending_state.get(word_entry["index"], {}).items():
+        word_entry[status.STATUS_COLUMNS[status_name].key.lower()] = status_value
+
+    # Returning:
+    return word_entry
+
+
+def __query_words(column_list: tuple):
+    """
+    Starts a words query over the projected columns, joined with the requesting learner's state.
+    """
+
+    # Returning:
+    return status.join_state(
+        query = DATABASE.session.query(*column_list).select_from(Word),
+        user_id = users.current_user_id()
+        )
+
+
+def __load_words(word_index_list: list[int], column_list: tuple) -> list[dict]:
+    """
+    Loads entries by Pealim index with a single `IN` query, in the order of the given indexes.
+    Unknown indexes are left out.
+    """
+
+    # Querying entries:
+    word_rows = __query_words(column_list = column_list)\
+        .filter(Word.INDEX.in_(word_index_list))\
+        .all()
+    word_map: dict[int, dict] = {
+        word_row.INDEX: __serialize_row(word_row = word_row, column_list = column_list)
+        for word_row in word_rows
+        }
+
+    # Returning:
+    return [word_map[word_index] for word_index in word_index_list if word_index in word_map]
+
+
+def __read_limit() -> int:
+    """
+    Reads `?limit=`, clamped to `1..API_LIMIT_MAX`.
+    """
+
+    # Returning:
+    return max(1, min(request.args.get("limit", API_LIMIT_DEFAULT, type = int), API_LIMIT_MAX))
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROUTING AND LOGIC BLOCK
+
+"""
+
+
+@API_BLUEPRINT.before_request
+def read_pending_statuses() -> None:
+    """
+    Copies the learner's buffered status changes before anything is read, so serialized entries
+    carry them without flushing the buffer (which keeps merging writes).
+    """
+
+    # Copying buffered values:
+    g.pending_state = status.STATUS_WRITE_BUFFER.pending_state(user_id = users.current_user_id())
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_WORD_URL, methods = ["GET"])
+def api_word(word_index: int) -> Response:
+    """
+    Return a single entry by Pealim index.
+    """
+
+    # Querying entry:
+    column_list: tuple = __projected_columns()
+    word_list: list[dict] = __load_words(word_index_list = [word_index], column_list = column_list)
+    if not word_list:
+        return __json_response({"error": "Word not found"}, status = 404)
+
+    # Returning:
+    return __json_response(word_list[0])
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_WORDS_URL, methods = ["GET"])
+def api_words() -> Response:
+    """
+    Return entries in one of two ways:
+    - `?ids=3,7,12`: batch lookup of up to `API_BATCH_MAX` indexes in one query, in request order;
+    - `?after=<index>&limit=<n>`: listing in index order, resuming after the given index (keyset
+      pagination, so every page costs the same). `next` holds the cursor of the following page.
+    """
+
+    # Batch lookup:
+    column_list: tuple = __projected_columns()
+    ids_argument: Optional[str] = request.args.get("ids")
+    if ids_argument is not None:
+        try:
+            word_index_list: list[int] = list(dict.fromkeys(
+                int(word_index) for word_index in ids_argument.split(",") if word_index.strip()
+                ))
+        except ValueError:
+            return __json_response({"error": "ids must be comma-separated integers"}, status = 400)
+        if len(word_index_list) > API_BATCH_MAX:
+            return __json_response({"error": f"At most {API_BATCH_MAX} ids per request"}, status = 400)
+        return __json_response({
+            "words": __load_words(word_index_list = word_index_list, column_list = column_list),
+            })
+
+    # Keyset listing:
+    limit: int = __read_limit()
+    after_index: int = request.args.get("after", -1, type = int)
+    word_rows = __query_words(column_list = column_list)\
+        .filter(Word.INDEX > after_index)\
+        .order_by(Word.INDEX)\
+        .limit(limit)\
+        .all()
+
+    # Returning:
+    return __json_response({
+        "words": [__serialize_row(word_row = word_row, column_list = column_list) for word_row in word_rows],
+        "next": word_rows[-1].INDEX if len(word_rows) == limit else None,
+        })
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_SEARCH_URL, methods = ["GET"])
+def api_search() -> Response:
+    """
+    Return a page of full-text search results (`?q=<query>&page=<n>&limit=<n>`), ranked as on
+    the search page, with the same projection as the words endpoints.
+    """
+
+    # Searching:
+    query_text: str = request.args.get("q", "").strip()
+    page: int = max(1, request.args.get("page", 1, type = int))
+    limit: int = __read_limit()
+    search_results, search_total = search_engine.search_page(
+        query_text = query_text,
+        page = page,
+        per_page = limit
+        )
+
+    # Loading matched entries in rank order:
+    word_list: list[dict] = __load_words(
+        word_index_list = [search_result.INDEX for search_result in search_results],
+        column_list = __projected_columns()
+        ) if search_results else []
+
+    # Returning:
+    return __json_response({
+        "query": query_text,
+        "page": page,
+        "total": search_total,
+        "words": word_list,
+        })
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_WORD_STATUS_URL, methods = ["POST"])
+def api_word_status(word_index: int, status_name: str) -> Response:
+    """
+    Set (`{"value": true}`) or, without a body, toggle a status of one word (`favourite`,
+    `to_learn` or `known`) for the requesting learner, who is created on their first change.
+    The change is buffered and written together with other changes made within
+    `status.STATUS_FLUSH_DELAY`; the response already carries the new value.
+    """
+
+    # Validating status and word:
+    if status_name not in status.STATUS_COLUMNS:
+        return __json_response({"error": f"Unknown status '{status_name}'"}, status = 404)
+    if not DATABASE.session.query(Word.ID).filter(Word.INDEX == word_index).first():
+        return __json_response({"error": "Word not found"}, status = 404)
+    user_id: int = users.current_user_id(create = True)
+
+    # Toggling, or setting an explicit value:
+    payload: Optional[dict] = __read_payload()
+    if payload is None:
+        return __json_response({"error": "Body must be a JSON object"}, status = 400)
+    if "value" in payload:
+        if not isinstance(payload["value"], bool):
+            return __json_response({"error": "value must be true or false"}, status = 400)
+        status_value: Optional[bool] = payload["value"]
+        status.STATUS_WRITE_BUFFER.set(user_id = user_id, word_index = word_index, status = status_name, value = status_value)
+    else:
+        status_value: Optional[bool] = status.STATUS_WRITE_BUFFER.toggle(user_id = user_id, word_index = word_index, status = status_name)
+        if status_value is None:
+            return __json_response({"error": "Word not found"}, status = 404)
+
+    # Returning:
+    return __json_response({
+        "index": word_index,
+        "status": status_name,
+        "value": status_value,
+        })
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_STATUS_URL, methods = ["POST"])
+def api_status() -> Response:
+    """
+    Set a status of many words at once for the requesting learner, with a single statement over
+    `… WHERE INDEX IN (…)`. The body
+    names the status, the value and either the words (`{"ids": [3, 7]}`) or a search query whose
+    matches are changed (`{"query": "write"}`, up to `status.STATUS_BULK_MAX` of them):
+
+        {"status": "known", "value": true, "query": "write"}
+    """
+
+    # Validating payload:
+    payload: Optional[dict] = __read_payload()
+    if payload is None:
+        return __json_response({"error": "Body must be a JSON object"}, status = 400)
+    status_name: Any = payload.get("status", "")
+    if not isinstance(status_name, str) or status_name not in status.STATUS_COLUMNS:
+        return __json_response({"error": f"Unknown status '{status_name}'"}, status = 400)
+    status_value: Any = payload.get("value", True)
+    if not isinstance(status_value, bool):
+        return __json_response({"error": "value must be true or false"}, status = 400)
+
+    # Resolving words from ids or a search query:
+    if "query" in payload:
+        if not isinstance(payload["query"], str):
+            return __json_response({"error": "query must be a string"}, status = 400)
+        search_results, _ = search_engine.search_page(
+            query_text = payload["query"],
+            page = 1,
+            per_page = status.STATUS_BULK_MAX
+            )
+        word_index_list: list[int] = [search_result.INDEX for search_result in search_results]
+    else:
+        word_index_list: Optional[list[int]] = __read_id_list(payload)
+        if word_index_list is None:
+            return __json_response({"error": "ids must be a list of integers"}, status = 400)
+        if len(word_index_list) > status.STATUS_BULK_MAX:
+            return __json_response({"error": f"At most {status.STATUS_BULK_MAX} ids per request"}, status = 400)
+
+    # Writing buffered toggles first, then the bulk change:
+    status.STATUS_WRITE_BUFFER.flush()
+    changed_set: set[tuple[int, int]] = status.apply_statuses(change_list = [
+        (users.current_user_id(create = True), status_name, status_value, word_index_list),
+        ]) if word_index_list else set()
+
+    # Returning:
+    return __json_response({
+        "status": status_name,
+        "value": status_value,
+        "matched": len(word_index_list),
+        "changed": len(changed_set),
+        })
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_REVIEWS_DUE_URL, methods = ["GET"])
+def api_reviews_due() -> Response:
+    """
+    Return the requesting learner's due review cards, most overdue first (`?limit=<n>`), with
+    the due and total card counts (both capped at `srs.SRS_COUNT_MAX`). The queue is one range
+    read of the due index.
+    """
+
+    # Reading due cards:
+    user_id: Optional[int] = users.current_user_id()
+    card_list: list[dict] = srs.read_due_cards(user_id = user_id, limit = __read_limit())
+
+    # Returning:
+    return __json_response({
+        **srs.count_due_cards(user_id = user_id),
+        "cards": card_list,
+        })
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_REVIEWS_URL, methods = ["POST"])
+def api_reviews() -> Response:
+    """
+    Add review cards for the requesting learner, due now. The body either names the items
+    (`{"kind": "word", "ids": [3, 7]}`, kinds `word` and `input`) or, without ids, asks for up
+    to `srs.SRS_NEW_CARDS` new cards from the "to learn" words and practice entries. Cards the
+    learner already has keep their schedule.
+    """
+
+    # Validating payload:
+    payload: Optional[dict] = __read_payload()
+    if payload is None:
+        return __json_response({"error": "Body must be a JSON object"}, status = 400)
+    user_id: int = users.current_user_id(create = True)
+    if "ids" not in payload:
+        status.STATUS_WRITE_BUFFER.flush()
+        return __json_response({"added": srs.add_new_cards(user_id = user_id)})
+    item_kind: Any = payload.get("kind", srs.SRS_KIND_WORD)
+    if not isinstance(item_kind, str) or item_kind not in srs.SRS_KIND_COLUMNS:
+        return __json_response({"error": f"Unknown kind '{item_kind}'"}, status = 400)
+    item_id_list: Optional[list[int]] = __read_id_list(payload)
+    if item_id_list is None:
+        return __json_response({"error": "ids must be a list of integers"}, status = 400)
+    if len(item_id_list) > API_BATCH_MAX:
+        return __json_response({"error": f"At most {API_BATCH_MAX} ids per request"}, status = 400)
+
+    # Returning:
+    return __json_response({
+        "added": srs.add_cards(user_id = user_id, item_kind = item_kind, item_id_list = item_id_list) if item_id_list else 0,
+        })
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@API_BLUEPRINT.route(rule = API_REVIEW_URL, methods = ["POST"])
+def api_review(item_kind: str, item_id: int) -> Response:
+    """
+    Grade one review card of the requesting learner (`{"grade": "good"}`, one of `again`,
+    `hard`, `good` and `easy`) and return its new schedule.
+    """
+
+    # Validating card and answer:
+    payload: Optional[dict] = __read_payload()
+    if payload is None:
+        return __json_response({"error": "Body must be a JSON object"}, status = 400)
+    grade: Any = payload.get("grade", "")
+    if item_kind not in srs.SRS_KIND_COLUMNS:
+        return __json_response({"error": f"Unknown kind '{item_kind}'"}, status = 404)
+    if not isinstance(grade, str) or grade not in srs.SRS_GRADES:
+        return __json_response({"error": f"Unknown grade '{grade}', expected one of {list(srs.SRS_GRADES)}"}, status = 400)
+
+    # Rescheduling:
+    schedule: Optional[dict] = srs.grade_card(
+        user_id = users.current_user_id(),
+        item_kind = item_kind,
+        item_id = item_id,
+        grade = grade
+        )
+    if schedule is None:
+        return __json_response({"error": "Card not found"}, status = 404)
+
+    # Returning:
+    return __json_response({"kind": item_kind, "id": item_id, **schedule})
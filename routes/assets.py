@@ -0,0 +1,81 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# System-management libraries:
+import os
+import mimetypes
+
+# Flask-related imports:
+from flask import abort, Blueprint, request, Response, send_from_directory
+
+# Settings import:
+from configuration import SETTINGS
+
+# Assets import:
+from utilities import assets
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BLUEPRINT AND VARIABLES BLOCK
+
+"""
+
+
+# Generating blueprint:
+ASSETS_BLUEPRINT: Blueprint = Blueprint(
+    name = "assets",
+    import_name = __name__,
+    )
+
+# Getting constants (more specific than Flask's `/static/<path:filename>`, so it takes precedence):
+ASSETS_URL: str = f"/static/{assets.ASSET_BUILD_PREFIX}/<path:filename>"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROUTING AND LOGIC BLOCK
+
+"""
+
+
+@ASSETS_BLUEPRINT.route(rule = ASSETS_URL, methods = ["GET"])
+def fingerprinted_asset(filename: str) -> Response:
+    """
+    Serve a fingerprinted asset, picking the smallest precompressed variant the client accepts.
+    The name changes with the content, so responses are cacheable forever and browsers never
+    revalidate them.
+    """
+
+    # Rejecting manifest and compressed variants requested directly:
+    if filename.endswith((".json", ".gz", ".br")):
+        abort(404)
+
+    # Choosing precompressed variant:
+    served_filename: str = filename
+    content_encoding: str = ""
+    for encoding, encoding_suffix in assets.ASSET_ENCODINGS:
+        if encoding in request.accept_encodings and os.path.exists(os.path.join(SETTINGS.FOLDER_BUILD_PATH, filename + encoding_suffix)):
+            served_filename, content_encoding = filename + encoding_suffix, encoding
+            break
+
+    # Sending file with the original type:
+    response: Response = send_from_directory(
+        directory = SETTINGS.FOLDER_BUILD_PATH,
+        path = served_filename,
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        max_age = assets.ASSET_MAX_AGE,
+        conditional = False,
+        etag = False
+        )
+
+    # Marking response as immutable:
+    if content_encoding:
+        response.headers["Content-Encoding"] = content_encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+
+    # Returning:
+    return response
@@ -14,7 +14,7 @@ from configuration import SETTINGS
 
 # Database and related import:
 from utilities.database import DATABASE
-from utilities import convert, verification
+from utilities import assets, convert, fonts, srs, statistics, users, verification
 
 
 
@@ -72,6 +72,7 @@ def database() -> str:
                     # Delete all entries from words table
                     from utilities.database.models.word import Word
                     deleted_count = Word.query.delete()
+                    statistics.increment_statistic(statistics.STATISTIC_WORDS, -deleted_count)
                     DATABASE.session.commit()
                     log.info(f"Deleted {deleted_count} entries from database")
                     
@@ -80,6 +81,13 @@ def database() -> str:
                          json_filepath = SETTINGS.JSON_COLLECTION_FILEPATH
                          )
                     rebuild_entry_count = converter.run()  # This should return the number of entries added
+
+                    # Dropping review cards of entries that are gone:
+                    srs.remove_orphan_cards()
+
+                    # Subsetting fonts to the new content and fingerprinting them:
+                    fonts.build_fonts()
+                    assets.build_assets()
                     
                     # Update verification data:
                     verification.verify_data()
@@ -95,6 +103,9 @@ def database() -> str:
                     log.error(f"Database rebuild failed: {exception_error}")
     
 
+    # Reading materialised counters:
+    statistic_map: dict[str, int] = statistics.read_statistics()
+
     # Preparing template context from session data:
     context: dict[str, Any] = {
         'json_status': verification.status_json(),
@@ -102,7 +113,10 @@ def database() -> str:
         'database_status': verification.status_database(),
         'database_count': session.get('DATABASE_ENTRY_COUNT', 0) or 0,
         'rebuild_success': rebuild_success,
-        'rebuild_count': rebuild_entry_count
+        'rebuild_count': rebuild_entry_count,
+        'pos_counts': statistics.group_statistics(statistic_map, statistics.STATISTIC_POS_PREFIX),
+        'status_counts': statistics.read_status_statistics(user_id = users.current_user_id()),
+        'input_count': statistic_map.get(statistics.STATISTIC_INPUTS, 0),
         }
 
     # Generating page routing:
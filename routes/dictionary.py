@@ -6,6 +6,8 @@ from typing import Any
 from configuration import SETTINGS
 from utilities.database import DATABASE
 from utilities.database.models.word import Word
+from utilities.cache import VersionedCache
+from utilities import paginate, status, users
 
 
 """
@@ -28,6 +30,12 @@ DICTIONARY_PAGE_URL: str = "/dictionary"
 DICTIONARY_PAGE_HTML: str = "dictionary.html"
 WORDS_PER_PAGE: int = 100
 
+# Per-process page boundaries, rebuilt on dictionary version change:
+WORD_PAGE_BOUNDARY_CACHE = VersionedCache(
+    name = "word page boundaries",
+    loader = lambda: paginate.build_page_boundaries(key_column = Word.INDEX, per_page = WORDS_PER_PAGE)
+    )
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -39,7 +47,7 @@ ROUTING AND LOGIC BLOCK
 @DICTIONARY_BLUEPRINT.route(rule = DICTIONARY_PAGE_URL, methods = ["GET"])
 def dictionary() -> str:
     """
-    Display dictionary words with pagination.
+    Display dictionary words with pagination, with the learner's statuses joined in.
     """
 
     # Checking database status:
@@ -51,19 +59,30 @@ def dictionary() -> str:
     # Getting page number from query parameters, default to 1
     page = request.args.get('page', 1, type = int)
     
-    # Calculate pagination
-    total_words = DATABASE.session.query(Word).count()
-    total_pages = (total_words + WORDS_PER_PAGE - 1) // WORDS_PER_PAGE      # <- Ceiling division
+    # Calculate pagination from cached page boundaries:
+    boundary_index: paginate.PageBoundaryIndex = WORD_PAGE_BOUNDARY_CACHE.get()
+    total_words: int = boundary_index.total_count
+    total_pages: int = boundary_index.total_pages
     
     # Ensure page is within valid range
-    page: int = max(1, min(page, total_pages))
+    page: int = boundary_index.clamp(page)
     
-    # Get words for current page
-    word_entry_list = DATABASE.session.query(Word)\
-        .order_by(Word.INDEX)\
-        .offset((page - 1) * WORDS_PER_PAGE)\
-        .limit(WORDS_PER_PAGE)\
-        .all()
+    # Get words for current page (seeking to its first index instead of skipping rows), with
+    # buffered status changes applied:
+    user_id = users.current_user_id()
+    pending_state: dict[int, dict[str, bool]] = status.STATUS_WRITE_BUFFER.pending_state(user_id = user_id)
+    word_entry_list = [
+        (word, *status.merge_pending(pending_state = pending_state, word_index = word.INDEX, flags = flags))
+        for word, *flags in paginate.seek_page(
+            query = status.join_state(
+                query = DATABASE.session.query(Word, *status.state_columns()),
+                user_id = user_id
+                ),
+            key_column = Word.INDEX,
+            boundary_index = boundary_index,
+            page = page
+            )
+        ]
     
     # Preparing pagination data:
     pagination = {
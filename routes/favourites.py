@@ -1,9 +1,14 @@
 # Flask-related imports:
 from flask import Blueprint
-from flask import render_template, redirect, request, session
+from flask import abort, render_template, redirect, request, session
+from typing import Any
 
-# Settings import:
+# Settings and database imports:
 from configuration import SETTINGS
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities.database.models.state import UserWordState
+from utilities import statistics, status, users
 
 
 """
@@ -23,6 +28,14 @@ FAVOURITES_BLUEPRINT: Blueprint = Blueprint(
 # Getting constants:
 FAVOURITES_PAGE_URL: str = "/favourites"
 FAVOURITES_PAGE_HTML: str = "favourites.html"
+FAVOURITES_PER_PAGE: int = 60
+
+# Status tabs of the page, in display order:
+FAVOURITES_TABS: dict[str, str] = {
+    "favourite": "Favourites",
+    "to_learn": "To learn",
+    "known": "Known",
+    }
 
 
 """
@@ -34,11 +47,62 @@ ROUTING AND LOGIC BLOCK
 
 @FAVOURITES_BLUEPRINT.route(rule = FAVOURITES_PAGE_URL)
 def favourites() -> str:
+    """
+    Display the learner's words with a status (`?status=favourite`, `to_learn` or `known`), in
+    index order and one page at a time (`?after=<index>`). The filter and order match the
+    covering partial index of the status, so a page reads only the learner's flagged rows and
+    one words row per entry; tab counts come from the statistics.
+    """
+
+    # Getting status tab and page cursor:
+    status_name: str = request.args.get("status", "favourite")
+    if status_name not in FAVOURITES_TABS:
+        abort(404, description = "Unknown status")
+    after_index: int = request.args.get("after", -1, type = int)
+
+    # Writing buffered toggles before reading:
+    user_id = users.current_user_id()
+    status.STATUS_WRITE_BUFFER.flush()
+
+    # Querying one page of flagged words (one extra row tells if there is a next page):
+    word_entry_list: list = DATABASE.session.query(
+        UserWordState.INDEX,
+        Word.TRANSLATION_LANG_HE,
+        Word.TRANSLATION_LANG_EN,
+        Word.TRANSLATION_LANG_RU,
+        *status.STATUS_COLUMNS.values(),
+        )\
+        .join(Word, Word.INDEX == UserWordState.INDEX)\
+        .filter(
+            UserWordState.USER_ID == user_id,
+            status.STATUS_COLUMNS[status_name] == True,
+            UserWordState.INDEX > after_index
+            )\
+        .order_by(UserWordState.INDEX)\
+        .limit(FAVOURITES_PER_PAGE + 1)\
+        .all() if user_id is not None else []
+    has_next: bool = len(word_entry_list) > FAVOURITES_PER_PAGE
+    word_entry_list = word_entry_list[:FAVOURITES_PER_PAGE]
+
+    # Reading tab counts:
+    status_counts: dict[str, int] = statistics.read_status_statistics(user_id = user_id)
+
+    # Prepare template context
+    context: dict[str, Any] = {
+        'words': word_entry_list,
+        'language': session.get("LANG_USED", "en"),
+        'status_name': status_name,
+        'status_tabs': FAVOURITES_TABS,
+        'status_counts': status_counts,
+        'is_first_page': after_index < 0,
+        'next_after': word_entry_list[-1].INDEX if has_next else None,
+        }
 
     # Getting route page rendered:
     page_route: str = render_template(
-        template_name_or_list = FAVOURITES_PAGE_HTML
+        template_name_or_list = FAVOURITES_PAGE_HTML,
+        **context
         )
     
     # Returning:
-    return page_route
\ No newline at end of file
+    return page_route
@@ -1,11 +1,14 @@
 # Flask-related imports:
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, abort, render_template, request, redirect, url_for, flash
 from typing import Any
+from sqlalchemy import func
 
 # Settings and database imports:
 from configuration import SETTINGS
 from utilities.database import DATABASE
 from utilities.database.models.input import Input
+from utilities.cache import VersionedCache
+from utilities import paginate, srs, statistics, status, users
 
 
 """
@@ -25,9 +28,29 @@ PRACTICE_BLUEPRINT: Blueprint = Blueprint(
 # Constants:
 PRACTICE_PAGE_URL: str = "/practice"
 PRACTICE_PAGE_HTML: str = "practice.html"
+PRACTICE_REVIEW_URL: str = "/practice/review"
+PRACTICE_REVIEW_HTML: str = "review.html"
 WORDS_PER_PAGE: int = 100
 
 
+def __read_input_version() -> int:
+    """
+    Inputs are only ever appended, so the largest ID (a single rowid lookup) changes with every
+    write and serves as the version stamp of the input page boundaries.
+    """
+
+    # Returning:
+    return DATABASE.session.query(func.max(Input.ID)).scalar() or 0
+
+
+# Per-process page boundaries, rebuilt whenever an input is added:
+INPUT_PAGE_BOUNDARY_CACHE = VersionedCache(
+    name = "input page boundaries",
+    loader = lambda: paginate.build_page_boundaries(key_column = Input.ID, per_page = WORDS_PER_PAGE),
+    version_reader = __read_input_version
+    )
+
+
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 ROUTING AND LOGIC BLOCK
@@ -43,20 +66,20 @@ def practice() -> str:
     # Getting page number from query parameters, default = 1:
     page: int = request.args.get("page", 1, type=int)
 
-    # Counting all Input entries:
-    total_inputs: int = DATABASE.session.query(Input).count()
-    total_pages: int = (total_inputs + WORDS_PER_PAGE - 1) // WORDS_PER_PAGE  # Ceiling division
+    # Counting all Input entries from cached page boundaries:
+    boundary_index: paginate.PageBoundaryIndex = INPUT_PAGE_BOUNDARY_CACHE.get()
+    total_inputs: int = boundary_index.total_count
+    total_pages: int = boundary_index.total_pages
 
     # Ensuring page is valid:
-    page = max(1, min(page, total_pages if total_pages else 1))
-
-    # Query subset of inputs for the current page:
-    input_list = (
-        DATABASE.session.query(Input)
-        .order_by(Input.ID)
-        .offset((page - 1) * WORDS_PER_PAGE)
-        .limit(WORDS_PER_PAGE)
-        .all()
+    page = boundary_index.clamp(page)
+
+    # Query subset of inputs for the current page (seeking to its first ID):
+    input_list = paginate.seek_page(
+        query = DATABASE.session.query(Input),
+        key_column = Input.ID,
+        boundary_index = boundary_index,
+        page = page
         )
 
     # Preparing pagination data:
@@ -118,8 +141,9 @@ def add_word() -> Any:
         INF_RU = inf_ru,
         )
 
-    # Add and commit to database
+    # Add and commit to database, together with the inputs counter:
     DATABASE.session.add(new_entry)
+    statistics.increment_statistic(statistics.STATISTIC_INPUTS)
     DATABASE.session.commit()
 
     # Generating page route:
@@ -148,3 +172,70 @@ def practice_detail(id: int) -> str:
 
     # Render detail page (you can later create practice_detail.html)
     return render_template("practice/practice_detail.html", entry=input_entry)
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@PRACTICE_BLUEPRINT.route(rule = PRACTICE_REVIEW_URL, methods = ["GET"])
+def review() -> str:
+    """
+    Displays the learner's due review cards (words and practice entries), most overdue first,
+    with their answer buttons. The queue is one range read of the due index (see `utilities.srs`).
+    """
+
+    # Reading due cards:
+    user_id = users.current_user_id()
+    card_list: list[dict[str, Any]] = srs.read_due_cards(user_id = user_id, limit = srs.SRS_SESSION_SIZE)
+
+    # Template context:
+    context: dict[str, Any] = {
+        "cards": card_list,
+        "card_counts": srs.count_due_cards(user_id = user_id),
+        "count_max": srs.SRS_COUNT_MAX,
+        "grades": srs.SRS_GRADES,
+        }
+
+    # Returning:
+    return render_template(PRACTICE_REVIEW_HTML, **context)
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@PRACTICE_BLUEPRINT.route(rule = f"{PRACTICE_REVIEW_URL}/add", methods = ["POST"])
+def review_add() -> Any:
+    """
+    Adds new cards to the learner's review queue: words marked "to learn", then practice entries.
+    """
+
+    # Writing buffered toggles, so fresh "to learn" marks are included:
+    status.STATUS_WRITE_BUFFER.flush()
+
+    # Adding cards:
+    srs.add_new_cards(user_id = users.current_user_id(create = True))
+
+    # Returning:
+    return redirect(url_for("practice.review"))
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@PRACTICE_BLUEPRINT.route(rule = f"{PRACTICE_REVIEW_URL}/<item_kind>/<int:item_id>", methods = ["POST"])
+def review_grade(item_kind: str, item_id: int) -> Any:
+    """
+    Grades one card (form field `grade`: `again`, `hard`, `good` or `easy`) and reschedules it.
+    """
+
+    # Validating answer:
+    grade: str = request.form.get("grade", "")
+    if item_kind not in srs.SRS_KIND_COLUMNS or grade not in srs.SRS_GRADES:
+        abort(400, description = "Unknown card kind or grade")
+
+    # Rescheduling:
+    if srs.grade_card(user_id = users.current_user_id(), item_kind = item_kind, item_id = item_id, grade = grade) is None:
+        abort(404, description = "Card not found")
+
+    # Returning:
+    return redirect(url_for("practice.review"))
@@ -4,17 +4,14 @@ log = logging.getLogger(__name__)
 
 # Flask-related imports:
 from flask import Blueprint
-from flask import redirect, render_template, session, url_for
-
-# Random import:
-from random import randint
+from flask import redirect, request, session, url_for
 
 # Settings import:
 from configuration import SETTINGS
 
-# Database-related import:
-from utilities.database import DATABASE
-from utilities.database.models.word import Word
+# Sampling-related import:
+from utilities.cache import VersionedCache
+from utilities import sampling, users
 
 
 """
@@ -35,6 +32,12 @@ RANDOM_BLUEPRINT: Blueprint = Blueprint(
 RANDOM_PAGE_URL: str = "/random"
 RANDOM_PAGE_HTML: str = "random.html"
 
+# Per-process sampling arrays, rebuilt on dictionary version change:
+RANDOM_POOL_CACHE = VersionedCache(
+    name = "random word pools",
+    loader = sampling.build_word_pools
+    )
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -46,41 +49,31 @@ ROUTING AND LOGIC BLOCK
 @RANDOM_BLUEPRINT.route(RANDOM_PAGE_URL)
 def random():
     """
-    Redirects to a random word entry.
+    Redirects to a random word entry, optionally filtered by part of speech (`?pos=Verb`) and
+    the learner's status (`?status=favourite`, `to_learn` or `not_known`). A filter without
+    matches falls back to the whole dictionary.
     """
 
-    # Checking database entry count:
-    database_attached: bool = session.get('DATABASE_ATTACHED', False)
-    database_entry_count: int = session.get('DATABASE_ENTRY_COUNT', 0)
-    
-    # Rerouting to /database on empty database check:
-    if not database_attached or database_entry_count == 0:
-
-        # Veryfiying data:
-        from utilities import verification
-        verification.verify_data()
-
-        # Checking database entry count:
-        database_attached: bool = session.get('DATABASE_ATTACHED', False)
-        database_entry_count: int = session.get('DATABASE_ENTRY_COUNT', 0)
-
-        # Rerouting to /database on empty database check:
-        if not database_attached or database_entry_count == 0:
-            log.warning("Random page requested, but database not attached or empty")
-            page_route: str = render_template(
-                template_name_or_list = "database.html",
-                )
-            return page_route
-
-    # Random offset selection:
-    random_index: int = randint(0, database_entry_count - 1)
-    random_word: Word = DATABASE.session.query(Word).offset(random_index).first()
-    
-    # Rerouting to /database on bad query:
-    if not random_word:
-        log.error("Random word query returned None.")
-        page_route: str = render_template(
-            template_name_or_list = "database.html",
+    # Getting filters:
+    part_of_speech: str = request.args.get("pos", "").strip()
+    status_filter: str = request.args.get("status", "").strip()
+
+    # Drawing from precomputed arrays:
+    word_pool: sampling.WordPool = RANDOM_POOL_CACHE.get()
+    random_word_index = word_pool.pick(
+        part_of_speech = part_of_speech,
+        user_id = users.current_user_id(),
+        status_filter = status_filter
+        )
+    if random_word_index is None and (part_of_speech or status_filter):
+        log.info(f"No random word for filters pos='{part_of_speech}', status='{status_filter}', ignoring them")
+        random_word_index = word_pool.pick()
+
+    # Rerouting to /database on empty database:
+    if random_word_index is None:
+        log.warning("Random page requested, but database is empty")
+        page_route: str = redirect(
+            url_for(endpoint = "database.database")
             )
         return page_route
     
@@ -92,10 +85,9 @@ def random():
         url_for(
             endpoint = "word.word_detail",
             language = language_used,
-            word_index = random_word.INDEX
+            word_index = random_word_index
             )
         )
 
     # Returning:
     return page_route
-
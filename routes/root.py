@@ -0,0 +1,89 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Flask-related imports:
+from flask import abort, Blueprint, render_template, session
+from typing import Optional
+
+# Settings import:
+from configuration import SETTINGS
+
+# Database-related import:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities.database.models.root import Root
+from utilities import hebrew
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+BLUEPRINT AND VARIABLES BLOCK
+
+"""
+
+
+# Generating blueprint:
+ROOT_BLUEPRINT: Blueprint = Blueprint(
+    name = "root",
+    import_name = __name__,
+    template_folder = SETTINGS.FOLDER_TEMPLATES_PATH,
+    static_folder = SETTINGS.FOLDER_STATIC_PATH,
+    )
+
+# Getting constants:
+ROOT_PAGE_URL: str = "/root/<root>"
+ROOT_PAGE_HTML: str = "root.html"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROUTING AND LOGIC BLOCK
+
+"""
+
+
+@ROOT_BLUEPRINT.route(rule = ROOT_PAGE_URL, methods = ["GET"])
+def root_family(root: str) -> str:
+    """
+    Display every word sharing a root. Accepts the root in any notation (`כ-ת-ב`, `כתב`), the
+    family is read with a single indexed query on `Word.ROOT_LANG_HE`.
+    """
+
+    # Normalizing root:
+    root_key: Optional[str] = hebrew.normalize_root(text = root)
+    if not root_key:
+        abort(404, description = "Root not found")
+
+    # Getting precomputed family size:
+    family_size: Optional[int] = DATABASE.session.query(Root.WORD_COUNT)\
+        .filter(Root.ROOT_LANG_HE == root_key)\
+        .scalar()
+    if not family_size:
+        abort(404, description = "Root not found")
+
+    # Getting family members (card columns only, no HTML containers):
+    family_words: list = DATABASE.session.query(
+        Word.INDEX,
+        Word.TRANSLATION_LANG_HE,
+        Word.TRANSLATION_LANG_EN,
+        Word.TRANSLATION_LANG_RU,
+        )\
+        .filter(Word.ROOT_LANG_HE == root_key)\
+        .order_by(Word.INDEX)\
+        .all()
+
+    # Logging:
+    log.info(f"Root '{root_key}' family holds {family_size} words")
+
+    # Page routing:
+    page_route: str = render_template(
+        template_name_or_list = ROOT_PAGE_HTML,
+        root = root_key,
+        family_size = family_size,
+        results = family_words,
+        language = session.get("LANG_USED", "en"),
+        )
+
+    # Returning:
+    return page_route
@@ -4,15 +4,15 @@ log = logging.getLogger(__name__)
 
 # Flask-related imports:
 from flask import Blueprint
-from flask import render_template, redirect, request, session
-from sqlalchemy import func
+from flask import jsonify, render_template, redirect, request, session
 
 # Settings import:
 from configuration import SETTINGS
 
 # Database-related import:
 from utilities.database import DATABASE
-from utilities.database.models.word import Word
+from utilities.search import SEARCH_RESULTS_PER_PAGE, detect_language, search_page
+from utilities import fuzzy, status, suggest, users
 
 
 """
@@ -33,6 +33,7 @@ SEARCH_BLUEPRINT: Blueprint = Blueprint(
 # Getting constants:
 SEARCH_PAGE_URL: str = "/"
 SEARCH_PAGE_HTML: str = "search.html"
+SEARCH_SUGGEST_URL: str = "/suggest"
 
 
 """
@@ -45,11 +46,12 @@ ROUTING AND LOGIC BLOCK
 @SEARCH_BLUEPRINT.route("/", methods = ["GET"])
 def search():
     """
-    TODO: Create a docstring.
+    Display a ranked, paginated page of words matching the query in any language.
     """
 
-    # Getting query string:
+    # Getting query string and page number:
     query_input = request.args.get("query", "").strip()
+    page: int = request.args.get("page", 1, type = int)
     
     # Rendering empty results page if query is empty:
     if not query_input:
@@ -61,58 +63,96 @@ def search():
             )
         return page_route 
 
-    # Preparing search pattern for partial, case-insensitive match:
-    search_pattern = f"%{query_input.lower()}%"
-    search_results: list[str] = []
-    search_language: str = None
-
-    # Attempting to search:
+    # Searching all languages in a single pass:
+    search_results: list = []
+    search_total: int = 0
+    search_language: str = detect_language(query_text = query_input)
     try:
-        
-        # English language:
-        search_results = (
-            Word.query.filter(func.lower(Word.TRANSLATION_LANG_EN).like(search_pattern)).all()
+        user_id = users.current_user_id()
+        pending_state: dict[int, dict[str, bool]] = status.STATUS_WRITE_BUFFER.pending_state(user_id = user_id)
+        search_results, search_total = search_page(
+            query_text = query_input,
+            page = page,
+            user_id = user_id
             )
-        
-        print(search_pattern, search_results)
-        if search_results:
-            search_language = "en"
-            log.info(f"Found {len(search_results)} English results for '{query_input}'")
-
-        #  Russian language:
-        if not search_results:
-            search_results = (
-                Word.query.filter(func.lower(Word.TRANSLATION_LANG_RU).like(search_pattern)).all()
-                )
-            print(search_pattern, search_results)
-            if search_results:
-                search_language = "ru"
-                log.info(f"Found {len(search_results)} Russian results for '{query_input}'")
-
-        # Hebrew language:
-        if not search_results:
-            search_results = (
-                Word.query.filter(func.lower(Word.TRANSLATION_LANG_HE).like(search_pattern)).all()
-                )
-            print(search_pattern, search_results)
-            if search_results:
-                search_language = "he"
-                log.info(f"Found {len(search_results)} Hebrew results for '{query_input}'")
+
+        # Applying buffered status changes to the cards:
+        if pending_state:
+            search_results = [
+                status.merge_pending_row(pending_state = pending_state, word_row = search_result)
+                for search_result in search_results
+                ]
+        log.info(f"Found {search_total} results for '{query_input}'")
 
     # Handling exceptions and errors:
     except Exception as e:
         log.error(f"Search failed for '{query_input}': {e}")
-        search_results: list[str] = []
-        search_language: str | None = None
+        search_results: list = []
+        search_total: int = 0
+
+    # Suggesting spelling corrections if nothing was found:
+    search_suggestions: list[str] = []
+    if not search_total:
+        try:
+            search_suggestions = fuzzy.suggest(
+                query_text = query_input
+                )
+        except Exception as e:
+            log.error(f"Suggestions failed for '{query_input}': {e}")
+
+    # Preparing pagination data:
+    total_pages: int = (search_total + SEARCH_RESULTS_PER_PAGE - 1) // SEARCH_RESULTS_PER_PAGE
+    pagination = {
+        'current_page': page,
+        'total_pages':  total_pages,
+        'total_words':  search_total,
+        'has_prev':     page > 1,
+        'has_next':     page < total_pages,
+        'prev_page':    page - 1,
+        'next_page':    page + 1,
+        }
 
     # Page routing:
     page_route: str = render_template(
         "search.html",
         query=query_input,
         results=search_results,
-        language=search_language
+        language=search_language,
+        pagination=pagination,
+        suggestions=search_suggestions,
         )
     
     # Returning:
     return page_route
 
+
+# --------------------------------------------------------------------------------------------------
+
+
+@SEARCH_BLUEPRINT.route(SEARCH_SUGGEST_URL, methods = ["GET"])
+def search_suggest():
+    """
+    Return autocomplete suggestions for a typed prefix as JSON, served from the in-memory prefix
+    index (no database query per keystroke).
+    """
+
+    # Getting prefix and limit:
+    query_input: str = request.args.get("q", "").strip()
+    limit: int = request.args.get("limit", suggest.SUGGEST_LIMIT_DEFAULT, type = int)
+
+    # Looking up suggestions:
+    suggestion_list: list[dict] = []
+    try:
+        suggestion_list = suggest.suggest(
+            prefix = query_input,
+            limit = limit
+            )
+    except Exception as e:
+        log.error(f"Suggest failed for '{query_input}': {e}")
+
+    # Returning:
+    return jsonify(
+        query = query_input,
+        language = detect_language(query_text = query_input),
+        suggestions = suggestion_list
+        )
@@ -1,11 +1,16 @@
 # Flask-related imports:
-from flask import abort, Blueprint, render_template, session 
-from typing import Any
+from flask import abort, Blueprint, render_template, Response, session 
+from typing import Any, Optional
 
 # Settings and database imports:
 from configuration import SETTINGS
 from utilities.database import DATABASE
 from utilities.database.models.word import Word
+from utilities.database.models.link import Link
+from utilities.database.models.similar import Similar
+from utilities.database import scripts
+from utilities.cache import RenderCache
+from utilities import assets, paradigm, responses, status, users
 
 
 """
@@ -26,7 +31,85 @@ WORD_BLUEPRINT: Blueprint = Blueprint(
 # Getting constants:
 WORD_PAGE_URL: str = "/dictionary/<language>/<int:word_index>"
 WORD_PAGE_HTML: str = "word.html"
+WORD_FRAGMENT_URL: str = "/dictionary/<language>/<int:word_index>/content"
+WORD_FRAGMENT_HTML: str = "components/word_content.html"
+WORD_SECTION_URL: str = "/dictionary/<language>/<int:word_index>/sections/<int:section_index>"
+WORD_SECTION_HTML: str = "components/paradigm_group.html"
 SUPPORTED_LANGUAGES: set = {'ru', 'en', 'he'}
+LINKED_ENTRIES_MAX: int = 50
+
+# Per-process cache of rendered pages and fragments, grouped by word index:
+WORD_PAGE_CACHE_BYTES_MAX: int = 32 * 1024 * 1024
+WORD_PAGE_CACHE = RenderCache(
+    name = "word pages",
+    byte_limit = WORD_PAGE_CACHE_BYTES_MAX
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RELATED ENTRIES FUNCTIONS
+
+"""
+
+
+def __query_linked_entries(word_index: int, incoming: bool) -> list:
+    """
+    Reads entries linked from (or to) a word out of the precomputed `links` table, joined with
+    their translations. Links to entries missing from the dictionary are left out by the join.
+
+    :param int word_index: Pealim index of the word;
+    :param bool incoming: Entries linking to the word if True, entries it links to otherwise.
+
+    :return list: Rows with `INDEX`, translations and `LINK_TEXT`, `LINK_SECTION`.
+    """
+
+    # Choosing link direction:
+    own_column = Link.TARGET_INDEX if incoming else Link.SOURCE_INDEX
+    other_column = Link.SOURCE_INDEX if incoming else Link.TARGET_INDEX
+
+    # Querying linked entries:
+    linked_entries: list = DATABASE.session.query(
+        Word.INDEX,
+        Word.TRANSLATION_LANG_HE,
+        Word.TRANSLATION_LANG_EN,
+        Word.TRANSLATION_LANG_RU,
+        Link.LINK_TEXT,
+        Link.LINK_SECTION,
+        )\
+        .join(Word, Word.INDEX == other_column)\
+        .filter(own_column == word_index)\
+        .order_by(Link.ID)\
+        .limit(LINKED_ENTRIES_MAX)\
+        .all()
+
+    # Returning:
+    return linked_entries
+
+
+def __query_similar_entries(word_index: int) -> list:
+    """
+    Reads the precomputed neighbours of a word by translation similarity, best first.
+
+    :param int word_index: Pealim index of the word.
+    :return list: Rows with `INDEX`, translations and `SCORE`.
+    """
+
+    # Querying similar entries:
+    similar_entries: list = DATABASE.session.query(
+        Word.INDEX,
+        Word.TRANSLATION_LANG_HE,
+        Word.TRANSLATION_LANG_EN,
+        Word.TRANSLATION_LANG_RU,
+        Similar.SCORE,
+        )\
+        .join(Word, Word.INDEX == Similar.SIMILAR_INDEX)\
+        .filter(Similar.INDEX == word_index)\
+        .order_by(Similar.SCORE.desc())\
+        .all()
+
+    # Returning:
+    return similar_entries
 
 
 """
@@ -36,58 +119,222 @@ ROUTING AND LOGIC BLOCK
 """
 
 
-@WORD_BLUEPRINT.route(rule = WORD_PAGE_URL, methods = ["GET"])
-def word_detail(language: str, word_index: int) -> str:
+def __compose_word_context(word: Word, language: str) -> dict[str, Any]:
     """
-    Display detailed word page for a specific language and word index.
-    
-    Args:
-        lang: Language code ('ru', 'en', 'he')
-        word_index: Word index number
-        
-    Returns:
-        Rendered word detail page
+    Prepares the language-dependent part of a word page: container, paradigm sections and
+    cross-reference panels. Shared by the full page and its language fragment.
+
+    :param Word word: Word instance;
+    :param str language: Page language (`"ru"`, `"en"` or `"he"`).
+
+    :return dict[str, Any]: Template context.
     """
-    # Validate language
-    if language not in SUPPORTED_LANGUAGES:
-        abort(404, description="Language not supported")
-        
-    # Saving last used language:
-    session["LANG_USED"] = language
-    
-    # Getting word from database:
-    word = DATABASE.session.query(Word)\
-        .filter(Word.INDEX == word_index)\
-        .first()
-    
-    # Checking if word exists:
-    if not word:
-        abort(404, description="Word not found")
-    
+
     # Getting the appropriate container and translation based on language:
-    container_attr = f'HTML_CONTAINER_LANG_{language.upper()}'
-    translation_attr = f'TRANSLATION_LANG_{language.upper()}'
-    
-    container_html = getattr(word, container_attr, '')
-    translation = getattr(word, translation_attr, '')
-    
+    container_html: str = getattr(word, f'HTML_CONTAINER_LANG_{language.upper()}', '')
+    translation: str = getattr(word, f'TRANSLATION_LANG_{language.upper()}', '')
+
     # Check if container exists for this language
     if not container_html:
         abort(404, description=f"Word content not available in {language}")
-    
+
+    # Splitting container around the stored paradigm's position:
+    container_html, _, container_tail_html = container_html.partition(paradigm.PARADIGM_PLACEHOLDER)
+
     # Preparing template context:
     context: dict[str, Any] = {
         'word': word,
         'language': language,
         'container_html': container_html,
+        'container_tail_html': container_tail_html,
+        'paradigm_groups': paradigm.group_paradigm(paradigm = word.PARADIGM, language = language),
+        'paradigm_groups_eager': paradigm.PARADIGM_SECTIONS_EAGER,
         'translation': translation,
         'hebrew_word': word.TRANSLATION_LANG_HE,
+        'related_entries': __query_linked_entries(word_index = word.INDEX, incoming = False),
+        'linked_from_entries': __query_linked_entries(word_index = word.INDEX, incoming = True),
+        'similar_entries': __query_similar_entries(word_index = word.INDEX),
         }
+
+    # Returning:
+    return context
+
+
+def __select_language(language: str) -> None:
+    """
+    Validates the language, aborting with 404 if it is unknown, and remembers it as the last
+    used one.
+    """
+
+    # Validate language
+    if language not in SUPPORTED_LANGUAGES:
+        abort(404, description="Language not supported")
+        
+    # Saving last used language (only on change, so revalidations do not rewrite the cookie):
+    if session.get("LANG_USED") != language:
+        session["LANG_USED"] = language
+
+
+def __read_word_state(word_index: int) -> tuple[bool, ...]:
+    """
+    Reads the current learner's statuses of the word, aborting with 404 if the word is unknown.
+    """
+
+    # Reading statuses:
+    word_state: Optional[dict[str, bool]] = status.read_word_state(
+        user_id = users.current_user_id(),
+        word_index = word_index
+        )
+    if word_state is None:
+        abort(404, description="Word not found")
+
+    # Returning:
+    return tuple(word_state.values())
+
+
+def __read_page_version() -> tuple[int, str]:
+    """
+    Version stamp of rendered word pages: the dictionary version and the asset manifest hash
+    (pages link fingerprinted assets, whose names change with every asset build).
+    """
+
+    # Returning:
+    return scripts.read_dictionary_version(), assets.manifest_version()
+
+
+def __build_word_etag(template: str, language: str, word_index: int, word_state: tuple[bool, ...]) -> str:
+    """
+    Builds the entity tag of a rendered word page or fragment from the page version and the
+    learner's statuses of the word, so a revalidation is answered without loading or rendering
+    the word.
+    """
+
+    # Returning:
+    return responses.build_etag(template, language, word_index, __read_page_version(), word_state)
+
+
+def __query_word(word_index: int) -> Word:
+    """
+    Loads the word, aborting with 404 if it is unknown.
+    """
+
+    # Getting word from database:
+    word = DATABASE.session.query(Word)\
+        .filter(Word.INDEX == word_index)\
+        .first()
     
+    # Checking if word exists:
+    if not word:
+        abort(404, description="Word not found")
+
+    # Returning:
+    return word
+
+
+@WORD_BLUEPRINT.route(rule = WORD_PAGE_URL, methods = ["GET"])
+def word_detail(language: str, word_index: int) -> Response:
+    """
+    Display detailed word page for a specific language and word index. Only the first
+    `PARADIGM_SECTIONS_EAGER` paradigm sections are rendered, the rest are fetched on demand
+    from `word_section`. Rendered pages are kept in `WORD_PAGE_CACHE` per language, page
+    version (dictionary and assets) and status combination (learners with the same flags share
+    a page). Revalidations of an unchanged page are answered with 304 before anything is
+    rendered.
+    
+    Args:
+        lang: Language code ('ru', 'en', 'he')
+        word_index: Word index number
+        
+    Returns:
+        Rendered word detail page
+    """
+
+    # Validating language and reading statuses:
+    __select_language(language = language)
+    word_state: tuple[bool, ...] = __read_word_state(word_index = word_index)
+
+    # Rendering the page on a cache miss:
+    def render_page() -> str:
+        word: Word = __query_word(word_index = word_index)
+        context: dict[str, Any] = __compose_word_context(word = word, language = language)
+        return render_template(
+            template_name_or_list = WORD_PAGE_HTML, 
+            word_state = dict(zip(status.STATUS_COLUMNS, word_state)),
+            **context
+            )
+
     # Generating page route:
-    page_route: str = render_template(
-        template_name_or_list = WORD_PAGE_HTML, 
-        **context
+    page_route: Response = responses.respond_conditionally(
+        etag = __build_word_etag(template = WORD_PAGE_HTML, language = language, word_index = word_index, word_state = word_state),
+        render = lambda: WORD_PAGE_CACHE.get(
+            group = word_index,
+            variant = (WORD_PAGE_HTML, language, __read_page_version(), word_state),
+            render = render_page
+            )
         )
     
-    return page_route
\ No newline at end of file
+    return page_route
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@WORD_BLUEPRINT.route(rule = WORD_FRAGMENT_URL, methods = ["GET"])
+def word_fragment(language: str, word_index: int) -> Response:
+    """
+    Render only the language-dependent part of a word page, swapped in by the language buttons
+    instead of reloading the whole page.
+    """
+
+    # Validating language:
+    __select_language(language = language)
+
+    # Rendering the fragment on a cache miss:
+    def render_fragment() -> str:
+        word: Word = __query_word(word_index = word_index)
+        context: dict[str, Any] = __compose_word_context(word = word, language = language)
+        return render_template(
+            template_name_or_list = WORD_FRAGMENT_HTML,
+            **context
+            )
+
+    # Returning (the fragment shows no statuses, so all learners share it):
+    return responses.respond_conditionally(
+        etag = __build_word_etag(template = WORD_FRAGMENT_HTML, language = language, word_index = word_index, word_state = ()),
+        render = lambda: WORD_PAGE_CACHE.get(
+            group = word_index,
+            variant = (WORD_FRAGMENT_HTML, language, __read_page_version()),
+            render = render_fragment
+            )
+        )
+
+
+# --------------------------------------------------------------------------------------------------
+
+
+@WORD_BLUEPRINT.route(rule = WORD_SECTION_URL, methods = ["GET"])
+def word_section(language: str, word_index: int, section_index: int) -> str:
+    """
+    Render a single paradigm section (e.g. future tense). Only the stored paradigm is read, not
+    the word's HTML containers.
+    """
+
+    # Validate language
+    if language not in SUPPORTED_LANGUAGES:
+        abort(404, description="Language not supported")
+
+    # Getting stored paradigm only:
+    word_paradigm: Optional[list] = DATABASE.session.query(Word.PARADIGM)\
+        .filter(Word.INDEX == word_index)\
+        .scalar()
+
+    # Selecting requested section:
+    paradigm_groups: list[dict] = paradigm.group_paradigm(paradigm = word_paradigm, language = language)
+    if not 0 <= section_index < len(paradigm_groups):
+        abort(404, description="Section not found")
+
+    # Returning:
+    return render_template(
+        template_name_or_list = WORD_SECTION_HTML,
+        group = paradigm_groups[section_index]
+        )
@@ -0,0 +1,13 @@
+// Toggling learner statuses, the server buffers and merges rapid changes:
+document.querySelectorAll('[data-status-toggle-url]').forEach(button => {
+    button.addEventListener('click', function(event) {
+        event.preventDefault();
+        fetch(button.dataset.statusToggleUrl, { method: 'POST' })
+            .then(response => response.ok ? response.json() : Promise.reject(response.status))
+            .then(result => {
+                button.classList.toggle('active', result.value);
+                button.classList.remove('status-btn-failed');
+            })
+            .catch(() => { button.classList.add('status-btn-failed'); });
+    });
+});
@@ -0,0 +1,69 @@
+# Path and system imports:
+import os
+import sys
+
+# Testing framework import:
+import pytest
+
+# Making the repository root importable when pytest is run from anywhere:
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Flask library import:
+from flask import Flask
+
+# Database and model imports (every model, so `create_all` builds the full schema):
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities.database.models.input import Input
+from utilities.database.models.form import Form
+from utilities.database.models.root import Root
+from utilities.database.models.link import Link
+from utilities.database.models.similar import Similar
+from utilities.database.models.statistic import Statistic
+from utilities.database.models.user import User
+from utilities.database.models.state import UserWordState
+from utilities.database.models.review import Review
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+DATABASE FIXTURES
+
+"""
+
+
+@pytest.fixture
+def application(tmp_path):
+    """
+    Minimal application on an empty database file of its own, with an application context
+    pushed for the duration of the test. Routes, assets and fonts of `app.py` are left out.
+    """
+
+    # Creating application and schema:
+    application: Flask = Flask(__name__)
+    application.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    DATABASE.init_app(application)
+    with application.app_context():
+        DATABASE.create_all()
+        yield application
+        DATABASE.session.remove()
+
+
+@pytest.fixture
+def words(application):
+    """
+    Adds a handful of bare dictionary words (indexes 1 to 5).
+    """
+
+    # Adding words:
+    for word_index in range(1, 6):
+        DATABASE.session.add(Word(
+            INDEX = word_index,
+            HTML_CONTAINER_LANG_RU = "",
+            HTML_CONTAINER_LANG_EN = "",
+            HTML_CONTAINER_LANG_HE = "",
+            ))
+    DATABASE.session.commit()
+
+    # Returning:
+    return list(range(1, 6))
@@ -0,0 +1,109 @@
+# Testing framework import:
+import pytest
+
+# API blueprint import:
+from routes.api import API_BATCH_MAX, API_BLUEPRINT
+
+# Status utilities import:
+from utilities import status
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+API FIXTURES
+
+"""
+
+
+@pytest.fixture
+def client(application, words, monkeypatch):
+    """
+    Test client of the API alone, with a write buffer that is only written by an explicit flush.
+    """
+
+    # Registering API and replacing process-wide buffer:
+    application.secret_key = "test"
+    application.register_blueprint(API_BLUEPRINT)
+    monkeypatch.setattr(status, "STATUS_WRITE_BUFFER", status.StatusWriteBuffer(delay = 60))
+
+    # Returning:
+    return application.test_client()
+
+
+def assert_bad_request(response) -> None:
+    assert response.status_code == 400
+    assert response.is_json and "error" in response.get_json()
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+READ ENDPOINT TESTS
+
+"""
+
+
+def test_words_reject_malformed_ids_and_includes(client):
+    assert_bad_request(client.get("/api/v1/words?ids=1,x"))
+    assert_bad_request(client.get("/api/v1/words?ids=1.5"))
+    assert_bad_request(client.get("/api/v1/words?ids=" + ",".join(map(str, range(API_BATCH_MAX + 1)))))
+    assert_bad_request(client.get("/api/v1/words/1?include=paradigm,secret"))
+
+    # Well-formed requests are answered:
+    response = client.get("/api/v1/words?ids=3,1,99&include=paradigm")
+    assert response.status_code == 200
+    assert [word["index"] for word in response.get_json()["words"]] == [3, 1]
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+WRITE ENDPOINT TESTS
+
+"""
+
+
+@pytest.mark.parametrize("body", ["[true]", "5", "\"value\"", "{not json", '{"value": "true"}', '{"value": 1}', '{"value": null}'])
+def test_word_status_rejects_invalid_bodies(client, body):
+    assert_bad_request(client.post("/api/v1/words/1/status/favourite", data = body, content_type = "application/json"))
+    assert status.STATUS_WRITE_BUFFER.pending_map == {}
+
+
+def test_word_status_accepts_toggles_and_values(client):
+    assert client.post("/api/v1/words/1/status/favourite").get_json()["value"] is True
+    assert client.post("/api/v1/words/1/status/favourite", json = {"value": True}).get_json()["value"] is True
+    assert client.post("/api/v1/words/1/status/bogus").status_code == 404
+
+
+@pytest.mark.parametrize("payload", [
+    [1, 2],
+    {"status": "bogus", "ids": [1]},
+    {"status": ["known"], "ids": [1]},
+    {"status": "known", "value": "true", "ids": [1]},
+    {"status": "known", "query": 5},
+    {"status": "known", "ids": "1,2"},
+    {"status": "known", "ids": [1, True]},
+    {"status": "known", "ids": [1, "2"]},
+    {"status": "known", "ids": list(range(status.STATUS_BULK_MAX + 1))},
+    ])
+def test_bulk_status_rejects_invalid_payloads(client, payload):
+    assert_bad_request(client.post("/api/v1/words/status", json = payload))
+
+
+def test_bulk_status_changes_listed_words(client):
+    response = client.post("/api/v1/words/status", json = {"status": "known", "ids": [1, 2, 99]})
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "known", "value": True, "matched": 3, "changed": 2}
+
+
+@pytest.mark.parametrize("payload", [
+    [],
+    {"kind": "sentence", "ids": [1]},
+    {"kind": "word", "ids": [1.0]},
+    {"kind": "word", "ids": list(range(API_BATCH_MAX + 1))},
+    ])
+def test_reviews_reject_invalid_payloads(client, payload):
+    assert_bad_request(client.post("/api/v1/reviews", json = payload))
+
+
+@pytest.mark.parametrize("body", ["null", '{"grade": "perfect"}', '{"grade": 3}'])
+def test_review_rejects_invalid_grades(client, body):
+    assert_bad_request(client.post("/api/v1/reviews/word/1", data = body, content_type = "application/json"))
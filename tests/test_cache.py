@@ -0,0 +1,108 @@
+# Threading and timing imports:
+import threading
+import time
+
+# Testing framework import:
+import pytest
+
+# Cache import:
+from utilities.cache import RenderCache
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RENDER CACHE TESTS
+
+"""
+
+
+def test_render_cache_serves_stored_pages():
+    render_cache = RenderCache(name = "test", byte_limit = 1024)
+    render_count: list[int] = []
+
+    def render() -> str:
+        render_count.append(1)
+        return "page"
+
+    # Rendering once, then hitting:
+    assert render_cache.get(group = 1, variant = "en", render = render) == "page"
+    assert render_cache.get(group = 1, variant = "en", render = render) == "page"
+    assert len(render_count) == 1
+    assert render_cache.stats["hits"] == 1
+    assert render_cache.stats["misses"] == 1
+
+
+def test_render_cache_coalesces_concurrent_misses():
+    render_cache = RenderCache(name = "test", byte_limit = 1024)
+    render_started = threading.Event()
+    render_release = threading.Event()
+    render_count: list[int] = []
+
+    def render() -> str:
+        render_count.append(1)
+        render_started.set()
+        render_release.wait(timeout = 5)
+        return "page"
+
+    # Starting a leading render, then misses for the same entry while it runs:
+    result_list: list[str] = []
+    thread_list: list[threading.Thread] = [
+        threading.Thread(target = lambda: result_list.append(render_cache.get(group = 1, variant = "en", render = render)))
+        for _ in range(5)
+        ]
+    thread_list[0].start()
+    assert render_started.wait(timeout = 5)
+    for thread in thread_list[1:]:
+        thread.start()
+    while render_cache.stats["coalesced"] < 4:
+        time.sleep(0.01)
+
+    # Releasing the render, every request gets its result:
+    render_release.set()
+    for thread in thread_list:
+        thread.join(timeout = 5)
+    assert result_list == ["page"] * 5
+    assert len(render_count) == 1
+    assert render_cache.stats["misses"] == 1
+    assert render_cache.stats["coalesced"] == 4
+
+
+def test_render_cache_shares_render_errors():
+    render_cache = RenderCache(name = "test", byte_limit = 1024)
+
+    def render() -> str:
+        raise LookupError("missing")
+
+    # Failed renders are raised and not stored:
+    with pytest.raises(LookupError):
+        render_cache.get(group = 1, variant = "en", render = render)
+    assert render_cache.stats["entries"] == 0
+
+
+def test_render_cache_evicts_least_recently_used():
+    render_cache = RenderCache(name = "test", byte_limit = 10)
+
+    # Filling the cache, then touching the oldest entry:
+    render_cache.get(group = 1, variant = "en", render = lambda: "aaaa")
+    render_cache.get(group = 2, variant = "en", render = lambda: "bbbb")
+    render_cache.get(group = 1, variant = "en", render = lambda: "xxxx")
+
+    # Overflowing evicts the least recently used entry only:
+    render_cache.get(group = 3, variant = "en", render = lambda: "cccc")
+    assert render_cache.stats["evictions"] == 1
+    assert render_cache.stats["bytes"] == 8
+    assert render_cache.get(group = 1, variant = "en", render = lambda: "new") == "aaaa"
+    assert render_cache.get(group = 2, variant = "en", render = lambda: "new") == "new"
+
+
+def test_render_cache_counts_utf8_bytes_and_skips_oversized_pages():
+    render_cache = RenderCache(name = "test", byte_limit = 6)
+
+    # Hebrew letters take two bytes each:
+    render_cache.get(group = 1, variant = "he", render = lambda: "ספר")
+    assert render_cache.stats["bytes"] == 6
+
+    # Pages larger than the whole cache are served but not stored:
+    assert render_cache.get(group = 2, variant = "he", render = lambda: "שלום") == "שלום"
+    assert render_cache.stats["entries"] == 1
+    assert render_cache.stats["evictions"] == 0
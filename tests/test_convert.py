@@ -0,0 +1,53 @@
+# Parse-related library import:
+import json
+
+# Database import:
+from utilities.database import DATABASE
+from utilities.database.models.similar import Similar
+from utilities.database.models.word import Word
+
+# Conversion imports:
+from utilities.convert import Converter
+from utilities.similar import compute_similar_words
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EMPTY INPUT TESTS
+
+"""
+
+
+def test_similar_words_of_empty_input():
+    assert compute_similar_words(entry_list = []) == []
+    assert compute_similar_words(entry_list = [(1, None, None), (2, [], [])]) == []
+
+
+def test_similar_words_exact_and_approximate_agree_on_small_input():
+    entry_list: list[tuple] = [
+        (1, ["book", "volume"], ["книга"]),
+        (2, ["book"], ["книга", "том"]),
+        (3, ["write"], ["писать"]),
+        (4, ["write", "book"], ["писать"]),
+        ]
+
+    # Below the frequency floor no term is left out:
+    assert compute_similar_words(entry_list = entry_list) == compute_similar_words(entry_list = entry_list, term_share_max = None)
+
+
+def test_converter_with_empty_input_clears_similar_words(application, tmp_path):
+    DATABASE.session.add(Similar(INDEX = 1, SIMILAR_INDEX = 2, SCORE = 0.5))
+    DATABASE.session.commit()
+
+    # Converting an empty dictionary:
+    json_filepath = tmp_path / "empty.json"
+    json_filepath.write_text(json.dumps({}), encoding = "utf-8")
+    assert Converter(json_filepath = str(json_filepath)).run() == 0
+
+    # Neighbours of the previous build are gone, not restored by a failed empty insert:
+    assert DATABASE.session.query(Word).count() == 0
+    assert DATABASE.session.query(Similar).count() == 0
+
+
+def test_converter_with_missing_file(application, tmp_path):
+    assert Converter(json_filepath = str(tmp_path / "missing.json")).run() == 0
@@ -0,0 +1,107 @@
+# Hebrew utilities import:
+from utilities import hebrew
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+NORMALIZATION TESTS
+
+"""
+
+
+def test_strip_niqqud_keeps_consonants():
+    assert hebrew.strip_niqqud("כָּתַב") == "כתב"
+    assert hebrew.strip_niqqud("שָׁלוֹם") == "שלום"
+
+
+def test_normalize_word_unifies_final_letters_only():
+    assert hebrew.normalize_word("שולחן") == "שולחנ"
+    assert hebrew.normalize_word("בית") == "בית"
+
+
+def test_normalize_is_niqqud_and_punctuation_insensitive():
+    assert hebrew.normalize("שֻׁלְחָן") == hebrew.normalize("שלחן") == "שלחנ"
+    assert hebrew.normalize("בַּיִת") == hebrew.normalize("בית") == "בית"
+    assert hebrew.normalize("בית־ספר") == "בית ספר"
+    assert hebrew.normalize("צה״ל") == "צהל"
+
+
+def test_fold_drops_only_vowel_letters_of_pointed_words():
+    # Holam male, shuruk and a yod lengthening hiriq are vowels:
+    assert hebrew.fold("יוֹם") == hebrew.fold("יָם") == "ימ"
+    assert hebrew.fold("מוּל") == "מל"
+    assert hebrew.fold("תִּיק") == "תק"
+
+    # Consonantal vav and yod are kept:
+    assert hebrew.fold("בַּיִת") == "בית"
+    assert hebrew.fold("בַּת") == "בת"
+    assert hebrew.fold("ילד") == "ילד"
+    assert hebrew.fold("ורד") == "ורד"
+
+
+def test_fold_drops_inner_vav_and_yod_of_unpointed_words():
+    assert hebrew.fold("שולחן") == hebrew.fold("שלחן") == "שלחנ"
+    assert hebrew.fold("בית") == "בת"
+    assert hebrew.fold("בית־ספר") == "בת ספר"
+    assert hebrew.fold(None) is None
+
+
+def test_normalize_rejects_empty_and_non_hebrew_text():
+    assert hebrew.normalize(None) is None
+    assert hebrew.normalize("") is None
+    assert hebrew.normalize("book") is None
+    assert hebrew.normalize("׳״") is None
+
+
+def test_normalize_root_accepts_any_notation():
+    assert hebrew.normalize_root("ש - ל - ם") == hebrew.normalize_root("שלמ") == "ש-ל-ם"
+    assert hebrew.normalize_root("כ") is None
+    assert hebrew.normalize_root(None) is None
+
+
+def test_tokenize_keeps_niqqud_and_splits_on_punctuation():
+    assert hebrew.tokenize("וּבַבַּיִת, הַיֶּלֶד כָּתַב.") == ["וּבַבַּיִת", "הַיֶּלֶד", "כָּתַב"]
+    assert hebrew.tokenize("abc 123") == []
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CANDIDATE GENERATION TESTS
+
+"""
+
+
+def test_generate_candidates_strips_stacked_proclitics():
+    assert hebrew.generate_candidates("ובבית") == [
+        ("", "ובבית", "ובבת"),
+        ("ו", "בבית", "בבת"),
+        ("וב", "בית", "בת"),
+        ("ובב", "ית", "ית"),
+        ]
+
+
+def test_generate_candidates_fold_pointed_stems_by_niqqud():
+    candidate_list = hebrew.generate_candidates("וּבַבַּיִת")
+    assert [key for _, key, _ in candidate_list] == ["ובבית", "בבית", "בית", "ית"]
+    assert candidate_list[2] == ("וב", "בית", "בית")
+
+
+def test_generate_candidates_stops_at_non_proclitic():
+    assert hebrew.generate_candidates("כתב") == [("", "כתב", "כתב"), ("כ", "תב", "תב")]
+    assert hebrew.generate_candidates("ספר") == [("", "ספר", "ספר")]
+
+
+def test_generate_candidates_keeps_a_minimal_stem():
+    # Stripping would leave a single letter:
+    assert hebrew.generate_candidates("בה") == [("", "בה", "בה")]
+
+
+def test_generate_candidates_depth_is_bounded():
+    candidate_list = hebrew.generate_candidates("ושבהלכה")
+    assert len(candidate_list) == hebrew.PROCLITIC_DEPTH_MAX + 1
+    assert candidate_list[-1][0] == "ושב"
+
+
+def test_generate_candidates_of_empty_token():
+    assert hebrew.generate_candidates("") == []
+    assert hebrew.generate_candidates("״") == []
@@ -0,0 +1,67 @@
+# Database import:
+from utilities.database import DATABASE, scripts
+from utilities.database.models.link import Link
+from utilities.database.models.word import Word
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CROSS-REFERENCE FIXTURES
+
+"""
+
+
+# Containers linking to entries 2 and 3, to the word itself and to an external page:
+LINKS_HTML_EN: str = """
+<h3>Related words</h3>
+<ul>
+    <li><a href="/dictionary/en/2">writing</a></li>
+    <li><a href="/dictionary/en/1">to write</a></li>
+    <li><a href="https://www.pealim.com/dict/3">external</a></li>
+</ul>
+"""
+LINKS_HTML_RU: str = """
+<p><a href="/dictionary/ru/2">письмо</a> <a href="/dictionary/ru/3">писатель</a></p>
+"""
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CROSS-REFERENCE TESTS
+
+"""
+
+
+def test_compose_links_collects_distinct_internal_targets():
+    word = Word(
+        INDEX = 1,
+        HTML_CONTAINER_LANG_EN = LINKS_HTML_EN,
+        HTML_CONTAINER_LANG_RU = LINKS_HTML_RU,
+        )
+
+    # English anchor text wins, self-links and external links are left out:
+    assert word.compose_links() == [
+        (2, "writing", "Related words"),
+        (3, "писатель", None),
+        ]
+
+
+def test_compose_links_of_empty_containers():
+    assert Word(INDEX = 1).compose_links() == []
+    assert Word(INDEX = 1, HTML_CONTAINER_LANG_HE = "<p>No links</p>").compose_links() == []
+
+
+def test_dangling_links_are_counted(application):
+    DATABASE.session.add(Word(
+        INDEX = 2,
+        HTML_CONTAINER_LANG_RU = "",
+        HTML_CONTAINER_LANG_EN = "",
+        HTML_CONTAINER_LANG_HE = "",
+        ))
+    DATABASE.session.add_all([
+        Link(SOURCE_INDEX = 1, TARGET_INDEX = 2),
+        Link(SOURCE_INDEX = 1, TARGET_INDEX = 3),
+        Link(SOURCE_INDEX = 2, TARGET_INDEX = 4),
+        ])
+    DATABASE.session.commit()
+    assert scripts.count_dangling_links() == 2
@@ -0,0 +1,44 @@
+# Minification utilities import:
+from utilities import minify
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+MINIFY TESTS
+
+"""
+
+
+def test_minify_strips_attributes_comments_and_whitespace():
+    assert minify.minify_container('<div class="lead"  style="x">  to   write <!-- ad --></div>') == '<div class="lead"> to write </div>'
+    assert minify.minify_container('<a href="/dictionary/en/2" onclick="track()" data-id="2">x</a>') == '<a href="/dictionary/en/2">x</a>'
+
+
+def test_minify_drops_scripts_and_scaffolding():
+    html_container: str = minify.minify_container(
+        '<p>kept</p><script>ad()</script><div class="ad-banner-top">ad</div>'
+        '<span class="popovers-note">note</span><a data-toggle="collapse">more</a>'
+        )
+    assert html_container == "<p>kept</p>"
+
+
+def test_minify_drops_hidden_elements():
+    html_container: str = minify.minify_container(
+        '<p>kept</p><div hidden><p>hidden</p></div>'
+        '<div style="color: red; display:none">hidden</div>'
+        '<span style="DISPLAY: NONE !important;">hidden</span>'
+        '<div style="display: none-ish; color: red">kept</div>'
+        '<div style="display: block">kept</div>'
+        )
+    assert "hidden" not in html_container
+    assert html_container.count("kept") == 3
+
+
+def test_minify_keeps_whitespace_where_it_renders():
+    assert minify.minify_container("<table> <tr> <td> a  b </td> </tr> </table>") == "<table><tr><td> a b </td></tr></table>"
+    assert minify.minify_container("<pre>a   b</pre>") == "<pre>a   b</pre>"
+
+
+def test_minify_of_empty_container():
+    assert minify.minify_container(None) is None
+    assert minify.minify_container("") == ""
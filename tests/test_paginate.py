@@ -0,0 +1,86 @@
+# Testing framework import:
+import pytest
+
+# Database import:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+
+# Pagination utilities import:
+from utilities import paginate
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PAGINATION FIXTURES
+
+"""
+
+
+# Listed word indexes, with gaps as in a partially scraped dictionary:
+PAGINATE_INDEXES: tuple[int, ...] = (1, 2, 4, 5, 9, 10, 11, 20)
+
+
+@pytest.fixture
+def listed_words(application):
+    """
+    Adds words with sparse indexes, in reverse order so row order differs from key order.
+    """
+
+    # Adding words:
+    for word_index in reversed(PAGINATE_INDEXES):
+        DATABASE.session.add(Word(
+            INDEX = word_index,
+            HTML_CONTAINER_LANG_RU = "",
+            HTML_CONTAINER_LANG_EN = "",
+            HTML_CONTAINER_LANG_HE = "",
+            ))
+    DATABASE.session.commit()
+
+
+def read_page(boundary_index: paginate.PageBoundaryIndex, page: int) -> list[int]:
+    return [
+        word.INDEX for word in paginate.seek_page(
+            query = DATABASE.session.query(Word),
+            key_column = Word.INDEX,
+            boundary_index = boundary_index,
+            page = page
+            )
+        ]
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+KEYSET PAGINATION TESTS
+
+"""
+
+
+def test_boundaries_hold_first_key_of_every_page(listed_words):
+    boundary_index = paginate.build_page_boundaries(key_column = Word.INDEX, per_page = 3)
+    assert boundary_index.boundary_list == [1, 5, 11]
+    assert boundary_index.total_count == len(PAGINATE_INDEXES)
+    assert boundary_index.total_pages == 3
+
+
+def test_seek_pages_match_offset_pages(listed_words):
+    for per_page in (1, 3, 8, 10):
+        boundary_index = paginate.build_page_boundaries(key_column = Word.INDEX, per_page = per_page)
+        for page in range(1, boundary_index.total_pages + 1):
+            offset_page: list[int] = list(PAGINATE_INDEXES[(page - 1) * per_page:page * per_page])
+            assert read_page(boundary_index, page) == offset_page
+
+
+def test_pages_outside_the_listing_are_empty(listed_words):
+    boundary_index = paginate.build_page_boundaries(key_column = Word.INDEX, per_page = 3)
+    assert read_page(boundary_index, 0) == []
+    assert read_page(boundary_index, 4) == []
+    assert boundary_index.clamp(0) == 1
+    assert boundary_index.clamp(99) == 3
+
+
+def test_empty_listing(application):
+    boundary_index = paginate.build_page_boundaries(key_column = Word.INDEX, per_page = 3)
+    assert boundary_index.total_pages == 0
+    assert boundary_index.total_count == 0
+    assert boundary_index.clamp(5) == 1
+    assert read_page(boundary_index, 1) == []
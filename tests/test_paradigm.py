@@ -0,0 +1,112 @@
+# Database import:
+from utilities.database.models.word import Word
+
+# Paradigm utilities import:
+from utilities import paradigm
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PARADIGM FIXTURES
+
+"""
+
+
+# Conjugation table as Pealim renders it, with a nested cell and a repeated form:
+PARADIGM_HTML_HE: str = """
+<h2>כתב</h2>
+<table class="conjugation-table">
+    <tr>
+        <td id="AP-ms"><div class="menukad">כּוֹתֵב</div><div class="transcription">kotev</div></td>
+        <td id="AP-fs"><div class="menukad">כּוֹתֶבֶת</div><div class="menukad">כּוֹתֶבֶת</div></td>
+    </tr>
+    <tr>
+        <td id="PERF-1s">
+            <div class="menukad">כָּתַבְתִּי</div>
+            <div id="PERF-1p"><div class="menukad">כתבנו</div></div>
+        </td>
+        <td id="INF-L"><div class="menukad">לִכְתֹּב</div></td>
+        <td id="empty"><div class="menukad"> </div></td>
+    </tr>
+</table>
+<p>Example</p>
+"""
+
+# Same table in the English container, with Latin transcriptions:
+PARADIGM_HTML_EN: str = """
+<table>
+    <tr>
+        <td id="AP-ms"><div class="menukad">כּוֹתֵב</div><div class="transcription">kotév</div></td>
+        <td id="AP-fs"><div class="menukad">כּוֹתֶבֶת</div><div class="transcription">kotévet</div></td>
+    </tr>
+</table>
+"""
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PARADIGM PARSING TESTS
+
+"""
+
+
+def test_parse_paradigm_reads_cells_in_table_order():
+    assert paradigm.parse_paradigm(PARADIGM_HTML_HE, PARADIGM_HTML_EN) == [
+        ["AP-ms", ["כּוֹתֵב"], "kotév"],
+        ["AP-fs", ["כּוֹתֶבֶת"], "kotévet"],
+        ["PERF-1s", ["כָּתַבְתִּי"], None],
+        ["PERF-1p", ["כתבנו"], None],
+        ["INF-L", ["לִכְתֹּב"], None],
+        ]
+
+
+def test_parse_paradigm_falls_back_to_hebrew_transcriptions():
+    assert paradigm.parse_paradigm(PARADIGM_HTML_HE)[0] == ["AP-ms", ["כּוֹתֵב"], "kotev"]
+
+
+def test_parse_paradigm_of_container_without_table():
+    assert paradigm.parse_paradigm(None) is None
+    assert paradigm.parse_paradigm("") is None
+    assert paradigm.parse_paradigm("<p>No table</p>") is None
+
+
+def test_strip_paradigm_leaves_placeholder():
+    html_container: str = paradigm.strip_paradigm(PARADIGM_HTML_HE)
+    assert "menukad" not in html_container
+    assert html_container.count(paradigm.PARADIGM_PLACEHOLDER) == 1
+    assert html_container.index("<h2>") < html_container.index(paradigm.PARADIGM_PLACEHOLDER) < html_container.index("<p>")
+    assert paradigm.strip_paradigm("<p>No table</p>") == "<p>No table</p>"
+    assert paradigm.strip_paradigm(None) is None
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PARADIGM RENDERING TESTS
+
+"""
+
+
+def test_group_paradigm_labels_groups_and_slots():
+    group_list: list[dict] = paradigm.group_paradigm(
+        paradigm.parse_paradigm(PARADIGM_HTML_HE, PARADIGM_HTML_EN),
+        language = "en"
+        )
+    assert [group["label"] for group in group_list] == ["Present tense", "Past tense", "Infinitive"]
+    assert group_list[0]["cells"][1] == {"label": "f. sg.", "forms": ["כּוֹתֶבֶת"], "transcription": "kotévet"}
+    assert [cell["label"] for cell in group_list[1]["cells"]] == ["I", "we"]
+    assert group_list[2]["cells"][0]["label"] == ""
+
+
+def test_group_paradigm_of_declension():
+    group_list: list[dict] = paradigm.group_paradigm([["s", ["סֵפֶר"], "sefer"], ["p", ["סְפָרִים"], "sfarim"]], language = "ru")
+    assert group_list == [{"label": "Склонение", "cells": [
+        {"label": "ед. ч.", "forms": ["סֵפֶר"], "transcription": "sefer"},
+        {"label": "мн. ч.", "forms": ["סְפָרִים"], "transcription": "sfarim"},
+        ]}]
+    assert paradigm.group_paradigm(None, language = "en") == []
+
+
+def test_compose_forms_flattens_stored_paradigm():
+    word = Word(PARADIGM = [["AP-ms", ["כּוֹתֵב"], None], ["AP-mp", ["כּוֹתְבִים", "כּוֹתֵב"], None]])
+    assert word.compose_forms() == [("AP-ms", "כּוֹתֵב"), ("AP-mp", "כּוֹתְבִים"), ("AP-mp", "כּוֹתֵב")]
+    assert Word().compose_forms() == []
@@ -0,0 +1,74 @@
+# Database import:
+from utilities.database import DATABASE, scripts
+from utilities.database.models.root import Root
+from utilities.database.models.word import Word
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROOT FIXTURES
+
+"""
+
+
+def compose_word(word_index: int, html_container_he: str = "", html_container_en: str = "") -> Word:
+    word = Word(
+        INDEX = word_index,
+        HTML_CONTAINER_LANG_RU = "",
+        HTML_CONTAINER_LANG_EN = html_container_en,
+        HTML_CONTAINER_LANG_HE = html_container_he,
+        )
+    word.compose()
+    return word
+
+
+def root_paragraph(root_text: str) -> str:
+    return f'<p><b>Verb – PA\'AL</b><br>Root: <span class="menukad">{root_text}</span></p>'
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROOT EXTRACTION TESTS
+
+"""
+
+
+def test_compose_extracts_canonical_root():
+    assert compose_word(1, html_container_he = root_paragraph("כ - ת - ב")).ROOT_LANG_HE == "כ-ת-ב"
+    assert compose_word(2, html_container_he = root_paragraph("ש - ל - ם")).ROOT_LANG_HE == "ש-ל-ם"
+
+
+def test_compose_falls_back_to_english_container():
+    assert compose_word(1, html_container_en = root_paragraph("ס - פ - ר")).ROOT_LANG_HE == "ס-פ-ר"
+
+
+def test_compose_ignores_other_pointed_text():
+    # Forms and words outside the dash-separated notation are not roots:
+    assert compose_word(1, html_container_he = '<p><span class="menukad">כָּתַב</span></p>').ROOT_LANG_HE is None
+    assert compose_word(2, html_container_he = '<div><span class="menukad">כ - ת - ב</span></div>').ROOT_LANG_HE is None
+    assert compose_word(3).ROOT_LANG_HE is None
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROOT FAMILY TESTS
+
+"""
+
+
+def test_root_index_counts_family_sizes(application):
+    DATABASE.session.add_all([
+        compose_word(1, html_container_he = root_paragraph("כ - ת - ב")),
+        compose_word(2, html_container_he = root_paragraph("כ - ת - ב")),
+        compose_word(3, html_container_he = root_paragraph("ס - פ - ר")),
+        compose_word(4),
+        ])
+    DATABASE.session.commit()
+    scripts.rebuild_root_index()
+    assert dict(DATABASE.session.query(Root.ROOT_LANG_HE, Root.WORD_COUNT).all()) == {"כ-ת-ב": 2, "ס-פ-ר": 1}
+
+    # Rebuilding replaces the previous counts:
+    DATABASE.session.query(Word).filter(Word.INDEX == 1).delete()
+    DATABASE.session.commit()
+    scripts.rebuild_root_index()
+    assert dict(DATABASE.session.query(Root.ROOT_LANG_HE, Root.WORD_COUNT).all()) == {"כ-ת-ב": 1, "ס-פ-ר": 1}
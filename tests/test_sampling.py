@@ -0,0 +1,70 @@
+# Testing framework import:
+import pytest
+
+# Database import:
+from utilities.database import DATABASE
+from utilities.database.models.user import User
+
+# Sampling and status utilities import:
+from utilities import sampling, status
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SAMPLING FIXTURES
+
+"""
+
+
+@pytest.fixture
+def write_buffer(application, words, monkeypatch) -> status.StatusWriteBuffer:
+    """
+    Learner 1 with a write buffer of their own that is only written by an explicit flush.
+    """
+
+    # Adding learner and replacing process-wide buffer:
+    DATABASE.session.add(User(ID = 1, CREATED_AT = 0))
+    DATABASE.session.commit()
+    write_buffer = status.StatusWriteBuffer(delay = 60)
+    monkeypatch.setattr(status, "STATUS_WRITE_BUFFER", write_buffer)
+
+    # Returning:
+    return write_buffer
+
+
+def draw_indexes(word_pool: sampling.WordPool, status_filter: str) -> set[int]:
+    return {word_pool.pick(user_id = 1, status_filter = status_filter) for _ in range(200)}
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FILTERED POOL TESTS
+
+"""
+
+
+def test_filtered_pools_merge_buffered_changes_without_flushing(write_buffer, monkeypatch):
+    word_pool = sampling.build_word_pools()
+    write_buffer.set(user_id = 1, word_index = 2, status = "favourite", value = True)
+    write_buffer.flush()
+    assert draw_indexes(word_pool, sampling.SAMPLING_STATUS_FAVOURITE) == {2}
+
+    # Buffered toggles are drawn from at once, but stay buffered:
+    monkeypatch.setattr(status, "apply_statuses", lambda change_list: pytest.fail("Buffer was flushed"))
+    write_buffer.set(user_id = 1, word_index = 4, status = "favourite", value = True)
+    assert draw_indexes(word_pool, sampling.SAMPLING_STATUS_FAVOURITE) == {2, 4}
+    write_buffer.set(user_id = 1, word_index = 2, status = "favourite", value = False)
+    assert draw_indexes(word_pool, sampling.SAMPLING_STATUS_FAVOURITE) == {4}
+    write_buffer.set(user_id = 1, word_index = 1, status = "known", value = True)
+    assert draw_indexes(word_pool, sampling.SAMPLING_STATUS_NOT_KNOWN) == {2, 3, 4, 5}
+    assert len(write_buffer.pending_map) == 3
+
+
+def test_filtered_pools_follow_written_changes(write_buffer):
+    word_pool = sampling.build_word_pools()
+    assert word_pool.pick(user_id = 1, status_filter = sampling.SAMPLING_STATUS_TO_LEARN) is None
+
+    # A flushed change bumps the state version, so the cached array is rebuilt:
+    write_buffer.set(user_id = 1, word_index = 3, status = "to_learn", value = True)
+    write_buffer.flush()
+    assert draw_indexes(word_pool, sampling.SAMPLING_STATUS_TO_LEARN) == {3}
@@ -0,0 +1,155 @@
+# Testing framework import:
+import pytest
+
+# Database import:
+from sqlalchemy import text
+from utilities.database import DATABASE, scripts
+from utilities.database.models.form import Form
+from utilities.database.models.word import Word
+
+# Search and Hebrew utilities import:
+from utilities import hebrew, search
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SEARCH FIXTURES
+
+"""
+
+
+# Indexed words: (INDEX, Hebrew headword, English and Russian translations):
+SEARCH_WORDS: tuple[tuple[int, str, str, str], ...] = (
+    (1, "לִכְתֹּב", "to write", "писать"),
+    (2, "בַּיִת", "house, home", "дом"),
+    (3, "סֵפֶר", "book, volume", "Книга"),
+    (4, "כְּתִיבָה", "writing", "письмо"),
+    (5, "כּוֹנָנִית", "bookcase", "книжный шкаф"),
+    (6, "פִּנְקָס", "notebook", "книга для записей"),
+    (7, "בַּת", "daughter", "дочь"),
+    )
+
+# Inflected forms of the indexed words: (INDEX, Pealim cell id, vocalised form):
+SEARCH_FORMS: tuple[tuple[int, str, str], ...] = (
+    (1, "PERF-1s", "כָּתַבְתִּי"),
+    (1, "IMPF-1s", "אֶכְתֹּב"),
+    (2, "p", "בָּתִּים"),
+    )
+
+
+@pytest.fixture
+def indexed_words(application):
+    """
+    Adds the search words with their search columns and builds the full-text index.
+    """
+
+    # Adding words:
+    for word_index, translation_he, translation_en, translation_ru in SEARCH_WORDS:
+        search_list: list[str] = [translation_he, *translation_en.split(", "), *translation_ru.split(", ")]
+        DATABASE.session.add(Word(
+            INDEX = word_index,
+            HTML_CONTAINER_LANG_RU = "",
+            HTML_CONTAINER_LANG_EN = "",
+            HTML_CONTAINER_LANG_HE = "",
+            TRANSLATION_LANG_HE = translation_he,
+            TRANSLATION_LANG_EN = translation_en,
+            TRANSLATION_LANG_RU = translation_ru,
+            SEARCH_LANG_HE = [translation_he],
+            SEARCH_LANG_EN = [term.strip() for term in translation_en.split(",")],
+            SEARCH_LANG_RU = [term.strip() for term in translation_ru.split(",")],
+            NORMALIZED_LANG_HE = hebrew.normalize(translation_he),
+            FOLDED_LANG_HE = hebrew.fold(translation_he),
+            MATCH_TERMS = sorted({term.lower() for term in search_list}),
+            ))
+    for word_index, form_key, form_text in SEARCH_FORMS:
+        DATABASE.session.add(Form(
+            INDEX = word_index,
+            FORM_KEY = form_key,
+            FORM_LANG_HE = form_text,
+            NORMALIZED_LANG_HE = hebrew.normalize(form_text),
+            FOLDED_LANG_HE = hebrew.fold(form_text),
+            ))
+    DATABASE.session.commit()
+    scripts.rebuild_search_index()
+
+
+def search_indexes(query_text: str) -> list[int]:
+    search_results, search_total = search.search_page(query_text = query_text)
+    assert search_total == len(search_results)
+    return [search_result.INDEX for search_result in search_results]
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FULL-TEXT SEARCH TESTS
+
+"""
+
+
+def test_match_expression_quotes_terms_and_unpoints_hebrew():
+    assert search.compose_match_expression("to wri") == '("to"* "wri"*)'
+    assert search.compose_match_expression('a"b') == '("a""b"*)'
+    assert search.compose_match_expression("לִכְתֹּב") == '("לכתב"*)'
+    assert search.compose_match_expression("   ") is None
+
+
+def test_one_letter_hebrew_query_matches_only_words_starting_with_it(indexed_words):
+    # Pointed headwords are indexed whole, not as single letters:
+    assert sorted(search_indexes("ב")) == [2, 7]
+    assert search_indexes("כ") == [4, 5]
+
+
+def test_hebrew_queries_match_pointed_and_unpointed(indexed_words):
+    assert search_indexes("לכתב") == [1]
+    assert search_indexes("לִכְתֹּב") == [1]
+
+
+def test_unpointed_spelling_ranks_exact_key_before_folded_key(indexed_words):
+    # "בית" is בַּיִת as written, and בַּת only with its yod read as a vowel letter:
+    assert search_indexes("בית") == [2, 7]
+    assert search_indexes("בת") == [7]
+
+
+def test_inflected_forms_find_their_entry(indexed_words):
+    assert search_indexes("כָּתַבְתִּי") == [1]
+    assert search_indexes("כתבתי") == [1]
+    assert search_indexes("אכתוב") == [1]
+    assert search_indexes("בתים") == [2]
+
+    # A form match is an exact match:
+    search_results, _ = search.search_page(query_text = "כתבתי")
+    assert search_results[0].MATCH_TIER == search.MATCH_TIER_EXACT
+
+
+def test_translations_match_by_term_prefix(indexed_words):
+    assert search_indexes("volume") == [3]
+    assert search_indexes("дом") == [2]
+    assert search_indexes("to wr") == [1]
+    assert search_indexes("nothing") == []
+
+
+def test_results_are_ranked_by_match_tier(indexed_words):
+    # Exact term, then prefix of a term, then any other match:
+    assert search_indexes("book") == [3, 5]
+    assert search_indexes("wri") == [4, 1]
+    assert search_indexes("writing") == [4]
+
+
+def test_capitalized_cyrillic_terms_rank_as_exact(indexed_words):
+    # "Книга" is an exact match of "книга", "книга для записей" only a prefix match:
+    assert search_indexes("книга") == [3, 6]
+    assert search_indexes("КНИГА") == [3, 6]
+
+
+def test_outdated_index_is_rebuilt(indexed_words):
+    # Recreating the index with the tokenizer that split pointed Hebrew:
+    DATABASE.session.execute(text(scripts.SQL_DROP_SEARCH_INDEX))
+    DATABASE.session.execute(text(
+        scripts.SQL_CREATE_SEARCH_INDEX.replace(scripts.SEARCH_INDEX_TOKENIZE, "unicode61 remove_diacritics 2")
+        ))
+    DATABASE.session.commit()
+
+    # Startup recreates and refills it:
+    scripts.initialize_search_index()
+    assert scripts.SEARCH_INDEX_TOKENIZE in DATABASE.session.execute(text(scripts.SQL_READ_SEARCH_INDEX)).scalar()
+    assert sorted(search_indexes("ב")) == [2, 7]
@@ -0,0 +1,82 @@
+# Testing framework import:
+import pytest
+
+# Database import:
+from utilities.database import DATABASE
+from utilities.database.models.review import Review
+
+# Scheduler import:
+from utilities import srs
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SM-2 SCHEDULING TESTS
+
+"""
+
+
+# Grading time used throughout:
+NOW: int = 1_000_000
+
+
+@pytest.fixture
+def card(application):
+    """
+    Adds a new, due word card of learner 1.
+    """
+
+    # Adding card:
+    DATABASE.session.add(Review(USER_ID = 1, ITEM_KIND = srs.SRS_KIND_WORD, ITEM_ID = 1, DUE_AT = 0))
+    DATABASE.session.commit()
+
+    # Returning:
+    return (srs.SRS_KIND_WORD, 1)
+
+
+def grade(card: tuple, grade_name: str) -> dict:
+    return srs.grade_card(user_id = 1, item_kind = card[0], item_id = card[1], grade = grade_name, now = NOW)
+
+
+def test_passed_cards_wait_one_then_six_days_then_grow_by_ease(card):
+    assert grade(card, "good") == {"interval": 1, "ease": 2.5, "repetitions": 1, "due_at": NOW + srs.SRS_DAY_SECONDS}
+    assert grade(card, "good")["interval"] == 6
+
+    # Easy raises the ease by 0.1 before it multiplies the interval (6 × 2.6 = 15.6):
+    schedule: dict = grade(card, "easy")
+    assert schedule["ease"] == 2.6
+    assert schedule["interval"] == 16
+    assert schedule["repetitions"] == 3
+    assert schedule["due_at"] == NOW + 16 * srs.SRS_DAY_SECONDS
+
+
+def test_hard_answers_lower_the_ease(card):
+    # Quality 3 changes the ease by 0.1 - 2 × (0.08 + 2 × 0.02) = -0.14:
+    assert grade(card, "hard")["ease"] == 2.36
+
+
+def test_lapsed_cards_start_over(card):
+    grade(card, "good")
+    grade(card, "good")
+
+    # Quality 1 changes the ease by 0.1 - 4 × (0.08 + 4 × 0.02) = -0.54:
+    assert grade(card, "again") == {
+        "interval": 0,
+        "ease": 1.96,
+        "repetitions": 0,
+        "due_at": NOW + srs.SRS_RELEARN_DELAY,
+        }
+    assert DATABASE.session.get(Review, (1, srs.SRS_KIND_WORD, 1)).LAPSES == 1
+
+    # Passing again restarts the first intervals:
+    assert grade(card, "good")["interval"] == 1
+
+
+def test_ease_never_drops_below_minimum(card):
+    for _ in range(5):
+        schedule: dict = grade(card, "again")
+    assert schedule["ease"] == srs.SRS_EASE_MIN
+
+
+def test_grading_a_missing_card(application):
+    assert srs.grade_card(user_id = 1, item_kind = srs.SRS_KIND_WORD, item_id = 1, grade = "good", now = NOW) is None
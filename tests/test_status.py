@@ -0,0 +1,97 @@
+# Testing framework import:
+import pytest
+
+# Database import:
+from utilities.database import DATABASE
+from utilities.database.models.state import UserWordState
+from utilities.database.models.user import User
+
+# Status utilities import:
+from utilities import statistics, status
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATUS WRITE BUFFER TESTS
+
+"""
+
+
+def test_write_buffer_coalesces_changes_into_one_write(application, words, monkeypatch):
+    DATABASE.session.add(User(ID = 1, CREATED_AT = 0))
+    DATABASE.session.commit()
+    write_buffer = status.StatusWriteBuffer(delay = 60)
+
+    # Counting writes:
+    apply_call_list: list = []
+    apply_statuses = status.apply_statuses
+    def counting_apply_statuses(change_list):
+        apply_call_list.append(change_list)
+        return apply_statuses(change_list = change_list)
+    monkeypatch.setattr(status, "apply_statuses", counting_apply_statuses)
+
+    # Toggling one flag three times, another back and forth, and setting a third:
+    for _ in range(3):
+        write_buffer.toggle(user_id = 1, word_index = 1, status = "favourite")
+    for _ in range(2):
+        write_buffer.toggle(user_id = 1, word_index = 2, status = "known")
+    write_buffer.set(user_id = 1, word_index = 3, status = "to_learn", value = True)
+
+    # Nothing is written yet, readers see the pending values:
+    assert apply_call_list == []
+    assert DATABASE.session.query(UserWordState).count() == 0
+    assert write_buffer.pending_state(user_id = 1) == {
+        1: {"favourite": True},
+        2: {"known": False},
+        3: {"to_learn": True},
+        }
+    assert write_buffer.pending_state(user_id = 2) == {}
+
+    # One flush writes the net changes in one call:
+    assert write_buffer.flush() == 3
+    assert len(apply_call_list) == 1
+    assert write_buffer.flush() == 0
+    assert status.read_stored_state(user_id = 1, word_index = 1)["favourite"] is True
+    assert status.read_stored_state(user_id = 1, word_index = 2)["known"] is False
+    assert status.read_stored_state(user_id = 1, word_index = 3)["to_learn"] is True
+
+    # Counters and the learner's state version follow the rows that changed:
+    assert statistics.read_statistic(statistics.status_statistic_key(user_id = 1, status = "favourite")) == 1
+    assert statistics.read_statistic(statistics.status_statistic_key(user_id = 1, status = "known")) == 0
+    assert DATABASE.session.get(User, 1).STATE_VERSION == 1
+
+
+def test_write_buffer_toggle_of_missing_word(application, words):
+    write_buffer = status.StatusWriteBuffer(delay = 60)
+
+    # Unknown words are not buffered:
+    assert write_buffer.toggle(user_id = 1, word_index = 99, status = "favourite") is None
+    assert write_buffer.pending_state(user_id = 1) == {}
+
+
+def test_write_buffer_keeps_changes_of_a_failed_write(application, words, monkeypatch):
+    DATABASE.session.add(User(ID = 1, CREATED_AT = 0))
+    DATABASE.session.commit()
+    write_buffer = status.StatusWriteBuffer(delay = 60)
+    write_buffer.set(user_id = 1, word_index = 1, status = "favourite", value = True)
+    write_buffer.set(user_id = 1, word_index = 2, status = "known", value = True)
+
+    # Failing the write, changing a buffered flag while it runs:
+    apply_statuses = status.apply_statuses
+    def failing_apply_statuses(change_list):
+        write_buffer.set(user_id = 1, word_index = 2, status = "known", value = False)
+        raise RuntimeError("database is locked")
+    monkeypatch.setattr(status, "apply_statuses", failing_apply_statuses)
+    with pytest.raises(RuntimeError):
+        write_buffer.flush()
+
+    # Changes are buffered again, newer values win, and a write is scheduled:
+    assert write_buffer.pending_state(user_id = 1) == {1: {"favourite": True}, 2: {"known": False}}
+    assert write_buffer.timer is not None
+    write_buffer.timer.cancel()
+
+    # The next write stores them:
+    monkeypatch.setattr(status, "apply_statuses", apply_statuses)
+    assert write_buffer.flush() == 2
+    assert status.read_stored_state(user_id = 1, word_index = 1)["favourite"] is True
+    assert status.read_stored_state(user_id = 1, word_index = 2)["known"] is False
@@ -0,0 +1,79 @@
+# Testing framework import:
+import pytest
+
+# Database import:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+
+# Suggestion utilities import:
+from utilities import suggest
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SUGGEST FIXTURES
+
+"""
+
+
+# Suggested words: (INDEX, Hebrew headword, English translations):
+SUGGEST_WORDS: tuple[tuple[int, str, str], ...] = (
+    (1, "לִכְתֹּב", "to write"),
+    (2, "כְּתִיבָה", "writing"),
+    (3, "כּוֹתֵב", "write"),
+    (4, "בֵּית סֵפֶר", "school"),
+    )
+
+
+@pytest.fixture
+def suggest_index(application) -> suggest.SuggestIndex:
+    """
+    Adds the suggested words and builds the suggestion index over them.
+    """
+
+    # Adding words:
+    for word_index, translation_he, translation_en in SUGGEST_WORDS:
+        DATABASE.session.add(Word(
+            INDEX = word_index,
+            HTML_CONTAINER_LANG_RU = "",
+            HTML_CONTAINER_LANG_EN = "",
+            HTML_CONTAINER_LANG_HE = "",
+            TRANSLATION_LANG_HE = translation_he,
+            TRANSLATION_LANG_EN = translation_en,
+            SEARCH_LANG_HE = [translation_he],
+            SEARCH_LANG_EN = [translation_en],
+            ))
+    DATABASE.session.commit()
+
+    # Returning:
+    return suggest.build_suggest_index()
+
+
+def lookup_indexes(suggest_index: suggest.SuggestIndex, prefix: str) -> list[int]:
+    match_list = suggest_index.lookup(
+        prefix = suggest.normalize_prefix(prefix),
+        folded_prefix = suggest.hebrew.fold(text = prefix)
+        )
+    return [entry[0] for _, entry in match_list]
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SUGGEST TESTS
+
+"""
+
+
+def test_words_of_multi_word_terms_are_suggested(suggest_index):
+    assert lookup_indexes(suggest_index, "wri") == [3, 1, 2]
+    assert lookup_indexes(suggest_index, "ספר") == [4]
+
+
+def test_full_terms_are_still_suggested(suggest_index):
+    assert lookup_indexes(suggest_index, "to wr") == [1]
+    assert lookup_indexes(suggest_index, "בית ס") == [4]
+
+
+def test_suggestions_are_distinct_entries(suggest_index):
+    # "to write" is keyed by "to write", "to" and "write", but suggested once:
+    assert lookup_indexes(suggest_index, "t") == [1]
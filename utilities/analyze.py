@@ -0,0 +1,189 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database-related import:
+from sqlalchemy import literal, select, union_all
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities.database.models.form import Form
+
+# Hebrew tokenization import:
+from utilities import hebrew
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ANALYZE VARIABLES BLOCK
+
+"""
+
+
+# Input and output bounds:
+ANALYZE_TEXT_LENGTH_MAX: int = 20000
+ANALYZE_ENTRIES_PER_TOKEN: int = 5
+
+# Keys per lookup statement, keeps bound parameters under SQLite's limit on older builds:
+ANALYZE_KEYS_PER_QUERY: int = 450
+
+# Match sources, headwords are preferred over inflected forms:
+MATCH_SOURCE_HEADWORD: int = 0
+MATCH_SOURCE_FORM: int = 1
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ANALYZE FUNCTIONS BLOCK
+
+"""
+
+
+def __resolve_keys(key_list: list[str], is_folded: bool = False) -> dict[str, list[int]]:
+    """
+    Resolves normalized (or folded) keys to word indexes against headwords and inflected forms,
+    in as few indexed `IN` queries as the parameter limit allows.
+
+    :param list[str] key_list: Unique normalized keys;
+    :param bool is_folded: Whether the keys are folded (see `hebrew.fold`).
+
+    :return dict[str, list[int]]: Word indexes for every key that matched, headwords first.
+    """
+
+    # Querying keys in chunks:
+    word_key_column = Word.FOLDED_LANG_HE if is_folded else Word.NORMALIZED_LANG_HE
+    form_key_column = Form.FOLDED_LANG_HE if is_folded else Form.NORMALIZED_LANG_HE
+    key_match_list: list[tuple[str, int, int]] = []
+    for chunk_start in range(0, len(key_list), ANALYZE_KEYS_PER_QUERY):
+        key_chunk: list[str] = key_list[chunk_start:chunk_start + ANALYZE_KEYS_PER_QUERY]
+        key_match_list.extend(DATABASE.session.execute(
+            union_all(
+                select(word_key_column, Word.INDEX, literal(MATCH_SOURCE_HEADWORD))
+                .where(word_key_column.in_(key_chunk)),
+                select(form_key_column, Form.INDEX, literal(MATCH_SOURCE_FORM))
+                .where(form_key_column.in_(key_chunk)),
+                )
+            ).all())
+
+    # Grouping indexes by key:
+    key_index_map: dict[str, list[int]] = {}
+    for key, word_index, _ in sorted(key_match_list, key = lambda key_match: key_match[2]):
+        word_index_list: list[int] = key_index_map.setdefault(key, [])
+        if word_index not in word_index_list:
+            word_index_list.append(word_index)
+
+    # Returning:
+    return key_index_map
+
+
+def __load_entries(word_index_list: list[int]) -> dict[int, dict]:
+    """
+    Loads the columns shown for a matched word (no HTML containers) in one `IN` query per chunk.
+
+    :param list[int] word_index_list: Unique word indexes.
+    :return dict[int, dict]: Entries keyed by word index.
+    """
+
+    # Querying entries in chunks:
+    entry_map: dict[int, dict] = {}
+    for chunk_start in range(0, len(word_index_list), ANALYZE_KEYS_PER_QUERY):
+        word_rows = DATABASE.session.execute(
+            select(
+                Word.INDEX,
+                Word.TRANSLATION_LANG_HE,
+                Word.TRANSLATION_LANG_EN,
+                Word.TRANSLATION_LANG_RU,
+                Word.TRANSCRIPTION_LANG_EN,
+                Word.TYPE_LANG_EN,
+                )
+            .where(Word.INDEX.in_(word_index_list[chunk_start:chunk_start + ANALYZE_KEYS_PER_QUERY]))
+            ).all()
+        for word_row in word_rows:
+            entry_map[word_row.INDEX] = {
+                "index": word_row.INDEX,
+                "translation_he": word_row.TRANSLATION_LANG_HE,
+                "translation_en": word_row.TRANSLATION_LANG_EN,
+                "translation_ru": word_row.TRANSLATION_LANG_RU,
+                "transcription_en": word_row.TRANSCRIPTION_LANG_EN,
+                "type_en": word_row.TYPE_LANG_EN,
+                }
+
+    # Returning:
+    return entry_map
+
+
+def analyze_text(text: str) -> list[dict]:
+    """
+    Looks up every Hebrew word of a text in the dictionary. Each word is tried as written and
+    with up to three proclitics (ו, ה, ב, כ, ל, מ, ש) stripped, against both headwords and
+    inflected forms; the least-stripped candidate that matches as written wins, and only words
+    with no such match fall back to the spelling-insensitive keys (see `hebrew.fold`). All
+    candidates of the whole text are resolved together, so the number of queries does not grow
+    with the number of words.
+
+    ## Example:
+        >>> analyze_text("וּבַבַּיִת")[0]["proclitics"]
+        'וב'
+
+    :param str text: Running Hebrew text, truncated to `ANALYZE_TEXT_LENGTH_MAX` characters.
+    :return list[dict]: One item per word in text order, with the word, stripped proclitics
+        and matched entries (empty if nothing matched).
+    """
+
+    # Tokenizing and generating candidates for unique words:
+    token_list: list[str] = hebrew.tokenize(text[:ANALYZE_TEXT_LENGTH_MAX])
+    candidate_map: dict[str, list[tuple[str, str, str]]] = {
+        token: hebrew.generate_candidates(token)
+        for token in dict.fromkeys(token_list)
+        }
+
+    # Resolving all candidate keys as written at once:
+    key_list: list[str] = list({
+        key for candidate_list in candidate_map.values()
+        for _, key, _ in candidate_list
+        })
+    key_index_map: dict[str, list[int]] = __resolve_keys(key_list) if key_list else {}
+
+    # Picking the least-stripped matching candidate for every word:
+    resolution_map: dict[str, tuple[str, list[int]]] = {}
+    for token, candidate_list in candidate_map.items():
+        resolution_map[token] = ("", [])
+        for proclitics, key, _ in candidate_list:
+            if key in key_index_map:
+                resolution_map[token] = (proclitics, key_index_map[key][:ANALYZE_ENTRIES_PER_TOKEN])
+                break
+
+    # Resolving folded keys of unmatched words at once, picking the same way:
+    unresolved_token_list: list[str] = [token for token, (_, resolved_index_list) in resolution_map.items() if not resolved_index_list]
+    folded_key_list: list[str] = list({
+        folded_key for token in unresolved_token_list
+        for _, _, folded_key in candidate_map[token]
+        })
+    folded_key_index_map: dict[str, list[int]] = __resolve_keys(folded_key_list, is_folded = True) if folded_key_list else {}
+    for token in unresolved_token_list:
+        for proclitics, _, folded_key in candidate_map[token]:
+            if folded_key in folded_key_index_map:
+                resolution_map[token] = (proclitics, folded_key_index_map[folded_key][:ANALYZE_ENTRIES_PER_TOKEN])
+                break
+
+    # Loading matched entries at once:
+    word_index_list: list[int] = list({
+        word_index for _, resolved_index_list in resolution_map.values()
+        for word_index in resolved_index_list
+        })
+    entry_map: dict[int, dict] = __load_entries(word_index_list) if word_index_list else {}
+
+    # Composing results in text order:
+    analysis_list: list[dict] = []
+    for token in token_list:
+        proclitics, resolved_index_list = resolution_map[token]
+        analysis_list.append({
+            "token": token,
+            "proclitics": proclitics,
+            "entries": [entry_map[word_index] for word_index in resolved_index_list if word_index in entry_map],
+            })
+
+    # Logging:
+    log.info(f"Analyzed {len(token_list)} words ({len(candidate_map)} unique, {len(key_list) + len(folded_key_list)} keys)")
+
+    # Returning:
+    return analysis_list
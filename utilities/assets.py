@@ -0,0 +1,264 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# System-management, compression and hashing libraries:
+import os
+import gzip
+import hashlib
+import json
+import posixpath
+import re
+
+# Brotli is optional, only gzip variants are written without it:
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Flask-related imports:
+from flask import url_for
+
+# Settings import:
+from configuration import SETTINGS
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ASSETS VARIABLES BLOCK
+
+"""
+
+
+# Build output, relative to the static folder:
+ASSET_BUILD_PREFIX: str = "build"
+ASSET_MANIFEST_FILEPATH: str = os.path.join(SETTINGS.FOLDER_BUILD_PATH, "manifest.json")
+
+# Sources that are fingerprinted (stylesheet sources and maps are not served):
+ASSET_SUFFIXES: frozenset[str] = frozenset((
+    ".css", ".js", ".svg", ".png", ".jpg", ".ico", ".ttf", ".otf", ".woff", ".woff2",
+    ))
+ASSET_COMPRESSIBLE_SUFFIXES: frozenset[str] = frozenset((
+    ".css", ".js", ".svg", ".ttf", ".otf",
+    ))
+ASSET_HASH_LENGTH: int = 10
+
+# Precompressed variants, in order of preference, with their file suffix:
+ASSET_ENCODINGS: tuple[tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+ASSET_GZIP_LEVEL: int = 9
+ASSET_BROTLI_QUALITY: int = 11
+
+# Fingerprinted files never change under the same name:
+ASSET_MAX_AGE: int = 365 * 24 * 60 * 60
+
+# References inside stylesheets:
+ASSET_CSS_URL_PATTERN = re.compile(r"""url\(\s*(["']?)([^"')]+)\1\s*\)""")
+
+# Manifest loaded by the running process, reloaded when the file changes:
+__MANIFEST_STATE: dict = {"mtime": None, "map": {}, "version": ""}
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ASSETS BUILD FUNCTIONS
+
+"""
+
+
+def __collect_sources() -> list[str]:
+    """
+    Lists static files to fingerprint, as paths relative to the static folder (with `/`).
+    Stylesheets come last, so the files they reference are already in the manifest.
+    """
+
+    # Walking static folder, skipping the build output:
+    source_list: list[str] = []
+    for folder_path, folder_names, file_names in os.walk(SETTINGS.FOLDER_STATIC_PATH):
+        folder_names[:] = [
+            folder_name for folder_name in folder_names
+            if os.path.join(folder_path, folder_name) != SETTINGS.FOLDER_BUILD_PATH
+            ]
+        for file_name in file_names:
+            if os.path.splitext(file_name)[1].lower() in ASSET_SUFFIXES:
+                relative_path: str = os.path.relpath(os.path.join(folder_path, file_name), SETTINGS.FOLDER_STATIC_PATH)
+                source_list.append(relative_path.replace(os.sep, "/"))
+
+    # Returning:
+    return sorted(source_list, key = lambda source: (source.endswith(".css"), source))
+
+
+def __rewrite_css_urls(css_text: str, source: str, manifest: dict[str, str]) -> str:
+    """
+    Points `url(...)` references of a stylesheet (absolute `/static/...` or relative to it) at
+    the fingerprinted files. Data URIs, external URLs and unknown files are left as they are.
+    """
+
+    # Replacing references found in the manifest:
+    def replace_url(url_match: re.Match) -> str:
+        reference: str = url_match.group(2).strip()
+        if reference.startswith("/static/"):
+            target: str = reference[len("/static/"):]
+        elif ":" in reference or reference.startswith(("/", "#")):
+            return url_match.group(0)
+        else:
+            target: str = posixpath.normpath(posixpath.join(posixpath.dirname(source), reference))
+        target_path: str = target.partition("?")[0]
+        if target_path not in manifest:
+            return url_match.group(0)
+        return f'url("/static/{manifest[target_path]}")'
+
+    # Returning:
+    return ASSET_CSS_URL_PATTERN.sub(replace_url, css_text)
+
+
+def __write_asset(output_path: str, data: bytes, compress: bool) -> None:
+    """
+    Writes a fingerprinted file and its precompressed variants, skipping files that already
+    exist (same name means same content).
+    """
+
+    # Writing original:
+    if os.path.exists(output_path):
+        return
+    os.makedirs(os.path.dirname(output_path), exist_ok = True)
+    with open(output_path, "wb") as output_file:
+        output_file.write(data)
+    if not compress:
+        return
+
+    # Writing compressed variants, only where they are smaller:
+    for encoding, encoding_suffix in ASSET_ENCODINGS:
+        if encoding == "br" and brotli is None:
+            continue
+        if encoding == "br":
+            compressed_data: bytes = brotli.compress(data, quality = ASSET_BROTLI_QUALITY)
+        else:
+            compressed_data: bytes = gzip.compress(data, compresslevel = ASSET_GZIP_LEVEL, mtime = 0)
+        if len(compressed_data) < len(data):
+            with open(output_path + encoding_suffix, "wb") as output_file:
+                output_file.write(compressed_data)
+
+
+def build_assets() -> dict[str, str]:
+    """
+    Copies every static asset to `static/build/` under a content-hashed name (`css/word.css` →
+    `build/css/word.3f2a1b9c0d.css`), writes gzip (and brotli, when installed) variants of text
+    assets and fonts, and saves the manifest. Stylesheet references to other assets are
+    rewritten first, so a changed font also changes the stylesheets using it. Files of previous
+    builds are removed. Runs at application start; after editing assets of a running
+    application, run `python -m utilities.assets`.
+
+    :return dict[str, str]: Manifest, source path → fingerprinted path (both static-relative).
+    """
+
+    # Fingerprinting sources:
+    manifest: dict[str, str] = {}
+    for source in __collect_sources():
+        with open(os.path.join(SETTINGS.FOLDER_STATIC_PATH, source), "rb") as source_file:
+            data: bytes = source_file.read()
+        source_stem, source_suffix = posixpath.splitext(source)
+        if source_suffix == ".css":
+            data = __rewrite_css_urls(css_text = data.decode("utf-8"), source = source, manifest = manifest).encode("utf-8")
+        content_hash: str = hashlib.sha256(data).hexdigest()[:ASSET_HASH_LENGTH]
+        manifest[source] = f"{ASSET_BUILD_PREFIX}/{source_stem}.{content_hash}{source_suffix}"
+        __write_asset(
+            output_path = os.path.join(SETTINGS.FOLDER_STATIC_PATH, *manifest[source].split("/")),
+            data = data,
+            compress = source_suffix in ASSET_COMPRESSIBLE_SUFFIXES
+            )
+
+    # Removing files of previous builds:
+    kept_paths: set[str] = {ASSET_MANIFEST_FILEPATH}
+    for built_path in manifest.values():
+        output_path: str = os.path.join(SETTINGS.FOLDER_STATIC_PATH, *built_path.split("/"))
+        kept_paths.add(output_path)
+        kept_paths.update(output_path + encoding_suffix for _, encoding_suffix in ASSET_ENCODINGS)
+    removed_count: int = 0
+    for folder_path, _, file_names in os.walk(SETTINGS.FOLDER_BUILD_PATH):
+        for file_name in file_names:
+            if os.path.join(folder_path, file_name) not in kept_paths:
+                os.remove(os.path.join(folder_path, file_name))
+                removed_count += 1
+
+    # Saving manifest:
+    os.makedirs(SETTINGS.FOLDER_BUILD_PATH, exist_ok = True)
+    with open(ASSET_MANIFEST_FILEPATH, "w", encoding = "UTF-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent = 2, sort_keys = True)
+
+    # Logging:
+    log.info(f"Built {len(manifest)} fingerprinted assets ({removed_count} outdated files removed)")
+
+    # Returning:
+    return manifest
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ASSETS LOOKUP FUNCTIONS
+
+"""
+
+
+def read_manifest() -> dict[str, str]:
+    """
+    Returns the asset manifest, reloading it if the file changed since it was last read (one
+    `stat` call otherwise). Empty if the assets were never built.
+
+    :return dict[str, str]: Source path → fingerprinted path.
+    """
+
+    # Checking manifest file:
+    try:
+        manifest_mtime: float = os.stat(ASSET_MANIFEST_FILEPATH).st_mtime
+    except OSError:
+        return {}
+
+    # Reloading changed manifest:
+    if __MANIFEST_STATE["mtime"] != manifest_mtime:
+        with open(ASSET_MANIFEST_FILEPATH, "rb") as manifest_file:
+            manifest_data: bytes = manifest_file.read()
+        __MANIFEST_STATE["map"] = json.loads(manifest_data)
+        __MANIFEST_STATE["version"] = hashlib.sha256(manifest_data).hexdigest()[:ASSET_HASH_LENGTH]
+        __MANIFEST_STATE["mtime"] = manifest_mtime
+
+    # Returning:
+    return __MANIFEST_STATE["map"]
+
+
+def manifest_version() -> str:
+    """
+    Returns a hash of the asset manifest, which changes whenever any fingerprinted asset does.
+    Pages cached or tagged without their content (see `routes.word`) include it, so they never
+    point at the asset URLs of a previous build.
+
+    :return str: Manifest hash, empty if the assets were never built.
+    """
+
+    # Reloading manifest if needed:
+    if not read_manifest():
+        return ""
+
+    # Returning:
+    return __MANIFEST_STATE["version"]
+
+
+def asset_url(filename: str) -> str:
+    """
+    Template helper replacing `url_for('static', filename=...)`: links the fingerprinted copy
+    of an asset, or the plain file if it was not built.
+
+    ## Example:
+        >>> asset_url("css/word.css")
+        '/static/build/css/word.3f2a1b9c0d.css'
+
+    :param str filename: Asset path relative to the static folder.
+    :return str: Asset URL.
+    """
+
+    # Returning:
+    return url_for("static", filename = read_manifest().get(filename, filename))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level = logging.INFO)
+    build_assets()
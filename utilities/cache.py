@@ -0,0 +1,226 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Threading and timing imports:
+import threading
+import time
+
+# Ordered mapping import:
+from collections import OrderedDict
+
+# Typing and annotations import:
+from typing import Any, Callable, Hashable
+
+# Database-related import:
+from utilities.database import scripts
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+VERSIONED CACHE CLASS INSTANCE
+
+"""
+
+
+class VersionedCache:
+    """
+    Holds a single in-memory structure derived from the database and rebuilds it whenever its
+    version stamp changes (by default the dictionary version). The structure is built at most
+    once per version per process, even if several requests miss at the same time.
+
+    Attributes:
+        name (str): Name used in log messages
+        loader (Callable): Function building the structure (called inside an app context)
+        version_reader (Callable): Function returning the current version stamp
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any], version_reader: Callable[[], Any] = scripts.read_dictionary_version):
+        """
+        Initialize an empty cache.
+
+        :param str name: Name used in log messages;
+        :param Callable loader: Function building the structure from the database;
+        :param Callable version_reader: Function returning a cheap stamp that changes whenever
+            the structure must be rebuilt.
+        """
+
+        # Core attributes:
+        self.name: str = name
+        self.loader: Callable[[], Any] = loader
+        self.version_reader: Callable[[], Any] = version_reader
+
+        # State attributes:
+        self.value: Any = None
+        self.version: Any = None
+        self.lock = threading.Lock()
+
+
+    def get(self) -> Any:
+        """
+        Returns the cached structure, rebuilding it first if the version stamp changed.
+
+        :return Any: Structure built by the loader for the current version.
+        """
+
+        # Rebuilding on version change (double-checked, so only one thread loads):
+        current_version: Any = self.version_reader()
+        if self.version != current_version:
+            with self.lock:
+                if self.version != current_version:
+                    start_time: float = time.perf_counter()
+                    self.value = self.loader()
+                    self.version = current_version
+
+                    # Logging:
+                    elapsed_time: float = (time.perf_counter() - start_time) * 1000
+                    log.info(f"Built '{self.name}' for version {current_version} in {elapsed_time:.1f}ms")
+
+        # Returning:
+        return self.value
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RENDER CACHE CLASS INSTANCE
+
+"""
+
+
+class RenderCache:
+    """
+    Least-recently-used cache of rendered pages (text or bytes), bounded by their total size.
+    Entries are keyed by a group (e.g. a word index) and a variant within it (e.g. language,
+    dictionary version and statuses). Pages are never dropped explicitly: a change of the data
+    a page is rendered from changes its variant, and stale variants age out as least recently
+    used. Concurrent misses for the same entry are coalesced: one request renders, the others
+    wait for its result.
+
+    Attributes:
+        name (str): Name used in log messages
+        byte_limit (int): Maximum total size of stored pages, text counted in UTF-8 bytes
+        hit_count (int): Requests served from the cache
+        miss_count (int): Requests that rendered the page
+        coalesced_count (int): Requests that waited for a render in progress
+        eviction_count (int): Entries dropped to stay within `byte_limit`
+    """
+
+    def __init__(self, name: str, byte_limit: int):
+        """
+        Initialize an empty cache.
+
+        :param str name: Name used in log messages;
+        :param int byte_limit: Maximum total size of stored pages, text counted in UTF-8 bytes.
+        """
+
+        # Core attributes:
+        self.name: str = name
+        self.byte_limit: int = byte_limit
+
+        # State attributes:
+        self.entries: OrderedDict = OrderedDict()
+        self.pending_map: dict[tuple, dict] = {}
+        self.byte_count: int = 0
+        self.lock = threading.Lock()
+
+        # Counters:
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.coalesced_count: int = 0
+        self.eviction_count: int = 0
+
+
+    def __store(self, key: tuple, page: str | bytes) -> None:
+        """
+        Stores a rendered page as the most recent entry and evicts the least recent ones until
+        the cache fits its byte limit. Must be called with the lock held.
+        """
+
+        # Skipping pages that would not fit at all:
+        page_size: int = len(page.encode("utf-8") if isinstance(page, str) else page)
+        if page_size > self.byte_limit:
+            return
+
+        # Storing entry:
+        self.entries[key] = (page, page_size)
+        self.byte_count += page_size
+
+        # Evicting least recently used entries:
+        while self.byte_count > self.byte_limit:
+            _, (_, evicted_size) = self.entries.popitem(last = False)
+            self.byte_count -= evicted_size
+            self.eviction_count += 1
+
+
+    def get(self, group: Hashable, variant: Hashable, render: Callable[[], str | bytes]) -> str | bytes:
+        """
+        Returns the cached page for a group and variant, rendering and storing it on a miss. If
+        another request is already rendering the same entry, waits for it instead of rendering
+        again; errors raised by that render (e.g. a 404 abort) are raised here as well.
+
+        :param Hashable group: Group the page belongs to (e.g. a word index);
+        :param Hashable variant: Variant within the group (e.g. language and version);
+        :param Callable render: Function rendering the page, called in the current request.
+
+        :return str | bytes: Rendered page.
+        """
+
+        # Serving a stored entry or joining a render in progress:
+        key: tuple = (group, variant)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hit_count += 1
+                return self.entries[key][0]
+            pending: dict = self.pending_map.get(key)
+            if pending is None:
+                pending = {
+                    "event": threading.Event(),
+                    "page": None,
+                    "error": None,
+                    }
+                self.pending_map[key] = pending
+                self.miss_count += 1
+                is_leader: bool = True
+            else:
+                self.coalesced_count += 1
+                is_leader: bool = False
+
+        # Waiting for the leading request:
+        if not is_leader:
+            pending["event"].wait()
+            if pending["error"] is not None:
+                raise pending["error"]
+            return pending["page"]
+
+        # Rendering and publishing the result:
+        try:
+            page: str | bytes = render()
+            pending["page"] = page
+            with self.lock:
+                self.__store(key = key, page = page)
+            return page
+        except Exception as exception_error:
+            pending["error"] = exception_error
+            raise
+        finally:
+            with self.lock:
+                self.pending_map.pop(key, None)
+            pending["event"].set()
+
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Counters and current size, for logging and status pages.
+        """
+
+        # Returning:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.byte_count,
+            "hits": self.hit_count,
+            "misses": self.miss_count,
+            "coalesced": self.coalesced_count,
+            "evictions": self.eviction_count,
+            }
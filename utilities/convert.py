@@ -6,7 +6,7 @@ log = logging.getLogger(__name__)
 import json
 
 # Typing and annotations:
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Threaded composition library:
 import os
@@ -16,8 +16,17 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from configuration import SETTINGS
 
 # Database-related import:
+from sqlalchemy import insert
 from utilities.database import DATABASE
 from utilities.database.models.word import Word
+from utilities.database.models.form import Form
+from utilities.database.models.link import Link
+from utilities.database.models.similar import Similar
+from utilities.database import scripts
+
+# Hebrew normalization, minification and similarity import:
+from utilities import hebrew, minify
+from utilities.similar import compute_similar_words
 
 
 """
@@ -50,6 +59,10 @@ class Converter:
         # Core attributes:
         self.json_filepath: str = json_filepath
         self.json_data: Dict = self.__load_data()
+
+        # Derived entries, collected while composing:
+        self.form_entry_list: List[Form] = []
+        self.link_entry_list: List[Link] = []
     
 
     def __load_data(self) -> Dict:
@@ -115,13 +128,59 @@ class Converter:
             return None
         
     
-    def __compose(self, word_instance: Word) -> None:
+    def __compose(self, word_instance: Word) -> Tuple[List[Form], List[Link], int, int]:
         """
-        TODO: Create a docstring.
+        Compose a Word instance's extracted attributes, build entries for its inflected forms and
+        cross-references, and slim its HTML containers (see `utilities.minify`).
+        
+        :param Word word_instance: Word model instance with HTML containers populated.
+        
+        :return Tuple[List[Form], List[Link], int, int]: Form model instances for every inflected
+            form of the word, Link model instances for every entry it links to, and container
+            sizes in bytes before and after slimming.
         """
 
         # Running compose method on word instance:
         word_instance.compose()
+
+        # Building inflected form entries:
+        form_entry_list: List[Form] = [
+            Form(
+                INDEX = word_instance.INDEX,
+                FORM_KEY = form_key,
+                FORM_LANG_HE = form_text,
+                NORMALIZED_LANG_HE = hebrew.normalize(text = form_text),
+                FOLDED_LANG_HE = hebrew.fold(text = form_text),
+                )
+            for form_key, form_text in word_instance.compose_forms()
+            ]
+
+        # Building cross-reference entries:
+        link_entry_list: List[Link] = [
+            Link(
+                SOURCE_INDEX = word_instance.INDEX,
+                TARGET_INDEX = target_index,
+                LINK_TEXT = link_text,
+                LINK_SECTION = link_section,
+                )
+            for target_index, link_text, link_section in word_instance.compose_links()
+            ]
+
+        # Slimming containers once everything has been extracted from them:
+        container_size: int = 0
+        container_slim_size: int = 0
+        for container_attribute in ("HTML_CONTAINER_LANG_RU", "HTML_CONTAINER_LANG_EN", "HTML_CONTAINER_LANG_HE"):
+            html_container: str = getattr(word_instance, container_attribute) or ""
+            html_container_slim: str = minify.minify_container(html_container = html_container) or ""
+            setattr(word_instance, container_attribute, html_container_slim)
+            container_size += len(html_container.encode())
+            container_slim_size += len(html_container_slim.encode())
+
+        # Logging:
+        log.debug(f"Slimmed containers of word {word_instance.INDEX}: {container_size} -> {container_slim_size} bytes")
+
+        # Returning:
+        return form_entry_list, link_entry_list, container_size, container_slim_size
     
     
     def __convert(self) -> List[Word]:
@@ -156,11 +215,17 @@ class Converter:
         # Running compose() concurrently on threads:
         max_workers: int = min(32, (os.cpu_count() or 1) * 2)     # <- For better machines
         # max_workers: int = 4                                      # <- For my old potato
+        container_size_total: int = 0
+        container_slim_size_total: int = 0
         with ThreadPoolExecutor(max_workers = max_workers) as executor:
             futures = [executor.submit(self.__compose, word_instance) for word_instance in word_entry_list]
             for future in as_completed(futures):
                 try:
-                    future.result()
+                    form_entry_list, link_entry_list, container_size, container_slim_size = future.result()
+                    self.form_entry_list.extend(form_entry_list)
+                    self.link_entry_list.extend(link_entry_list)
+                    container_size_total += container_size
+                    container_slim_size_total += container_slim_size
 
                 # Logging error:
                 except Exception as exception_error:
@@ -169,6 +234,11 @@ class Converter:
         # Logging:
         word_entry_count: int = len(word_entry_list)
         log.info(f"Converted {word_entry_count} entries to model instances")
+        if container_size_total:
+            log.info(
+                f"Slimmed containers from {container_size_total} to {container_slim_size_total} bytes "
+                f"(saved {100 * (container_size_total - container_slim_size_total) / container_size_total:.1f}%)"
+                )
         
         # Returning:
         return word_entry_list
@@ -228,6 +298,64 @@ class Converter:
         # Logging:
         log.info(f"Entries total saved to database: {word_entry_saved_count} records")
 
+        # Replacing inflected forms of the previous build:
+        try:
+            Form.query.delete()
+            DATABASE.session.bulk_save_objects(self.form_entry_list)
+            DATABASE.session.commit()
+            log.info(f"Inflected forms saved to database: {len(self.form_entry_list)} records")
+        except Exception as exception_error:
+            DATABASE.session.rollback()
+            log.error(f"Error saving inflected forms: {exception_error}")
+
+        # Replacing cross-references of the previous build:
+        try:
+            Link.query.delete()
+            DATABASE.session.bulk_save_objects(self.link_entry_list)
+            DATABASE.session.commit()
+            log.info(f"Cross-references saved to database: {len(self.link_entry_list)} records")
+        except Exception as exception_error:
+            DATABASE.session.rollback()
+            log.error(f"Error saving cross-references: {exception_error}")
+
+        # Reporting links to entries that are not in the dictionary:
+        dangling_link_count: int = scripts.count_dangling_links()
+        if dangling_link_count:
+            log.warning(f"Found {dangling_link_count} cross-references to missing entries")
+
+        # Replacing precomputed similar words of the previous build:
+        try:
+            similar_list: List[tuple] = compute_similar_words(
+                entry_list = (
+                    (word_instance.INDEX, word_instance.SEARCH_LANG_EN, word_instance.SEARCH_LANG_RU)
+                    for word_instance in word_entry_list
+                    )
+                )
+            Similar.query.delete()
+            if similar_list:
+                DATABASE.session.execute(
+                    insert(Similar),
+                    [
+                        {"INDEX": word_index, "SIMILAR_INDEX": similar_index, "SCORE": score}
+                        for word_index, similar_index, score in similar_list
+                        ]
+                    )
+            DATABASE.session.commit()
+            log.info(f"Similar words saved to database: {len(similar_list)} records")
+        except Exception as exception_error:
+            DATABASE.session.rollback()
+            log.error(f"Error saving similar words: {exception_error}")
+
+        # Keeping full-text search and root family indexes in sync with saved entries:
+        scripts.rebuild_search_index()
+        scripts.rebuild_root_index()
+
+        # Marking in-memory dictionary structures as stale:
+        dictionary_version: int = scripts.bump_dictionary_version()
+
+        # Materialising counters for the new dictionary version:
+        scripts.rebuild_statistics(dictionary_version = dictionary_version)
+
         # Returning:
         return word_entry_saved_count
 
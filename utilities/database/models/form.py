@@ -0,0 +1,37 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer, String
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FORM DATABASE MODEL
+
+"""
+
+
+class Form(DATABASE.Model):
+    """
+    Inflected form of a word (conjugation or declension table cell), mapped back to the word's
+    Pealim index. Rows are derived from `Word.HTML_CONTAINER_LANG_HE` at convert time and let
+    search resolve any surface form with a single indexed lookup.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "forms"
+    
+    # Core attributes:
+    ID = Column(Integer, primary_key = True, nullable = False, unique = True, autoincrement = True)
+    INDEX = Column(Integer, nullable = False, index = True)
+
+    # Form attributes:
+    FORM_KEY = Column(String, nullable = True)                              # <- Pealim cell id, e.g. "PERF-1s"
+    FORM_LANG_HE = Column(String, nullable = False, index = True)           # <- Vocalised form (NFC)
+    NORMALIZED_LANG_HE = Column(String, nullable = True, index = True)      # <- See `utilities.hebrew.normalize`
+    FOLDED_LANG_HE = Column(String, nullable = True, index = True)          # <- See `utilities.hebrew.fold`
@@ -0,0 +1,36 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer, String
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+LINK DATABASE MODEL
+
+"""
+
+
+class Link(DATABASE.Model):
+    """
+    Cross-reference between two dictionary entries, taken from the internal `/dictionary/...`
+    links of the word's containers at convert time. Indexed on both ends, so "related entries"
+    (outgoing) and "linked from" (incoming) are each a single indexed lookup.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "links"
+    
+    # Core attributes:
+    ID = Column(Integer, primary_key = True, nullable = False, unique = True, autoincrement = True)
+    SOURCE_INDEX = Column(Integer, nullable = False, index = True)
+    TARGET_INDEX = Column(Integer, nullable = False, index = True)
+
+    # Link context attributes:
+    LINK_TEXT = Column(String, nullable = True)                             # <- Anchor text
+    LINK_SECTION = Column(String, nullable = True)                          # <- Nearest preceding heading
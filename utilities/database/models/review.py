@@ -0,0 +1,48 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer, Float, String, Index, text
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+REVIEW DATABASE MODEL
+
+"""
+
+
+class Review(DATABASE.Model):
+    """
+    Spaced-repetition schedule of one card for one learner. A card is a dictionary word
+    (`ITEM_KIND = "word"`, `ITEM_ID` = `words.INDEX`) or a practice entry (`"input"`,
+    `inputs.ID`). The table has no rowid, and the due index holds the key, so the next due cards
+    of a learner are one range of `ix_reviews_due` and grading rewrites one row found by key
+    (see `utilities.srs`).
+    """
+
+    # Assigning table name:
+    __tablename__: str = "reviews"
+
+    # Core attributes:
+    USER_ID = Column(Integer, primary_key = True, nullable = False)         # <- `users.ID`
+    ITEM_KIND = Column(String, primary_key = True, nullable = False)        # <- "word" or "input"
+    ITEM_ID = Column(Integer, primary_key = True, nullable = False)         # <- `words.INDEX` or `inputs.ID`
+
+    # Schedule attributes (SM-2):
+    INTERVAL = Column(Integer, nullable = False, default = 0, server_default = text("0"))           # <- Days
+    EASE = Column(Float, nullable = False, default = 2.5, server_default = text("2.5"))
+    REPETITIONS = Column(Integer, nullable = False, default = 0, server_default = text("0"))
+    LAPSES = Column(Integer, nullable = False, default = 0, server_default = text("0"))
+    DUE_AT = Column(Integer, nullable = False)                              # <- Unix time
+    REVIEWED_AT = Column(Integer, nullable = True)                          # <- Unix time
+
+    # Clustered on the key, with the due queue of every learner:
+    __table_args__: tuple = (
+        Index("ix_reviews_due", "USER_ID", "DUE_AT"),
+        {"sqlite_with_rowid": False},
+        )
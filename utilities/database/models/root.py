@@ -0,0 +1,31 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer, String
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROOT DATABASE MODEL
+
+"""
+
+
+class Root(DATABASE.Model):
+    """
+    Root (shoresh) family with its precomputed size. Rows are aggregated from
+    `Word.ROOT_LANG_HE` at convert time, so family pages and counts never scan `words`.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "roots"
+    
+    # Core attributes:
+    ID = Column(Integer, primary_key = True, nullable = False, unique = True, autoincrement = True)
+    ROOT_LANG_HE = Column(String, nullable = False, unique = True)         # <- See `utilities.hebrew.normalize_root`
+    WORD_COUNT = Column(Integer, nullable = False, default = 0)
@@ -0,0 +1,32 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Float, Integer
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SIMILAR DATABASE MODEL
+
+"""
+
+
+class Similar(DATABASE.Model):
+    """
+    Precomputed nearest neighbour of a word by translation similarity (see `utilities.similar`).
+    Rows are rebuilt at convert time, so the "similar meaning" panel is a single indexed read.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "similar_words"
+    
+    # Core attributes:
+    ID = Column(Integer, primary_key = True, nullable = False, unique = True, autoincrement = True)
+    INDEX = Column(Integer, nullable = False, index = True)
+    SIMILAR_INDEX = Column(Integer, nullable = False)
+    SCORE = Column(Float, nullable = False)                                 # <- Cosine similarity, 0..1
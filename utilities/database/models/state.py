@@ -0,0 +1,46 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer, Boolean, Index, text
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+USER WORD STATE DATABASE MODEL
+
+"""
+
+
+class UserWordState(DATABASE.Model):
+    """
+    Learning state of one word for one learner. Words without a row have no flags set. The table
+    has no rowid, so rows are stored in `(USER_ID, INDEX)` order and a learner's state for a page
+    of words is one range of the primary key. The partial indexes hold only flagged rows and
+    include the key, so status listings are answered from the index alone. Status writes never
+    touch the shared `words` table.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "user_word_state"
+    
+    # Core attributes:
+    USER_ID = Column(Integer, primary_key = True, nullable = False)         # <- `users.ID`
+    INDEX = Column(Integer, primary_key = True, nullable = False)           # <- `words.INDEX`
+
+    # Status attributes:
+    STATUS_FAVOURITE = Column(Boolean, nullable = False, default = False, server_default = text("0"))
+    STATUS_TO_LEARN = Column(Boolean, nullable = False, default = False, server_default = text("0"))
+    STATUS_KNOWN = Column(Boolean, nullable = False, default = False, server_default = text("0"))
+
+    # Clustered on the key, with covering partial indexes per flag:
+    __table_args__: tuple = (
+        Index("ix_user_word_state_favourite", "USER_ID", "INDEX", sqlite_where = text('"STATUS_FAVOURITE" = 1')),
+        Index("ix_user_word_state_to_learn", "USER_ID", "INDEX", sqlite_where = text('"STATUS_TO_LEARN" = 1')),
+        Index("ix_user_word_state_known", "USER_ID", "INDEX", sqlite_where = text('"STATUS_KNOWN" = 1')),
+        {"sqlite_with_rowid": False},
+        )
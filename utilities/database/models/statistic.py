@@ -0,0 +1,31 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer, String
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATISTIC DATABASE MODEL
+
+"""
+
+
+class Statistic(DATABASE.Model):
+    """
+    Materialised counter (total words, inputs, words per part of speech and per status). Rows
+    are aggregated at rebuild time and kept current by the writes themselves (see
+    `utilities.statistics`), so pages never run `COUNT(*)` to show them.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "statistics"
+    
+    # Core attributes:
+    KEY = Column(String, primary_key = True, nullable = False)               # <- e.g. "words", "pos:Verb"
+    VALUE = Column(Integer, nullable = False, default = 0)
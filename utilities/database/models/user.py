@@ -0,0 +1,34 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Database types:
+from sqlalchemy import Column, Integer
+
+# Database import:
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+USER DATABASE MODEL
+
+"""
+
+
+class User(DATABASE.Model):
+    """
+    Local learner, created on the first status change of a browser session and remembered by
+    the session cookie (see `utilities.users`). There are no accounts: the row only numbers the
+    learner, so their state rows stay small.
+    """
+    
+    # Assigning table name:
+    __tablename__: str = "users"
+    
+    # Core attributes:
+    ID = Column(Integer, primary_key = True, nullable = False, unique = True, autoincrement = True)
+    CREATED_AT = Column(Integer, nullable = False)                          # <- Unix time
+
+    # Cache attributes:
+    STATE_VERSION = Column(Integer, nullable = True, default = 0)           # <- Bumped by status changes
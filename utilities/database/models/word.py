@@ -3,18 +3,24 @@ import logging
 log = logging.getLogger(__name__)
 
 # Database types:
-from sqlalchemy import Column, Integer, String, JSON, Boolean
+from sqlalchemy import Column, Integer, String, JSON
 from sqlalchemy.orm import validates
 
 # Typing and annotations import
 from typing import Optional
 
+# Regex-related library:
+import re
+
 # HTML composition related imports:
 from bs4 import BeautifulSoup
 
 # Database import:
 from utilities.database import DATABASE
 
+# Hebrew normalization and paradigm import:
+from utilities import hebrew, paradigm
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -53,11 +59,13 @@ class Word(DATABASE.Model):
     SEARCH_LANG_HE = Column(JSON, nullable = True)
     SEARCH_LANG_RU = Column(JSON, nullable = True)
     SEARCH_LANG_EN = Column(JSON, nullable = True)
+    NORMALIZED_LANG_HE = Column(String, nullable = True, index = True)
+    FOLDED_LANG_HE = Column(String, nullable = True, index = True)          # <- See `utilities.hebrew.fold`
+    MATCH_TERMS = Column(JSON, nullable = True)                             # <- Lowercased search tokens and transcriptions
+    ROOT_LANG_HE = Column(String, nullable = True, index = True)
+    PARADIGM = Column(JSON, nullable = True)                                # <- See `utilities.paradigm`
 
-    # Status attributes:
-    STATUS_FAVOURITE = Column(Boolean, nullable = True, default = False)
-    STATUS_TO_LEARN = Column(Boolean, nullable = True, default = False)
-    STATUS_KNOWN = Column(Boolean, nullable = True, default = False)
+    # Learning statuses are kept per learner in `user_word_state` (see `utilities.status`).
 
 
     """
@@ -423,6 +431,98 @@ class Word(DATABASE.Model):
         return None
 
     
+    def __compose_root(self, html_container: Optional[str]) -> Optional[str]:
+        """
+        Extracts the root (shoresh) stated in the container's part-of-speech paragraph. Pealim
+        writes it as dash-separated letters inside a `.menukad` span (e.g. `"כ - ת - ב"`).
+
+        :param Optional[str] html_container: HTML container to search.
+        :return Optional[str]: Canonical root (see `utilities.hebrew.normalize_root`), or None if
+            the word has no stated root.
+        """
+
+        # Returning None, if HTML container does not exist:
+        if not html_container:
+            return None
+
+        # Attempting to find the dash-separated root letters:
+        try:
+            soup = BeautifulSoup(html_container, "html.parser")
+            root_pattern = re.compile(r"^[\u05d0-\u05ea](?:\s*-\s*[\u05d0-\u05ea])+$")
+            for paragraph in soup.find_all("p"):
+                for menukad in paragraph.find_all(class_ = "menukad"):
+                    root_text: str = menukad.get_text(strip = True)
+                    if root_pattern.match(root_text):
+                        return hebrew.normalize_root(text = root_text)
+
+        # Handling exception errors and logging:
+        except Exception as exception_error:
+            log.warning(f"Failed to extract root for Word ID={self.ID}: {exception_error}")
+
+        # Returning none, if failed to compose:
+        return None
+
+
+    def compose_forms(self) -> list[tuple[str, str]]:
+        """
+        Lists every inflected form of the composed paradigm (see `utilities.paradigm`). Pealim
+        renders each table cell as an element with an `id` naming the grammatical slot (e.g.
+        `PERF-1s`, `AP-ms`, `s`, `pc`) that holds the vocalised form in a `.menukad` element.
+
+        :return list[tuple[str, str]]: Pairs of cell id and NFC-normalized vocalised form, without
+            duplicates. Empty if the word has no paradigm.
+        """
+
+        # Flattening paradigm cells:
+        form_list: list[tuple[str, str]] = []
+        for cell_id, cell_form_list, _ in self.PARADIGM or ():
+            for form_text in cell_form_list:
+                form_pair: tuple[str, str] = (cell_id, form_text)
+                if form_pair not in form_list:
+                    form_list.append(form_pair)
+
+        # Returning:
+        return form_list
+
+
+    def compose_links(self) -> list[tuple[int, str, Optional[str]]]:
+        """
+        Extracts internal cross-references from the containers. `__clean_dictionary` rewrites
+        Pealim's `/dict/NNNN` links to `/dictionary/{language}/NNNN`, so the target index is read
+        straight from the `href`. English containers are read first, so their anchor text wins
+        when the same target is linked in several languages.
+
+        :return list[tuple[int, str, Optional[str]]]: Target index, anchor text and the nearest
+            preceding heading for every distinct target, self-links excluded.
+        """
+
+        # Attempting to collect links from every container:
+        link_map: dict[int, tuple[int, str, Optional[str]]] = {}
+        link_pattern = re.compile(r"^/dictionary/(?:ru|en|he)/(\d+)$")
+        for html_container in (self.HTML_CONTAINER_LANG_EN, self.HTML_CONTAINER_LANG_HE, self.HTML_CONTAINER_LANG_RU):
+            if not html_container:
+                continue
+            try:
+                soup = BeautifulSoup(html_container, "html.parser")
+                for anchor in soup.find_all("a", href = link_pattern):
+                    target_index: int = int(link_pattern.match(anchor["href"]).group(1))
+                    if target_index == self.INDEX or target_index in link_map:
+                        continue
+                    heading = anchor.find_previous(["h2", "h3", "h4"])
+                    link_map[target_index] = (
+                        target_index,
+                        anchor.get_text(" ", strip = True),
+                        heading.get_text(" ", strip = True) if heading else None,
+                        )
+
+            # Handling exception errors and logging:
+            except Exception as exception_error:
+                log.warning(f"Failed to extract links for Word ID={self.ID}: {exception_error}")
+
+        # Returning:
+        return list(link_map.values())
+
+    
     def compose(self) -> None:
         """
         TODO: Create a docstring.
@@ -450,6 +550,20 @@ class Word(DATABASE.Model):
             translation_text = self.TRANSLATION_LANG_RU
             )
         
+        # Composing niqqud-insensitive Hebrew search keys, as written and spelling-insensitive:
+        self.NORMALIZED_LANG_HE: Optional[str] = hebrew.normalize(
+            text = self.TRANSLATION_LANG_HE
+            )
+        self.FOLDED_LANG_HE: Optional[str] = hebrew.fold(
+            text = self.TRANSLATION_LANG_HE
+            )
+        
+        # Extracting root, falling back to English container:
+        self.ROOT_LANG_HE: Optional[str] = (
+            self.__compose_root(html_container = self.HTML_CONTAINER_LANG_HE)
+            or self.__compose_root(html_container = self.HTML_CONTAINER_LANG_EN)
+            )
+        
         # Finding transcription elements and extracting text:
         self.TRANSCRIPTION_LANG_HE: str = self.__compose_transcription(
             html_container = self.HTML_CONTAINER_LANG_HE
@@ -471,4 +585,34 @@ class Word(DATABASE.Model):
         self.TYPE_LANG_RU: str = self.__compose_type(
             html_container = self.HTML_CONTAINER_LANG_RU
             )
+
+        # Lowercasing match terms of all languages (SQLite's `lower()` only folds ASCII):
+        self.MATCH_TERMS: Optional[list[str]] = sorted({
+            term.lower()
+            for term in (
+                *(self.SEARCH_LANG_HE or ()),
+                *(self.SEARCH_LANG_EN or ()),
+                *(self.SEARCH_LANG_RU or ()),
+                self.TRANSCRIPTION_LANG_HE,
+                self.TRANSCRIPTION_LANG_EN,
+                self.TRANSCRIPTION_LANG_RU,
+                )
+            if term
+            }) or None
+
+        # Storing paradigm once and removing its tables from every container:
+        try:
+            self.PARADIGM: Optional[list[list]] = paradigm.parse_paradigm(
+                html_container_he = self.HTML_CONTAINER_LANG_HE,
+                html_container_en = self.HTML_CONTAINER_LANG_EN
+                )
+            if self.PARADIGM:
+                self.HTML_CONTAINER_LANG_HE = paradigm.strip_paradigm(html_container = self.HTML_CONTAINER_LANG_HE)
+                self.HTML_CONTAINER_LANG_EN = paradigm.strip_paradigm(html_container = self.HTML_CONTAINER_LANG_EN)
+                self.HTML_CONTAINER_LANG_RU = paradigm.strip_paradigm(html_container = self.HTML_CONTAINER_LANG_RU)
+
+        # Handling exception errors and logging (containers are kept as they are):
+        except Exception as exception_error:
+            self.PARADIGM = None
+            log.warning(f"Failed to compose paradigm for Word ID={self.ID}: {exception_error}")
         
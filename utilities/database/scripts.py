@@ -0,0 +1,412 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# SQLite driver import:
+import sqlite3
+
+# Database types and statements:
+from sqlalchemy import inspect, text
+
+# Database import:
+from utilities.database import DATABASE
+
+# Hebrew normalization import:
+from utilities import hebrew
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SCHEMA UPGRADE SCRIPTS
+
+"""
+
+
+def upgrade_database_schema() -> None:
+    """
+    Adds model columns and indexes that are missing from existing tables. `DATABASE.create_all()`
+    only creates missing tables, so a database file created before a column was introduced would
+    otherwise never receive it. Added columns stay empty until the next database rebuild.
+    """
+
+    # Inspecting existing tables:
+    with DATABASE.engine.begin() as connection:
+        inspector = inspect(connection)
+        for table in DATABASE.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            # Adding missing columns:
+            existing_column_names: set[str] = {
+                column["name"] for column
+                in inspector.get_columns(table.name)
+                }
+            for column in table.columns:
+                if column.name in existing_column_names:
+                    continue
+                column_type: str = column.type.compile(dialect = connection.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+
+                # Logging:
+                log.warning(f"Added column {table.name}.{column.name}, rebuild the database to populate it")
+
+            # Adding missing indexes:
+            for index in table.indexes:
+                index.create(bind = connection, checkfirst = True)
+
+    # Logging:
+    log.info("Ensured database schema is up to date")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATUS MIGRATION SCRIPTS
+
+"""
+
+
+# Learning flags once kept on the shared `words` rows, and their partial indexes:
+LEGACY_STATUS_COLUMNS: tuple[str, ...] = ("STATUS_FAVOURITE", "STATUS_TO_LEARN", "STATUS_KNOWN")
+LEGACY_STATUS_INDEXES: tuple[str, ...] = (
+    "ix_words_status_favourite",
+    "ix_words_status_to_learn",
+    "ix_words_status_known",
+    )
+
+# Flagged words are copied to the state of one learner, created unclaimed (`CREATED_AT = 0`, see
+# `utilities.users`):
+SQL_CREATE_UNCLAIMED_USER: str = "INSERT INTO users (CREATED_AT, STATE_VERSION) VALUES (0, 0) RETURNING ID"
+SQL_MIGRATE_LEGACY_STATUSES: str = """
+    INSERT INTO user_word_state (USER_ID, "INDEX", STATUS_FAVOURITE, STATUS_TO_LEARN, STATUS_KNOWN)
+    SELECT :user_id, "INDEX", coalesce(STATUS_FAVOURITE, 0), coalesce(STATUS_TO_LEARN, 0), coalesce(STATUS_KNOWN, 0)
+    FROM words
+    WHERE coalesce(STATUS_FAVOURITE, 0) = 1 OR coalesce(STATUS_TO_LEARN, 0) = 1 OR coalesce(STATUS_KNOWN, 0) = 1
+    """
+SQL_EXISTS_LEGACY_STATUSES: str = """
+    SELECT 1 FROM words
+    WHERE coalesce(STATUS_FAVOURITE, 0) = 1 OR coalesce(STATUS_TO_LEARN, 0) = 1 OR coalesce(STATUS_KNOWN, 0) = 1
+    LIMIT 1
+    """
+
+
+def migrate_legacy_statuses() -> None:
+    """
+    Moves learning flags from the `words.STATUS_*` columns of an older database into
+    `user_word_state`. Flagged words go to one new learner, which the first browser session
+    adopts; the old partial indexes and columns are then dropped, so the migration runs once.
+    """
+
+    # Checking for legacy columns:
+    with DATABASE.engine.begin() as connection:
+        inspector = inspect(connection)
+        if not inspector.has_table("words"):
+            return
+        existing_column_names: set[str] = {
+            column["name"] for column
+            in inspector.get_columns("words")
+            }
+        legacy_column_list: list[str] = [
+            column_name for column_name
+            in LEGACY_STATUS_COLUMNS
+            if column_name in existing_column_names
+            ]
+        if not legacy_column_list:
+            return
+
+        # Copying flags to an unclaimed learner:
+        migrated_count: int = 0
+        if len(legacy_column_list) == len(LEGACY_STATUS_COLUMNS) and connection.execute(text(SQL_EXISTS_LEGACY_STATUSES)).first():
+            user_id: int = connection.execute(text(SQL_CREATE_UNCLAIMED_USER)).scalar_one()
+            migrated_count = connection.execute(text(SQL_MIGRATE_LEGACY_STATUSES), {"user_id": user_id}).rowcount
+
+        # Dropping legacy indexes, then columns (SQLite refuses to drop indexed columns):
+        for index_name in LEGACY_STATUS_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        for column_name in legacy_column_list:
+            connection.execute(text(f'ALTER TABLE words DROP COLUMN "{column_name}"'))
+
+    # Recounting statuses:
+    if migrated_count:
+        rebuild_statistics(dictionary_version = read_dictionary_version())
+
+    # Logging:
+    log.warning(f"Migrated {migrated_count} flagged words to user_word_state, dropped words.STATUS_* columns")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FULL-TEXT SEARCH INDEX SCRIPTS
+
+"""
+
+
+# Search index table name:
+SEARCH_INDEX_TABLE: str = "words_search"
+
+# Tokenizer of the index. Combining marks are not token characters, so niqqud would split pointed
+# Hebrew into single letters: Hebrew columns are indexed (and queried) unpointed instead. An index
+# created with another tokenizer is rebuilt on startup:
+SEARCH_INDEX_TOKENIZE: str = "unicode61 remove_diacritics 2 categories 'L* N* Co'"
+
+# Contentless FTS5 table, rowid mirrors `words.ID`:
+SQL_CREATE_SEARCH_INDEX: str = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} USING fts5(
+        TRANSLATION_LANG_HE,
+        TRANSLATION_LANG_EN,
+        TRANSLATION_LANG_RU,
+        TRANSCRIPTION_LANG_HE,
+        TRANSCRIPTION_LANG_EN,
+        TRANSCRIPTION_LANG_RU,
+        SEARCH_LANG_HE,
+        SEARCH_LANG_EN,
+        SEARCH_LANG_RU,
+        content = '',
+        tokenize = "{SEARCH_INDEX_TOKENIZE}"
+        )
+    """
+SQL_DROP_SEARCH_INDEX: str = f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}"
+SQL_READ_SEARCH_INDEX: str = f"SELECT sql FROM sqlite_master WHERE type = 'table' AND name = '{SEARCH_INDEX_TABLE}'"
+
+# Search token lists are stored as (ASCII-escaped) JSON, so they are decoded with `json_each`;
+# Hebrew columns go through `strip_niqqud` (registered by `rebuild_search_index`):
+SQL_POPULATE_SEARCH_INDEX: str = f"""
+    INSERT INTO {SEARCH_INDEX_TABLE} (
+        rowid,
+        TRANSLATION_LANG_HE,
+        TRANSLATION_LANG_EN,
+        TRANSLATION_LANG_RU,
+        TRANSCRIPTION_LANG_HE,
+        TRANSCRIPTION_LANG_EN,
+        TRANSCRIPTION_LANG_RU,
+        SEARCH_LANG_HE,
+        SEARCH_LANG_EN,
+        SEARCH_LANG_RU
+        )
+    SELECT
+        words.ID,
+        strip_niqqud(words.TRANSLATION_LANG_HE),
+        words.TRANSLATION_LANG_EN,
+        words.TRANSLATION_LANG_RU,
+        strip_niqqud(words.TRANSCRIPTION_LANG_HE),
+        words.TRANSCRIPTION_LANG_EN,
+        words.TRANSCRIPTION_LANG_RU,
+        strip_niqqud((SELECT group_concat(value, ' ') FROM json_each(words.SEARCH_LANG_HE))),
+        (SELECT group_concat(value, ' ') FROM json_each(words.SEARCH_LANG_EN)),
+        (SELECT group_concat(value, ' ') FROM json_each(words.SEARCH_LANG_RU))
+    FROM words
+    """
+
+
+def register_search_functions(driver_connection: sqlite3.Connection) -> None:
+    """
+    Exposes the functions `SQL_POPULATE_SEARCH_INDEX` calls (niqqud removal) to SQLite on a
+    driver connection.
+
+    :param sqlite3.Connection driver_connection: SQLite connection.
+    """
+
+    # Registering functions:
+    driver_connection.create_function(
+        "strip_niqqud", 1,
+        lambda value: hebrew.strip_niqqud(value) if value else value,
+        deterministic = True
+        )
+
+
+def rebuild_search_index() -> None:
+    """
+    Drops and recreates the full-text search index from the current contents of the `words`
+    table. Must be called every time the dictionary is (re)built, since the contentless index is
+    not updated by regular writes to `words`.
+    """
+
+    # Exposing niqqud removal to SQLite for this connection:
+    register_search_functions(driver_connection = DATABASE.session.connection().connection.driver_connection)
+
+    # Recreating and populating the index:
+    DATABASE.session.execute(text(SQL_DROP_SEARCH_INDEX))
+    DATABASE.session.execute(text(SQL_CREATE_SEARCH_INDEX))
+    DATABASE.session.execute(text(SQL_POPULATE_SEARCH_INDEX))
+    DATABASE.session.commit()
+
+    # Logging:
+    log.info(f"Rebuilt full-text search index '{SEARCH_INDEX_TABLE}'")
+
+
+def initialize_search_index() -> None:
+    """
+    Ensures the full-text search index exists with the current tokenizer. If the index is missing
+    (e.g. the database was built before the index was introduced) or was created with another
+    tokenizer, it is recreated and populated from the `words` table.
+    """
+
+    # Rebuilding only if the index is missing or outdated:
+    index_definition: str = DATABASE.session.execute(text(SQL_READ_SEARCH_INDEX)).scalar() or ""
+    if SEARCH_INDEX_TOKENIZE not in index_definition:
+        rebuild_search_index()
+
+    # Logging:
+    log.info(f"Ensured full-text search index '{SEARCH_INDEX_TABLE}'")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ROOT FAMILY SCRIPTS
+
+"""
+
+
+# Root family sizes, aggregated once per build:
+SQL_CLEAR_ROOTS: str = "DELETE FROM roots"
+SQL_POPULATE_ROOTS: str = """
+    INSERT INTO roots (ROOT_LANG_HE, WORD_COUNT)
+    SELECT ROOT_LANG_HE, count(*) FROM words
+    WHERE ROOT_LANG_HE IS NOT NULL
+    GROUP BY ROOT_LANG_HE
+    """
+
+
+def rebuild_root_index() -> None:
+    """
+    Recomputes the `roots` table (root family sizes) from `words.ROOT_LANG_HE`. Must be called
+    every time the dictionary is (re)built.
+    """
+
+    # Replacing family counts:
+    DATABASE.session.execute(text(SQL_CLEAR_ROOTS))
+    DATABASE.session.execute(text(SQL_POPULATE_ROOTS))
+    DATABASE.session.commit()
+
+    # Logging:
+    log.info("Rebuilt root family index")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CROSS-REFERENCE SCRIPTS
+
+"""
+
+
+# Links whose target is not a dictionary entry (e.g. pages that failed to scrape):
+SQL_COUNT_DANGLING_LINKS: str = """
+    SELECT count(*) FROM links
+    WHERE NOT EXISTS (SELECT 1 FROM words WHERE words."INDEX" = links.TARGET_INDEX)
+    """
+
+
+def count_dangling_links() -> int:
+    """
+    Counts cross-references pointing to entries that are missing from the dictionary. Both sides
+    of the check are indexed, so it runs as an index probe per link.
+
+    :return int: Number of dangling links.
+    """
+
+    # Counting links without a target entry:
+    dangling_link_count: int = DATABASE.session.execute(text(SQL_COUNT_DANGLING_LINKS)).scalar() or 0
+
+    # Returning:
+    return dangling_link_count
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATISTICS SCRIPTS
+
+"""
+
+
+# Materialised counters, the part of speech is the first word of the English type, statuses
+# are counted per learner (`status:<learner ID>:<status>`):
+SQL_CLEAR_STATISTICS: str = "DELETE FROM statistics"
+SQL_POPULATE_STATISTICS: str = """
+    INSERT INTO statistics (KEY, VALUE)
+    SELECT 'words', count(*) FROM words
+    UNION ALL
+    SELECT 'inputs', count(*) FROM inputs
+    UNION ALL
+    SELECT 'status:' || USER_ID || '\\:favourite', sum(STATUS_FAVOURITE) FROM user_word_state GROUP BY USER_ID
+    UNION ALL
+    SELECT 'status:' || USER_ID || '\\:to_learn', sum(STATUS_TO_LEARN) FROM user_word_state GROUP BY USER_ID
+    UNION ALL
+    SELECT 'status:' || USER_ID || '\\:known', sum(STATUS_KNOWN) FROM user_word_state GROUP BY USER_ID
+    UNION ALL
+    SELECT 'pos:' || part_of_speech, count(*) FROM (
+        SELECT CASE
+            WHEN instr(TYPE_LANG_EN, ' ') > 0 THEN substr(TYPE_LANG_EN, 1, instr(TYPE_LANG_EN, ' ') - 1)
+            ELSE TYPE_LANG_EN
+            END AS part_of_speech
+        FROM words
+        WHERE TYPE_LANG_EN IS NOT NULL AND TYPE_LANG_EN != ''
+        )
+    GROUP BY part_of_speech
+    UNION ALL
+    SELECT 'dictionary_version', :dictionary_version
+    """
+
+# Counter update, committed together with the write it accounts for:
+SQL_INCREMENT_STATISTIC: str = """
+    INSERT INTO statistics (KEY, VALUE) VALUES (:key, :delta)
+    ON CONFLICT (KEY) DO UPDATE SET VALUE = VALUE + :delta
+    """
+
+
+def rebuild_statistics(dictionary_version: int) -> None:
+    """
+    Recomputes all materialised counters with one pass of aggregates and stamps them with the
+    dictionary version they belong to.
+
+    :param int dictionary_version: Dictionary version the counters are computed for.
+    """
+
+    # Replacing counters:
+    DATABASE.session.execute(text(SQL_CLEAR_STATISTICS))
+    DATABASE.session.execute(text(SQL_POPULATE_STATISTICS), {"dictionary_version": dictionary_version})
+    DATABASE.session.commit()
+
+    # Logging:
+    log.info(f"Rebuilt statistics for dictionary version {dictionary_version}")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+DICTIONARY VERSION SCRIPTS
+
+"""
+
+
+def read_dictionary_version() -> int:
+    """
+    Reads the dictionary version stamp, kept in SQLite's `user_version` header field. The stamp
+    changes on every database rebuild, so in-memory structures derived from the dictionary can
+    compare it to decide whether they are stale.
+
+    :return int: Current dictionary version, 0 for a database that was never rebuilt.
+    """
+
+    # Reading version stamp:
+    dictionary_version: int = DATABASE.session.execute(text("PRAGMA user_version")).scalar() or 0
+
+    # Returning:
+    return dictionary_version
+
+
+def bump_dictionary_version() -> int:
+    """
+    Increments the dictionary version stamp. Must be called once the dictionary content has been
+    rebuilt, after all derived tables and indexes are in sync.
+
+    :return int: New dictionary version.
+    """
+
+    # Writing incremented version stamp (PRAGMA values can not be bound as parameters):
+    dictionary_version: int = read_dictionary_version() + 1
+    DATABASE.session.execute(text(f"PRAGMA user_version = {int(dictionary_version)}"))
+    DATABASE.session.commit()
+
+    # Logging:
+    log.info(f"Dictionary version bumped to {dictionary_version}")
+
+    # Returning:
+    return dictionary_version
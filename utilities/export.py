@@ -0,0 +1,318 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# System-management, compression, hashing and process libraries:
+import os
+import argparse
+import gzip
+import hashlib
+import json
+import multiprocessing
+import posixpath
+import re
+import shutil
+
+# Typing and annotations import:
+from typing import Optional
+
+# Brotli is optional, only gzip variants are written without it:
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Settings import:
+from configuration import SETTINGS
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EXPORT VARIABLES BLOCK
+
+"""
+
+
+# Output folder and the manifest of its pages (content hashes and the version they were rendered at):
+EXPORT_FOLDER_PATH: str = os.path.join(SETTINGS.APP_ROOT, "export")
+EXPORT_MANIFEST_FILENAME: str = "export-manifest.json"
+
+# Exported page languages and pages rendered per worker task:
+EXPORT_LANGUAGES: tuple[str, ...] = ("ru", "en", "he")
+EXPORT_PAGES_PER_TASK: int = 64
+
+# Compression settings of the written variants:
+EXPORT_GZIP_LEVEL: int = 9
+EXPORT_BROTLI_QUALITY: int = 11
+
+# Listing links use a query string, which static servers ignore, so they become paths:
+EXPORT_LINK_REWRITES: tuple[tuple[re.Pattern, str], ...] = (
+    (re.compile(r"/dictionary\?page=(\d+)"), r"/dictionary/page/\1/"),
+    (re.compile(r'"/dictionary\?page=" \+ page'), '"/dictionary/page/" + page + "/"'),
+    )
+
+# Per-process state of export workers:
+__WORKER_STATE: dict = {"client": None, "folder": None, "environ": None}
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EXPORT WORKER FUNCTIONS
+
+"""
+
+
+def __page_filepath(url: str) -> str:
+    """
+    Maps a page URL to its file in the export, relative to the output folder:
+    `/dictionary/en/3` → `dictionary/en/3/index.html`,
+    `/dictionary?page=2` → `dictionary/page/2/index.html`.
+    """
+
+    # Moving the page number into the path:
+    url_path, _, url_query = url.partition("?")
+    if url_query.startswith("page="):
+        url_path = f"{url_path}/page/{url_query[len('page='):]}"
+
+    # Returning:
+    return posixpath.join(url_path.strip("/"), "index.html")
+
+
+def __write_page(filepath: str, data: bytes) -> None:
+    """
+    Writes a page and its precompressed variants.
+    """
+
+    # Writing page:
+    os.makedirs(os.path.dirname(filepath), exist_ok = True)
+    with open(filepath, "wb") as page_file:
+        page_file.write(data)
+
+    # Writing compressed variants:
+    with open(filepath + ".gz", "wb") as page_file:
+        page_file.write(gzip.compress(data, compresslevel = EXPORT_GZIP_LEVEL, mtime = 0))
+    if brotli is not None:
+        with open(filepath + ".br", "wb") as page_file:
+            page_file.write(brotli.compress(data, quality = EXPORT_BROTLI_QUALITY))
+
+
+def __initialize_worker(output_folder: str) -> None:
+    """
+    Prepares a forked worker: drops database connections inherited from the parent (SQLite
+    connections must not cross processes) and opens a test client on the application.
+    """
+
+    # Importing the application loaded by the parent:
+    from app import application
+    from utilities.database import DATABASE
+    from utilities import users
+
+    # Resetting inherited connections:
+    with application.app_context():
+        DATABASE.engine.dispose(close = False)
+
+    # Saving worker state:
+    __WORKER_STATE["client"] = application.test_client()
+    __WORKER_STATE["folder"] = output_folder
+    __WORKER_STATE["environ"] = {users.USER_ANONYMOUS_ENVIRON_KEY: True}     # <- Never adopts a learner
+
+
+def __export_pages(task_list: list[tuple[str, str]]) -> list[tuple[str, str, bool]]:
+    """
+    Renders pages through the application and writes those whose content changed.
+
+    :param list task_list: `(url, previous content hash)` pairs.
+    :return list: `(file path, content hash, written)` for every page that exists.
+    """
+
+    # Rendering pages:
+    result_list: list[tuple[str, str, bool]] = []
+    for url, previous_hash in task_list:
+        response = __WORKER_STATE["client"].get(
+            url,
+            headers = {"Accept-Encoding": "identity"},
+            environ_overrides = __WORKER_STATE["environ"],
+            )
+        if response.status_code != 200:
+            continue
+
+        # Rewriting links for static serving:
+        page_html: str = response.get_data(as_text = True)
+        for link_pattern, link_replacement in EXPORT_LINK_REWRITES:
+            page_html = link_pattern.sub(link_replacement, page_html)
+        page_data: bytes = page_html.encode("utf-8")
+
+        # Writing only changed pages:
+        relative_filepath: str = __page_filepath(url)
+        filepath: str = os.path.join(__WORKER_STATE["folder"], *relative_filepath.split("/"))
+        content_hash: str = hashlib.sha256(page_data).hexdigest()
+        is_changed: bool = content_hash != previous_hash or not os.path.exists(filepath)
+        if is_changed:
+            __write_page(filepath = filepath, data = page_data)
+        result_list.append((relative_filepath, content_hash, is_changed))
+
+    # Returning:
+    return result_list
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EXPORT FUNCTIONS BLOCK
+
+"""
+
+
+def __read_template_version() -> str:
+    """
+    Hash of every template file, so an export rendered with other templates is never reused.
+    """
+
+    # Hashing template paths and contents in a stable order:
+    template_hash = hashlib.sha256()
+    for folder_path, folder_name_list, filename_list in os.walk(SETTINGS.FOLDER_TEMPLATES_PATH):
+        folder_name_list.sort()
+        for filename in sorted(filename_list):
+            filepath: str = os.path.join(folder_path, filename)
+            template_hash.update(os.path.relpath(filepath, SETTINGS.FOLDER_TEMPLATES_PATH).encode("utf-8"))
+            with open(filepath, "rb") as template_file:
+                template_hash.update(template_file.read())
+
+    # Returning:
+    return template_hash.hexdigest()
+
+
+def __collect_urls() -> tuple[list[str], list]:
+    """
+    Lists every exported page: word pages with their language fragments and lazily loaded
+    paradigm sections in all languages, and every page of the dictionary listing. Also reads
+    the version the pages are rendered at: the dictionary version, the asset manifest hash and
+    the template hash.
+    """
+
+    # Importing application and page sources:
+    from app import application
+    from utilities.database import DATABASE, scripts
+    from utilities.database.models.word import Word
+    from utilities import assets, paradigm
+    from routes.dictionary import WORD_PAGE_BOUNDARY_CACHE
+
+    # Querying word indexes and paradigm sizes:
+    url_list: list[str] = []
+    with application.app_context():
+        export_version: list = [scripts.read_dictionary_version(), assets.manifest_version(), __read_template_version()]
+        for word_index, word_paradigm in DATABASE.session.query(Word.INDEX, Word.PARADIGM).order_by(Word.INDEX):
+            section_count: int = len(paradigm.group_paradigm(paradigm = word_paradigm, language = "en"))
+            for language in EXPORT_LANGUAGES:
+                url_list.append(f"/dictionary/{language}/{word_index}")
+                url_list.append(f"/dictionary/{language}/{word_index}/content")
+                url_list.extend(
+                    f"/dictionary/{language}/{word_index}/sections/{section_index}"
+                    for section_index in range(paradigm.PARADIGM_SECTIONS_EAGER, section_count)
+                    )
+
+        # Adding listing pages:
+        url_list.append("/dictionary")
+        url_list.extend(
+            f"/dictionary?page={page}"
+            for page in range(1, WORD_PAGE_BOUNDARY_CACHE.get().total_pages + 1)
+            )
+
+        # Closing connections before forking workers:
+        DATABASE.session.remove()
+        DATABASE.engine.dispose()
+
+    # Returning:
+    return url_list, export_version
+
+
+def export_site(output_folder: str = EXPORT_FOLDER_PATH, process_count: Optional[int] = None, force: bool = False) -> dict[str, int]:
+    """
+    Pre-renders every word page (all languages, with fragments and paradigm sections) and the
+    whole dictionary listing into a static folder servable by any static file server or CDN
+    that maps `/path/` to `/path/index.html`. Pages are rendered in parallel worker processes.
+    A page is rewritten (with its `.gz` and, when brotli is installed, `.br` variants) only if
+    its content hash changed since the previous export; pages that no longer exist are removed.
+    If the dictionary, assets and templates are the same as at the previous export, pages that
+    were exported then are not rendered at all. Fingerprinted assets are copied to
+    `static/build/`. Search, random and practice pages still need the application.
+
+    Run from the repository root:
+
+        python -m utilities.export [output folder] [--processes N] [--force]
+
+    :param str output_folder: Export folder, `export/` by default;
+    :param Optional[int] process_count: Worker processes, one per CPU by default;
+    :param bool force: Render every page, e.g. after a code change that alters pages.
+
+    :return dict[str, int]: Numbers of `written`, `unchanged` and `removed` pages.
+    """
+
+    # Loading application, listing pages and reading the previous manifest:
+    url_list, export_version = __collect_urls()
+    manifest_filepath: str = os.path.join(output_folder, EXPORT_MANIFEST_FILENAME)
+    previous_manifest: dict = {}
+    if os.path.exists(manifest_filepath):
+        with open(manifest_filepath, "r", encoding = "UTF-8") as manifest_file:
+            previous_manifest = json.load(manifest_file)
+    previous_pages: dict[str, str] = previous_manifest.get("pages", previous_manifest)    # <- Older exports stored pages only
+
+    # Keeping pages exported at the same version without rendering them:
+    manifest: dict[str, str] = {}
+    task_list: list[tuple[str, str]] = []
+    is_current: bool = not force and previous_manifest.get("version") == export_version
+    for url in url_list:
+        relative_filepath: str = __page_filepath(url)
+        if is_current and relative_filepath in previous_pages and os.path.exists(os.path.join(output_folder, *relative_filepath.split("/"))):
+            manifest[relative_filepath] = previous_pages[relative_filepath]
+        else:
+            task_list.append((url, previous_pages.get(relative_filepath)))
+
+    # Rendering remaining pages in parallel (forked workers share the loaded application):
+    written_count: int = 0
+    if task_list:
+        with multiprocessing.get_context("fork").Pool(
+            processes = process_count,
+            initializer = __initialize_worker,
+            initargs = (output_folder,)
+            ) as pool:
+            for result_list in pool.imap_unordered(
+                __export_pages,
+                (task_list[task_start:task_start + EXPORT_PAGES_PER_TASK] for task_start in range(0, len(task_list), EXPORT_PAGES_PER_TASK))
+                ):
+                for relative_filepath, content_hash, is_changed in result_list:
+                    manifest[relative_filepath] = content_hash
+                    written_count += is_changed
+
+    # Removing pages that are gone:
+    removed_count: int = 0
+    for relative_filepath in previous_pages.keys() - manifest.keys():
+        filepath: str = os.path.join(output_folder, *relative_filepath.split("/"))
+        for variant_filepath in (filepath, filepath + ".gz", filepath + ".br"):
+            if os.path.exists(variant_filepath):
+                os.remove(variant_filepath)
+        removed_count += 1
+
+    # Copying fingerprinted assets and saving manifest:
+    shutil.copytree(SETTINGS.FOLDER_BUILD_PATH, os.path.join(output_folder, "static", "build"), dirs_exist_ok = True)
+    with open(manifest_filepath, "w", encoding = "UTF-8") as manifest_file:
+        json.dump({"version": export_version, "pages": manifest}, manifest_file, indent = 0, sort_keys = True)
+
+    # Logging:
+    export_stats: dict[str, int] = {
+        "written": written_count,
+        "unchanged": len(manifest) - written_count,
+        "removed": removed_count,
+        }
+    log.info(f"Exported {len(manifest)} pages to {output_folder} ({len(task_list)} rendered): {export_stats}")
+
+    # Returning:
+    return export_stats
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description = "Export the dictionary as a static site.")
+    argument_parser.add_argument("output_folder", nargs = "?", default = EXPORT_FOLDER_PATH)
+    argument_parser.add_argument("--processes", type = int, default = None)
+    argument_parser.add_argument("--force", action = "store_true", help = "render every page")
+    arguments = argument_parser.parse_args()
+    print(export_site(output_folder = arguments.output_folder, process_count = arguments.processes, force = arguments.force))
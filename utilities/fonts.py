@@ -0,0 +1,250 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# System-management, database and JSON libraries:
+import os
+import json
+import sqlite3
+
+# Font tools are optional (build-time only), pages keep the full TTF fonts without them:
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+    logging.getLogger("fontTools").setLevel(logging.WARNING)
+except ImportError:
+    font_subset = None
+
+# Settings import:
+from configuration import SETTINGS
+
+# UI label import:
+from utilities import assets, paradigm
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FONTS VARIABLES BLOCK
+
+"""
+
+
+# Font families and their source files in `static/fonts/`:
+FONT_SOURCES: dict[str, str] = {
+    "NotoSansHebrew": "NotoSansHebrew.ttf",
+    "FiraCode": "FiraCode.ttf",
+    }
+
+# Stylesheets: full fonts (committed) and generated subsets, relative to the static folder:
+FONT_STYLESHEET: str = "css/fonts.css"
+FONT_SUBSET_STYLESHEET: str = "css/fonts.subset.css"
+FONT_SUBSET_FOLDER_PATH: str = os.path.join(SETTINGS.FOLDER_FONTS_PATH, "subset")
+
+# Script subsets, each becomes its own file and `@font-face` rule, so the browser only
+# downloads the ones a page uses. Characters outside all of them go to an "extra" subset:
+FONT_SUBSET_RANGES: dict[str, tuple[tuple[int, int], ...]] = {
+    "hebrew":   ((0x0590, 0x05FF), (0xFB1D, 0xFB4F), (0x25CC, 0x25CC)),
+    "latin":    ((0x0000, 0x00FF), (0x0131, 0x0131), (0x0152, 0x0153), (0x02C6, 0x02DC), (0x2000, 0x206F), (0x20AA, 0x20AC), (0x2122, 0x2122)),
+    "cyrillic": ((0x0400, 0x045F), (0x0490, 0x0491), (0x2116, 0x2116)),
+    }
+FONT_SUBSET_EXTRA: str = "extra"
+
+# Characters kept even if the dictionary does not use them (typed search input): printable
+# Latin-1, the whole Hebrew block with niqqud and cantillation, and basic Cyrillic:
+FONT_BASE_RANGES: tuple[tuple[int, int], ...] = (
+    (0x0020, 0x007E), (0x00A0, 0x00FF), (0x0590, 0x05FF), (0xFB1D, 0xFB4F), (0x0400, 0x045F),
+    )
+
+# Text columns scanned for used characters:
+FONT_TEXT_COLUMNS: tuple[str, ...] = (
+    "HTML_CONTAINER_LANG_RU", "HTML_CONTAINER_LANG_EN", "HTML_CONTAINER_LANG_HE",
+    "TRANSLATION_LANG_HE", "TRANSLATION_LANG_RU", "TRANSLATION_LANG_EN",
+    "TRANSCRIPTION_LANG_HE", "TRANSCRIPTION_LANG_RU", "TRANSCRIPTION_LANG_EN",
+    "TYPE_LANG_HE", "TYPE_LANG_RU", "TYPE_LANG_EN",
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FONTS BUILD FUNCTIONS
+
+"""
+
+
+def __collect_characters() -> set[int]:
+    """
+    Collects code points used by the stored dictionary (containers, translations, paradigms)
+    and by the interface (templates, paradigm labels), plus `FONT_BASE_RANGES`. Reads the
+    database file directly, so it runs without an application context.
+    """
+
+    # Adding base ranges:
+    codepoint_set: set[int] = {
+        codepoint for range_start, range_end in FONT_BASE_RANGES
+        for codepoint in range(range_start, range_end + 1)
+        }
+    character_set: set[str] = set()
+
+    # Scanning interface strings:
+    for folder_path, _, file_names in os.walk(SETTINGS.FOLDER_TEMPLATES_PATH):
+        for file_name in file_names:
+            with open(os.path.join(folder_path, file_name), "r", encoding = "UTF-8") as template_file:
+                character_set.update(template_file.read())
+    for label_map in (paradigm.PARADIGM_GROUP_LABELS, paradigm.PARADIGM_SLOT_LABELS):
+        for labels in label_map.values():
+            character_set.update("".join(labels.values()))
+
+    # Scanning dictionary text:
+    if os.path.exists(SETTINGS.DATABASE_FILEPATH):
+        connection = sqlite3.connect(SETTINGS.DATABASE_FILEPATH)
+        try:
+            column_list: str = ", ".join(FONT_TEXT_COLUMNS)
+            for word_row in connection.execute(f"SELECT {column_list}, PARADIGM FROM words"):
+                for text_value in word_row[:-1]:
+                    if text_value:
+                        character_set.update(text_value)
+                if word_row[-1]:
+                    character_set.update(json.dumps(json.loads(word_row[-1]), ensure_ascii = False))
+        except sqlite3.Error as exception_error:
+            log.warning(f"Could not scan dictionary text for font subsetting: {exception_error}")
+        finally:
+            connection.close()
+
+    # Returning:
+    codepoint_set.update(ord(character) for character in character_set)
+    return codepoint_set
+
+
+def __format_unicode_range(codepoint_list: list[int]) -> str:
+    """
+    Formats sorted code points as a CSS `unicode-range` value, merging consecutive runs:
+    `[0x5D0, 0x5D1, 0x5D2, 0x5BE]` → `"U+5BE, U+5D0-5D2"`.
+    """
+
+    # Merging runs:
+    range_list: list[list[int]] = []
+    for codepoint in sorted(codepoint_list):
+        if range_list and codepoint == range_list[-1][1] + 1:
+            range_list[-1][1] = codepoint
+        else:
+            range_list.append([codepoint, codepoint])
+
+    # Returning:
+    return ", ".join(
+        f"U+{range_start:X}" if range_start == range_end else f"U+{range_start:X}-{range_end:X}"
+        for range_start, range_end in range_list
+        )
+
+
+def build_fonts() -> int:
+    """
+    Subsets every font in `FONT_SOURCES` to the characters the dictionary and interface use,
+    split by script (`FONT_SUBSET_RANGES`), saves each subset as WOFF2 in `static/fonts/subset/`
+    and writes `@font-face` rules with matching `unicode-range` values to
+    `FONT_SUBSET_STYLESHEET`. Pages switch to the subsets once that stylesheet exists (see
+    `font_stylesheet`). Call `assets.build_assets()` afterwards to fingerprint the output.
+    Can be run by hand as `python -m utilities.fonts`.
+
+    :return int: Number of subset files written, 0 if font tools are not installed.
+    """
+
+    # Skipping without font tools:
+    if font_subset is None:
+        log.warning("fontTools is not installed, pages keep the full TTF fonts")
+        return 0
+
+    # Collecting used characters:
+    codepoint_set: set[int] = __collect_characters()
+    os.makedirs(FONT_SUBSET_FOLDER_PATH, exist_ok = True)
+    for file_name in os.listdir(FONT_SUBSET_FOLDER_PATH):
+        os.remove(os.path.join(FONT_SUBSET_FOLDER_PATH, file_name))
+
+    # Subsetting each font per script:
+    font_face_list: list[str] = []
+    for font_family, font_filename in FONT_SOURCES.items():
+        font_filepath: str = os.path.join(SETTINGS.FOLDER_FONTS_PATH, font_filename)
+        font_codepoint_set: set[int] = codepoint_set & set(TTFont(font_filepath).getBestCmap())
+        subset_map: dict[str, list[int]] = {}
+        for codepoint in font_codepoint_set:
+            subset_name: str = next((
+                subset_name for subset_name, subset_ranges in FONT_SUBSET_RANGES.items()
+                if any(range_start <= codepoint <= range_end for range_start, range_end in subset_ranges)
+                ), FONT_SUBSET_EXTRA)
+            subset_map.setdefault(subset_name, []).append(codepoint)
+
+        # Saving WOFF2 subsets:
+        for subset_name, subset_codepoint_list in subset_map.items():
+            subset_filename: str = f"{font_family}-{subset_name}.woff2"
+            options = font_subset.Options()
+            options.flavor = "woff2"
+            font = TTFont(font_filepath)
+            subsetter = font_subset.Subsetter(options = options)
+            subsetter.populate(unicodes = subset_codepoint_list)
+            subsetter.subset(font)
+            font.save(os.path.join(FONT_SUBSET_FOLDER_PATH, subset_filename))
+            font_face_list.append(
+                "@font-face {\n"
+                f'  font-family: "{font_family}";\n'
+                f'  src: url("/static/fonts/subset/{subset_filename}") format("woff2");\n'
+                "  font-weight: normal;\n"
+                "  font-style: normal;\n"
+                "  font-display: swap;\n"
+                f"  unicode-range: {__format_unicode_range(subset_codepoint_list)};\n"
+                "}\n"
+                )
+
+    # Writing stylesheet:
+    with open(os.path.join(SETTINGS.FOLDER_STATIC_PATH, *FONT_SUBSET_STYLESHEET.split("/")), "w", encoding = "UTF-8") as stylesheet_file:
+        stylesheet_file.write("".join(font_face_list))
+
+    # Logging:
+    subset_size: int = sum(
+        os.path.getsize(os.path.join(FONT_SUBSET_FOLDER_PATH, file_name))
+        for file_name in os.listdir(FONT_SUBSET_FOLDER_PATH)
+        )
+    source_size: int = sum(
+        os.path.getsize(os.path.join(SETTINGS.FOLDER_FONTS_PATH, font_filename))
+        for font_filename in FONT_SOURCES.values()
+        )
+    log.info(f"Built {len(font_face_list)} font subsets from {len(codepoint_set)} characters: {source_size} → {subset_size} bytes")
+
+    # Returning:
+    return len(font_face_list)
+
+
+def initialize_fonts() -> None:
+    """
+    Ensures the font subsets exist. They are built if the subset stylesheet is missing (e.g. on
+    the first start); later database rebuilds refresh them explicitly.
+    """
+
+    # Building only if the subsets do not exist yet:
+    if not os.path.exists(os.path.join(SETTINGS.FOLDER_STATIC_PATH, *FONT_SUBSET_STYLESHEET.split("/"))):
+        build_fonts()
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FONTS LOOKUP FUNCTIONS
+
+"""
+
+
+def font_stylesheet() -> str:
+    """
+    Template helper choosing the `@font-face` stylesheet: the WOFF2 subsets if they were built
+    and fingerprinted, the full TTF fonts otherwise.
+
+    :return str: Stylesheet path relative to the static folder, for `asset_url`.
+    """
+
+    # Returning:
+    if FONT_SUBSET_STYLESHEET in assets.read_manifest():
+        return FONT_SUBSET_STYLESHEET
+    return FONT_STYLESHEET
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level = logging.INFO)
+    build_fonts()
+    assets.build_assets()
@@ -0,0 +1,253 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Typing and annotations import:
+from typing import Iterable
+
+# Database-related import:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+
+# Cache import:
+from utilities.cache import VersionedCache
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FUZZY VARIABLES BLOCK
+
+"""
+
+
+# Maximum edit distance and number of suggestions:
+FUZZY_MAX_DISTANCE: int = 1
+FUZZY_SUGGESTION_LIMIT: int = 5
+
+# Shorter terms are skipped, a single edit turns them into too many unrelated words:
+FUZZY_MIN_TERM_LENGTH: int = 3
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FUZZY INDEX CLASS INSTANCE
+
+"""
+
+
+class FuzzyIndex:
+    """
+    Symmetric-delete spelling index. Every dictionary term is stored under all variants that
+    are reachable by deleting up to `max_distance` characters; a query is looked up under its
+    own delete variants, so candidates are found with a handful of hash lookups instead of
+    comparing the query against every term. Candidates are then verified with the optimal
+    string alignment distance (Levenshtein plus adjacent transpositions).
+
+    Attributes:
+        max_distance (int): Maximum edit distance of a suggestion
+        term_frequency (dict): Number of words every term appears in
+        delete_index (dict): Delete variant mapped to the terms it was produced from
+    """
+
+    def __init__(self, max_distance: int = FUZZY_MAX_DISTANCE):
+        """
+        Initialize an empty index.
+
+        :param int max_distance: Maximum edit distance of a suggestion.
+        """
+
+        # Core attributes:
+        self.max_distance: int = max_distance
+        self.term_frequency: dict[str, int] = {}
+        self.delete_index: dict[str, list[str]] = {}
+
+
+    def __generate_deletes(self, term: str) -> set[str]:
+        """
+        Generates the term itself and every variant with up to `max_distance` characters deleted.
+
+        :param str term: Source term.
+        :return set[str]: Delete variants, including the term.
+        """
+
+        # Expanding variants layer by layer:
+        delete_set: set[str] = {term}
+        delete_layer: set[str] = {term}
+        for _ in range(self.max_distance):
+            delete_layer = {
+                variant[:character_index] + variant[character_index + 1:]
+                for variant in delete_layer
+                for character_index in range(len(variant))
+                }
+            delete_set |= delete_layer
+
+        # Returning:
+        return delete_set
+
+
+    def __distance(self, source: str, target: str) -> int:
+        """
+        Computes the optimal string alignment distance, stopping early once it exceeds
+        `max_distance`.
+
+        :param str source: First string;
+        :param str target: Second string.
+
+        :return int: Edit distance, or `max_distance + 1` if the strings are further apart.
+        """
+
+        # Length difference is a lower bound:
+        if abs(len(source) - len(target)) > self.max_distance:
+            return self.max_distance + 1
+
+        # Filling the distance table row by row:
+        previous_previous_row: list[int] = []
+        previous_row: list[int] = list(range(len(target) + 1))
+        for source_index in range(1, len(source) + 1):
+            current_row: list[int] = [source_index] + [0] * len(target)
+            for target_index in range(1, len(target) + 1):
+                substitution_cost: int = int(source[source_index - 1] != target[target_index - 1])
+                current_row[target_index] = min(
+                    previous_row[target_index] + 1,
+                    current_row[target_index - 1] + 1,
+                    previous_row[target_index - 1] + substitution_cost,
+                    )
+                if (source_index > 1 and target_index > 1
+                        and source[source_index - 1] == target[target_index - 2]
+                        and source[source_index - 2] == target[target_index - 1]):
+                    current_row[target_index] = min(
+                        current_row[target_index],
+                        previous_previous_row[target_index - 2] + 1
+                        )
+            if min(current_row) > self.max_distance:
+                return self.max_distance + 1
+            previous_previous_row, previous_row = previous_row, current_row
+
+        # Returning:
+        return previous_row[-1]
+
+
+    def add(self, term: str) -> None:
+        """
+        Adds a single occurrence of a term to the index.
+
+        :param str term: Lowercase dictionary term.
+        """
+
+        # Counting repeated terms without re-indexing them:
+        if term in self.term_frequency:
+            self.term_frequency[term] += 1
+            return
+        self.term_frequency[term] = 1
+
+        # Indexing delete variants:
+        for variant in self.__generate_deletes(term):
+            self.delete_index.setdefault(variant, []).append(term)
+
+
+    def lookup(self, query: str, limit: int = FUZZY_SUGGESTION_LIMIT) -> list[str]:
+        """
+        Finds dictionary terms within `max_distance` edits of the query, closest and most frequent
+        first. An exact match is returned as the only suggestion.
+
+        :param str query: Query term;
+        :param int limit: Maximum number of suggestions.
+
+        :return list[str]: Suggested terms.
+        """
+
+        # Normalizing query:
+        query = " ".join(query.lower().split())
+        if len(query) < FUZZY_MIN_TERM_LENGTH:
+            return []
+        if query in self.term_frequency:
+            return [query]
+
+        # Collecting candidates sharing a delete variant with the query:
+        candidate_set: set[str] = set()
+        for variant in self.__generate_deletes(query):
+            candidate_set.update(self.delete_index.get(variant, ()))
+
+        # Verifying and ranking candidates:
+        suggestion_list: list[tuple[int, int, str]] = []
+        for candidate in candidate_set:
+            candidate_distance: int = self.__distance(query, candidate)
+            if candidate_distance <= self.max_distance:
+                suggestion_list.append((candidate_distance, -self.term_frequency[candidate], candidate))
+        suggestion_list.sort()
+
+        # Returning:
+        return [candidate for _, _, candidate in suggestion_list[:limit]]
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+FUZZY INDEX FUNCTIONS
+
+"""
+
+
+def __iterate_terms(search_list: Iterable[str]) -> Iterable[str]:
+    """
+    Yields every search token of a word and, for multi-word tokens, each of their words.
+    """
+
+    # Yielding tokens and their words:
+    for search_token in search_list or ():
+        search_token = " ".join(search_token.lower().split())
+        yield search_token
+        if " " in search_token:
+            yield from search_token.split()
+
+
+def build_fuzzy_index() -> FuzzyIndex:
+    """
+    Builds the fuzzy index from the English and Russian search token lists composed by
+    `Word.compose`. Only the two JSON columns are loaded, not the word rows.
+
+    :return FuzzyIndex: Populated index.
+    """
+
+    # Loading search token lists:
+    search_rows = DATABASE.session.query(Word.SEARCH_LANG_EN, Word.SEARCH_LANG_RU).all()
+
+    # Indexing every term:
+    fuzzy_index = FuzzyIndex()
+    for search_list_en, search_list_ru in search_rows:
+        for search_list in (search_list_en, search_list_ru):
+            for term in __iterate_terms(search_list):
+                if len(term) >= FUZZY_MIN_TERM_LENGTH:
+                    fuzzy_index.add(term)
+
+    # Logging:
+    log.info(f"Fuzzy index holds {len(fuzzy_index.term_frequency)} terms and {len(fuzzy_index.delete_index)} delete variants")
+
+    # Returning:
+    return fuzzy_index
+
+
+# Per-process fuzzy index, rebuilt on dictionary version change:
+FUZZY_INDEX_CACHE = VersionedCache(
+    name = "fuzzy index",
+    loader = build_fuzzy_index
+    )
+
+
+def suggest(query_text: str, limit: int = FUZZY_SUGGESTION_LIMIT) -> list[str]:
+    """
+    Returns "did you mean" suggestions for a query that found nothing.
+
+    :param str query_text: Raw search query as typed by the user;
+    :param int limit: Maximum number of suggestions.
+
+    :return list[str]: Suggested search terms, best first.
+    """
+
+    # Looking the query up in the cached index:
+    suggestion_list: list[str] = FUZZY_INDEX_CACHE.get().lookup(
+        query = query_text,
+        limit = limit
+        )
+
+    # Returning:
+    return suggestion_list
@@ -0,0 +1,341 @@
+# Unicode-related library:
+import unicodedata
+
+# Typing and annotations import:
+from typing import Optional
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+HEBREW VARIABLES BLOCK
+
+"""
+
+
+# Final letter forms and their regular counterparts:
+FINAL_LETTERS: dict[str, str] = {
+    "ך": "כ",
+    "ם": "מ",
+    "ן": "נ",
+    "ף": "פ",
+    "ץ": "צ",
+    }
+
+# Matres lectionis, folded away everywhere but the first letter of a word when they are vowels:
+MATRES_LECTIONIS: frozenset[str] = frozenset(("ו", "י"))
+
+# Niqqud telling vowel letters from consonants: a vav with holam, or with dagesh and no vowel
+# (shuruk), is a vowel; so is a bare yod after hiriq or tsere:
+VOWEL_POINTS: frozenset[str] = frozenset(chr(code_point) for code_point in (*range(0x05B0, 0x05BC), 0x05C7))
+HOLAM_POINTS: frozenset[str] = frozenset(("\u05B9", "\u05BA"))
+DAGESH_POINT: str = "\u05BC"
+YOD_LENGTHENED_POINTS: frozenset[str] = frozenset(("\u05B4", "\u05B5"))
+
+# Proclitic letters (and, the, in, as, to, from, that) and how many may be stacked on a word:
+PROCLITICS: frozenset[str] = frozenset(("ו", "ה", "ב", "כ", "ל", "מ", "ש"))
+PROCLITIC_DEPTH_MAX: int = 3
+
+# Shortest stem left after stripping proclitics:
+STEM_LENGTH_MIN: int = 2
+
+# Punctuation that is dropped (geresh, gershayim, quotes) or treated as a word break (maqaf):
+DROPPED_CHARACTERS: frozenset[str] = frozenset(("׳", "״", "'", '"', "`"))
+BREAK_CHARACTERS: frozenset[str] = frozenset(("־", "-"))
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+HEBREW NORMALIZATION FUNCTIONS
+
+"""
+
+
+def is_hebrew(text: str) -> bool:
+    """
+    Checks whether the text contains at least one Hebrew letter.
+
+    :param str text: Text to inspect.
+    :return bool: True if a character from the Hebrew block is present.
+    """
+
+    # Returning:
+    return any("א" <= character <= "ת" for character in text)
+
+
+def strip_niqqud(text: str) -> str:
+    """
+    Removes niqqud (vowel points), dagesh, shin/sin dots and cantillation marks, leaving bare
+    consonants. All of these are Unicode non-spacing marks.
+
+    ## Example:
+        >>> strip_niqqud("כָּתַב")
+        'כתב'
+
+    :param str text: Pointed Hebrew text.
+    :return str: Unpointed text.
+    """
+
+    # Removing combining marks:
+    unpointed_text: str = "".join(
+        character for character
+        in unicodedata.normalize("NFD", text)
+        if unicodedata.category(character) != "Mn"
+        )
+
+    # Returning:
+    return unpointed_text
+
+
+def normalize_word(word: str) -> str:
+    """
+    Normalizes a single unpointed Hebrew word as written: final letters are unified with regular
+    ones, every other letter is kept.
+
+    ## Example:
+        >>> normalize_word("שולחן")
+        'שולחנ'
+
+    :param str word: Unpointed Hebrew word.
+    :return str: Normalized key.
+    """
+
+    # Returning with final letters unified:
+    return "".join(FINAL_LETTERS.get(character, character) for character in word)
+
+
+def __split_clusters(word: str) -> list[tuple[str, str]]:
+    """
+    Splits a word into letters with the combining marks (niqqud) written on them.
+    """
+
+    # Attaching marks to the preceding letter:
+    cluster_list: list[tuple[str, str]] = []
+    for character in unicodedata.normalize("NFD", word):
+        if unicodedata.category(character) == "Mn":
+            if cluster_list:
+                cluster_list[-1] = (cluster_list[-1][0], cluster_list[-1][1] + character)
+        else:
+            cluster_list.append((character, ""))
+
+    # Returning:
+    return cluster_list
+
+
+def fold_word(word: str) -> str:
+    """
+    Folds a single Hebrew word to a spelling-insensitive key, so that defective (ktiv haser) and
+    plene (ktiv male) spellings share it: vav and yod after the first letter are dropped when they
+    stand for vowels, final letters are unified and niqqud is removed. In pointed words the niqqud
+    tells vowel letters from consonants (`בַּיִת` keeps its yod, `שׁוּלְחָן` loses its vav); in
+    unpointed words every vav and yod after the first letter is dropped.
+
+    ## Examples:
+        >>> fold_word("שׁוּלְחָן"), fold_word("שולחן"), fold_word("בַּיִת"), fold_word("בית")
+        ('שלחנ', 'שלחנ', 'בית', 'בת')
+
+    :param str word: Hebrew word, pointed or not.
+    :return str: Folded key.
+    """
+
+    # Dropping vowel letters:
+    cluster_list: list[tuple[str, str]] = __split_clusters(word)
+    is_pointed: bool = any(marks for _, marks in cluster_list)
+    folded_letter_list: list[str] = []
+    for cluster_position, (character, marks) in enumerate(cluster_list):
+        if cluster_position and character in MATRES_LECTIONIS:
+            if not is_pointed:
+                continue
+            if character == "ו" and (HOLAM_POINTS & set(marks) or marks == DAGESH_POINT):
+                continue
+            if character == "י" and not marks and YOD_LENGTHENED_POINTS & set(cluster_list[cluster_position - 1][1]):
+                continue
+        folded_letter_list.append(FINAL_LETTERS.get(character, character))
+
+    # Returning:
+    return "".join(folded_letter_list)
+
+
+def __split_words(text: str) -> list[str]:
+    """
+    Splits Hebrew text into words, keeping their niqqud: geresh and quotes are dropped, maqaf and
+    hyphens break words.
+    """
+
+    # Returning:
+    return "".join(
+        " " if character in BREAK_CHARACTERS else character
+        for character in unicodedata.normalize("NFC", text)
+        if character not in DROPPED_CHARACTERS
+        ).split()
+
+
+def normalize(text: Optional[str]) -> Optional[str]:
+    """
+    Builds a niqqud-insensitive, final-letter-aware search key from Hebrew text, keeping its
+    spelling (see `fold` for the spelling-insensitive key). Used both at compose time (for the
+    indexed key column) and at query time (for user input), so the two always agree.
+
+    ## Examples:
+        >>> normalize("שֻׁלְחָן")
+        'שלחנ'
+        >>> normalize("בית־ספר")
+        'בית ספר'
+
+    :param Optional[str] text: Hebrew text, pointed or not.
+    :return Optional[str]: Normalized key, or None if the text holds no Hebrew letters.
+    """
+
+    # Returning None on empty or non-Hebrew text:
+    if not text or not is_hebrew(text):
+        return None
+
+    # Normalizing every unpointed word:
+    normalized_text: str = " ".join(filter(None, (
+        normalize_word(strip_niqqud(word))
+        for word in __split_words(text)
+        )))
+
+    # Returning:
+    return normalized_text or None
+
+
+def fold(text: Optional[str]) -> Optional[str]:
+    """
+    Builds the spelling-insensitive search key of Hebrew text (see `fold_word`). Lookups try the
+    `normalize` key first and fall back to this one, ranked below it, since different words may
+    share a folded key (the unpointed query `בית` folds to `בת`, the key of `בַּת`, while it
+    matches `בַּיִת` as written).
+
+    ## Example:
+        >>> fold("שׁוּלְחָן"), fold("שולחן")
+        ('שלחנ', 'שלחנ')
+
+    :param Optional[str] text: Hebrew text, pointed or not.
+    :return Optional[str]: Folded key, or None if the text holds no Hebrew letters.
+    """
+
+    # Returning None on empty or non-Hebrew text:
+    if not text or not is_hebrew(text):
+        return None
+
+    # Folding every word:
+    folded_text: str = " ".join(filter(None, (
+        fold_word(word)
+        for word in __split_words(text)
+        )))
+
+    # Returning:
+    return folded_text or None
+
+
+def normalize_root(text: Optional[str]) -> Optional[str]:
+    """
+    Builds the canonical form of a root (shoresh): its letters joined with dashes, the last one
+    written in final form. Accepts Pealim's `"כ - ת - ב"` notation as well as typed input such as
+    `"כתב"` or `"שלמ"`.
+
+    ## Examples:
+        >>> normalize_root("ש - ל - ם")
+        'ש-ל-ם'
+        >>> normalize_root("שלמ")
+        'ש-ל-ם'
+
+    :param Optional[str] text: Root in any notation.
+    :return Optional[str]: Canonical root, or None if it holds fewer than two Hebrew letters.
+    """
+
+    # Collecting letters with regular forms:
+    root_letter_list: list[str] = [
+        FINAL_LETTERS.get(character, character)
+        for character in strip_niqqud(text or "")
+        if "א" <= character <= "ת"
+        ]
+    if len(root_letter_list) < 2:
+        return None
+
+    # Writing last letter in final form:
+    regular_letters: dict[str, str] = {regular: final for final, regular in FINAL_LETTERS.items()}
+    root_letter_list[-1] = regular_letters.get(root_letter_list[-1], root_letter_list[-1])
+
+    # Returning:
+    return "-".join(root_letter_list)
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+HEBREW TOKENIZATION FUNCTIONS
+
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits running Hebrew text into words, keeping their niqqud. Anything that is not a Hebrew
+    letter, a combining mark, geresh or gershayim acts as a separator (maqaf included).
+
+    ## Example:
+        >>> tokenize("וּבַבַּיִת, הַיֶּלֶד כָּתַב.")
+        ['וּבַבַּיִת', 'הַיֶּלֶד', 'כָּתַב']
+
+    :param str text: Running text.
+    :return list[str]: Hebrew words in order of appearance.
+    """
+
+    # Collecting runs of word characters:
+    token_list: list[str] = []
+    token_character_list: list[str] = []
+    for character in unicodedata.normalize("NFC", text) + " ":
+        if "א" <= character <= "ת" or character in "׳״" or (token_character_list and unicodedata.category(character) == "Mn"):
+            token_character_list.append(character)
+        elif token_character_list:
+            token_list.append("".join(token_character_list))
+            token_character_list = []
+
+    # Returning:
+    return token_list
+
+
+def generate_candidates(token: str) -> list[tuple[str, str, str]]:
+    """
+    Generates lookup candidates for a word by stripping up to `PROCLITIC_DEPTH_MAX` leading
+    proclitics, one letter at a time. Stripping happens before normalization, so that a stem
+    starting with vav or yod keeps it the same way the stored keys do. Every candidate carries
+    the stem's `normalize` key and its `fold` key, which is only tried when no candidate matches
+    as written.
+
+    ## Example:
+        >>> generate_candidates("ובבית")
+        [('', 'ובבית', 'ובבת'), ('ו', 'בבית', 'בבת'), ('וב', 'בית', 'בת'), ('ובב', 'ית', 'ית')]
+
+    :param str token: Single Hebrew word, pointed or not.
+    :return list[tuple[str, str, str]]: Stripped proclitics, normalized and folded stem keys,
+        unstripped first.
+    """
+
+    # Splitting letters from their niqqud, removing punctuation:
+    cluster_list: list[tuple[str, str]] = [
+        (character, marks) for character, marks
+        in __split_clusters(token)
+        if character not in DROPPED_CHARACTERS
+        ]
+    if not cluster_list:
+        return []
+    unpointed_token: str = "".join(character for character, _ in cluster_list)
+
+    # Stripping proclitics one by one:
+    candidate_list: list[tuple[str, str, str]] = []
+    for prefix_length in range(0, PROCLITIC_DEPTH_MAX + 1):
+        if prefix_length:
+            if unpointed_token[prefix_length - 1] not in PROCLITICS:
+                break
+            if len(unpointed_token) - prefix_length < STEM_LENGTH_MIN:
+                break
+        stem_clusters: list[tuple[str, str]] = cluster_list[prefix_length:]
+        candidate_list.append((
+            unpointed_token[:prefix_length],
+            normalize_word(unpointed_token[prefix_length:]),
+            fold_word("".join(character + marks for character, marks in stem_clusters))
+            ))
+
+    # Returning:
+    return candidate_list
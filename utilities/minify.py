@@ -0,0 +1,115 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Regex-related library:
+import re
+
+# Typing and annotations import:
+from typing import Optional
+
+# HTML composition related imports:
+from bs4 import BeautifulSoup, Comment, NavigableString
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+MINIFY VARIABLES BLOCK
+
+"""
+
+
+# Elements that never render anything useful in a stored container:
+MINIFY_DROPPED_TAGS: tuple[str, ...] = (
+    "script", "style", "noscript", "iframe", "ins", "nav", "form", "button", "input", "select", "link", "meta",
+    )
+
+# Pealim scaffolding that `word.scss` hides anyway (ads, popover notes, collapse toggles, print
+# and media rows). Matched before attributes are stripped:
+MINIFY_DROPPED_SELECTORS: tuple[str, ...] = (
+    "[class*='ad-banner']",
+    "[class*='adsbygoogle']",
+    ".popovers-note",
+    ".small[style*='font-style: italic']",
+    "em.small",
+    "[data-toggle='collapse']",
+    "[data-target*='collapse']",
+    ".visible-print-inline",
+    ".row.source-media",
+    "[hidden]",
+    )
+
+# Inline styles that hide an element, matched before attributes are stripped:
+MINIFY_HIDDEN_STYLE_PATTERN = re.compile(r"(?:^|;)\s*display\s*:\s*none\s*(?:!important\s*)?(?:;|$)", re.IGNORECASE)
+
+# Attributes kept on the remaining elements, everything else (styles, handlers, data-, aria-) goes:
+MINIFY_KEPT_ATTRIBUTES: frozenset[str] = frozenset((
+    "id", "class", "href", "colspan", "rowspan", "lang", "dir", "title",
+    ))
+
+# Parents in which whitespace-only text never renders:
+MINIFY_WHITESPACE_PARENTS: frozenset[str] = frozenset((
+    "table", "thead", "tbody", "tfoot", "tr", "ul", "ol", "dl",
+    ))
+
+# Any run of whitespace:
+MINIFY_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+MINIFY FUNCTIONS BLOCK
+
+"""
+
+
+def minify_container(html_container: Optional[str]) -> Optional[str]:
+    """
+    Slims a stored HTML container: drops comments, scripts, ads, Pealim scaffolding that the
+    word page hides and elements hidden by a `hidden` attribute or an inline `display: none`,
+    strips attributes outside `MINIFY_KEPT_ATTRIBUTES` and collapses whitespace. Classes, ids
+    and links are kept, so cross-reference links and `word.scss` keep working on the result.
+
+    ## Example:
+        >>> minify_container('<div class="lead"  style="x">  to   write <!-- ad --></div>')
+        '<div class="lead"> to write </div>'
+
+    :param Optional[str] html_container: HTML container.
+    :return Optional[str]: Slimmed container, unchanged if it is empty.
+    """
+
+    # Returning container as is, if it is empty:
+    if not html_container:
+        return html_container
+    soup = BeautifulSoup(html_container, "html.parser")
+
+    # Dropping comments, unused elements and hidden scaffolding:
+    for comment in soup.find_all(string = lambda text: isinstance(text, Comment)):
+        comment.extract()
+    for element in soup.find_all(MINIFY_DROPPED_TAGS):
+        element.decompose()
+    for element in soup.select(", ".join(MINIFY_DROPPED_SELECTORS)):
+        element.decompose()
+    for element in soup.find_all(style = MINIFY_HIDDEN_STYLE_PATTERN):
+        element.decompose()
+
+    # Stripping attributes:
+    for element in soup.find_all(True):
+        element.attrs = {
+            attribute_name: attribute_value
+            for attribute_name, attribute_value in element.attrs.items()
+            if attribute_name in MINIFY_KEPT_ATTRIBUTES
+            }
+
+    # Collapsing whitespace, dropping it where it never renders:
+    for text_node in soup.find_all(string = True):
+        if text_node.parent is not None and text_node.parent.name == "pre":
+            continue
+        collapsed_text: str = MINIFY_WHITESPACE_PATTERN.sub(" ", str(text_node))
+        if collapsed_text == " " and text_node.parent is not None and text_node.parent.name in MINIFY_WHITESPACE_PARENTS:
+            text_node.extract()
+        elif collapsed_text != str(text_node):
+            text_node.replace_with(NavigableString(collapsed_text))
+
+    # Returning:
+    return str(soup).strip()
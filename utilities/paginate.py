@@ -0,0 +1,142 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Typing and annotations import:
+from typing import Any, Optional
+
+# Database-related import:
+from sqlalchemy import select
+from sqlalchemy.orm import Query
+from utilities.database import DATABASE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PAGE BOUNDARY INDEX CLASS INSTANCE
+
+"""
+
+
+class PageBoundaryIndex:
+    """
+    Sparse index of page boundaries for keyset (seek) pagination: the first key of every page.
+    A page is then read with `WHERE key >= boundary ORDER BY key LIMIT per_page`, which seeks
+    straight to its first row through the key's index, so page 90 costs the same as page 1.
+    `OFFSET` would instead step over every row of the preceding pages.
+
+    Attributes:
+        per_page (int): Rows per page
+        boundary_list (list): Sorted first key of every page
+        total_count (int): Number of rows the index was built from
+    """
+
+    def __init__(self, per_page: int, boundary_list: list, total_count: int):
+        """
+        Initialize the index from precomputed boundaries.
+
+        :param int per_page: Rows per page;
+        :param list boundary_list: First key of every page, in key order;
+        :param int total_count: Total number of rows.
+        """
+
+        # Core attributes:
+        self.per_page: int = per_page
+        self.boundary_list: list = boundary_list
+        self.total_count: int = total_count
+
+
+    @property
+    def total_pages(self) -> int:
+        """
+        Number of pages, 0 for an empty listing.
+        """
+
+        # Returning:
+        return len(self.boundary_list)
+
+
+    def clamp(self, page: int) -> int:
+        """
+        Clamps a requested page number into `1..total_pages` (1 for an empty listing).
+        """
+
+        # Returning:
+        return max(1, min(page, self.total_pages))
+
+
+    def boundary(self, page: int) -> Optional[Any]:
+        """
+        Returns the first key of a page, or None if the page does not exist.
+
+        :param int page: Page number, starting from 1.
+        :return Optional[Any]: First key of the page.
+        """
+
+        # Returning:
+        if not 1 <= page <= self.total_pages:
+            return None
+        return self.boundary_list[page - 1]
+
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PAGINATION FUNCTIONS
+
+"""
+
+
+def build_page_boundaries(key_column, per_page: int) -> PageBoundaryIndex:
+    """
+    Builds the boundary index with one ordered scan of the key column alone (an index-only scan
+    for indexed keys), keeping every `per_page`-th key.
+
+    :param key_column: Unique, indexed model column the listing is ordered by;
+    :param int per_page: Rows per page.
+
+    :return PageBoundaryIndex: Populated index.
+    """
+
+    # Scanning keys in order:
+    boundary_list: list = []
+    total_count: int = 0
+    for key in DATABASE.session.execute(select(key_column).order_by(key_column)).scalars():
+        if total_count % per_page == 0:
+            boundary_list.append(key)
+        total_count += 1
+
+    # Returning:
+    return PageBoundaryIndex(
+        per_page = per_page,
+        boundary_list = boundary_list,
+        total_count = total_count
+        )
+
+
+def seek_page(query: Query, key_column, boundary_index: PageBoundaryIndex, page: int) -> list:
+    """
+    Reads a single page of a listing by seeking to its boundary key.
+
+    :param Query query: Listing query (without ordering or limits);
+    :param key_column: Column the boundary index was built on;
+    :param PageBoundaryIndex boundary_index: Page boundaries of the listing;
+    :param int page: Page number, starting from 1.
+
+    :return list: Rows of the page, empty if the page does not exist.
+    """
+
+    # Returning nothing for pages outside the listing:
+    page_boundary: Optional[Any] = boundary_index.boundary(page)
+    if page_boundary is None:
+        return []
+
+    # Seeking to the page's first row:
+    page_rows: list = query\
+        .filter(key_column >= page_boundary)\
+        .order_by(key_column)\
+        .limit(boundary_index.per_page)\
+        .all()
+
+    # Returning:
+    return page_rows
@@ -0,0 +1,235 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Unicode-related library:
+import unicodedata
+
+# Typing and annotations import:
+from typing import Optional
+
+# HTML composition related imports:
+from bs4 import BeautifulSoup
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PARADIGM VARIABLES BLOCK
+
+"""
+
+
+# Marker left in containers where the paradigm table was, the word page renders it there:
+PARADIGM_PLACEHOLDER: str = '<div class="paradigm-slot"></div>'
+
+# Sections (cell groups) rendered with the page, the rest are fetched when scrolled into view:
+PARADIGM_SECTIONS_EAGER: int = 1
+
+# Labels of cell groups (the part of a Pealim cell id before the person/number slot):
+PARADIGM_GROUP_LABELS: dict[str, dict[str, str]] = {
+    "AP":       {"en": "Present tense", "ru": "Настоящее время", "he": "הווה"},
+    "PERF":     {"en": "Past tense", "ru": "Прошедшее время", "he": "עבר"},
+    "IMPF":     {"en": "Future tense", "ru": "Будущее время", "he": "עתיד"},
+    "IMP":      {"en": "Imperative", "ru": "Повелительное наклонение", "he": "ציווי"},
+    "INF":      {"en": "Infinitive", "ru": "Инфинитив", "he": "שם הפועל"},
+    "a":        {"en": "Adjective", "ru": "Прилагательное", "he": "שם תואר"},
+    "":         {"en": "Declension", "ru": "Склонение", "he": "נטייה"},
+    "passive":  {"en": "Passive", "ru": "Пассив", "he": "סביל"},
+    }
+
+# Labels of person, gender and number slots:
+PARADIGM_SLOT_LABELS: dict[str, dict[str, str]] = {
+    "1s":   {"en": "I", "ru": "я", "he": "אני"},
+    "1p":   {"en": "we", "ru": "мы", "he": "אנחנו"},
+    "2ms":  {"en": "you (m. sg.)", "ru": "ты (м.)", "he": "אתה"},
+    "2fs":  {"en": "you (f. sg.)", "ru": "ты (ж.)", "he": "את"},
+    "2mp":  {"en": "you (m. pl.)", "ru": "вы (м.)", "he": "אתם"},
+    "2fp":  {"en": "you (f. pl.)", "ru": "вы (ж.)", "he": "אתן"},
+    "3ms":  {"en": "he", "ru": "он", "he": "הוא"},
+    "3fs":  {"en": "she", "ru": "она", "he": "היא"},
+    "3p":   {"en": "they", "ru": "они", "he": "הם / הן"},
+    "3mp":  {"en": "they (m.)", "ru": "они (м.)", "he": "הם"},
+    "3fp":  {"en": "they (f.)", "ru": "они (ж.)", "he": "הן"},
+    "ms":   {"en": "m. sg.", "ru": "м. р., ед. ч.", "he": "זכר יחיד"},
+    "fs":   {"en": "f. sg.", "ru": "ж. р., ед. ч.", "he": "נקבה יחידה"},
+    "mp":   {"en": "m. pl.", "ru": "м. р., мн. ч.", "he": "זכר רבים"},
+    "fp":   {"en": "f. pl.", "ru": "ж. р., мн. ч.", "he": "נקבה רבות"},
+    "s":    {"en": "singular", "ru": "ед. ч.", "he": "יחיד"},
+    "p":    {"en": "plural", "ru": "мн. ч.", "he": "רבים"},
+    "sc":   {"en": "singular construct", "ru": "ед. ч., смихут", "he": "יחיד נסמך"},
+    "pc":   {"en": "plural construct", "ru": "мн. ч., смихут", "he": "רבים נסמך"},
+    "L":    {"en": "", "ru": "", "he": ""},
+    }
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PARADIGM COMPOSITION FUNCTIONS
+
+"""
+
+
+def __iterate_cells(soup: BeautifulSoup):
+    """
+    Yields paradigm cells: elements with an `id` that directly own at least one `.menukad`
+    (not through a nested element with its own `id`).
+    """
+
+    # Yielding cells with their own forms:
+    for cell in soup.find_all(attrs = {"id": True}):
+        menukad_list: list = [
+            menukad for menukad in cell.find_all(class_ = "menukad")
+            if menukad.find_parent(attrs = {"id": True}) is cell
+            ]
+        if menukad_list:
+            yield cell, menukad_list
+
+
+def parse_paradigm(html_container_he: Optional[str], html_container_en: Optional[str] = None) -> Optional[list[list]]:
+    """
+    Parses the conjugation or declension table into a compact structure. Forms are read from the
+    Hebrew container; transcriptions from the English one (Latin script) when it has the same
+    cell, from the Hebrew one otherwise.
+
+    ## Example:
+        >>> parse_paradigm(html_container_he)[:2]
+        [['AP-ms', ['כּוֹתֵב'], 'kotev'], ['AP-fs', ['כּוֹתֶבֶת'], 'kotevet']]
+
+    :param Optional[str] html_container_he: Hebrew HTML container;
+    :param Optional[str] html_container_en: English HTML container.
+
+    :return Optional[list[list]]: `[cell id, [NFC forms], transcription]` in table order, or None
+        if the container holds no paradigm.
+    """
+
+    # Returning None, if HTML container does not exist:
+    if not html_container_he:
+        return None
+
+    # Collecting English transcriptions by cell id:
+    transcription_map: dict[str, str] = {}
+    if html_container_en:
+        for cell, _ in __iterate_cells(BeautifulSoup(html_container_en, "html.parser")):
+            transcription = cell.find(class_ = "transcription")
+            if transcription:
+                transcription_map[cell["id"]] = transcription.get_text(strip = True)
+
+    # Collecting forms from Hebrew cells:
+    paradigm: list[list] = []
+    for cell, menukad_list in __iterate_cells(BeautifulSoup(html_container_he, "html.parser")):
+        form_list: list[str] = []
+        for menukad in menukad_list:
+            form_text: str = unicodedata.normalize("NFC", menukad.get_text(strip = True))
+            if form_text and form_text not in form_list:
+                form_list.append(form_text)
+        if not form_list:
+            continue
+        transcription = cell.find(class_ = "transcription")
+        paradigm.append([
+            cell["id"],
+            form_list,
+            transcription_map.get(cell["id"]) or (transcription.get_text(strip = True) if transcription else None),
+            ])
+
+    # Returning:
+    return paradigm or None
+
+
+def strip_paradigm(html_container: Optional[str]) -> Optional[str]:
+    """
+    Removes paradigm tables from a container once they are stored in structured form. The first
+    one is replaced with `PARADIGM_PLACEHOLDER`, so the word page can render the paradigm in its
+    original position.
+
+    :param Optional[str] html_container: HTML container.
+    :return Optional[str]: Container without paradigm tables, unchanged if it has none.
+    """
+
+    # Returning container as is, if it is empty:
+    if not html_container:
+        return html_container
+
+    # Finding tables holding paradigm cells:
+    soup = BeautifulSoup(html_container, "html.parser")
+    table_list: list = []
+    for cell, _ in __iterate_cells(soup):
+        table = cell.find_parent("table")
+        if table and table not in table_list:
+            table_list.append(table)
+    if not table_list:
+        return html_container
+
+    # Replacing first table with placeholder and dropping the rest:
+    table_list[0].replace_with(BeautifulSoup(PARADIGM_PLACEHOLDER, "html.parser"))
+    for table in table_list[1:]:
+        table.decompose()
+
+    # Returning:
+    return str(soup)
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PARADIGM RENDERING FUNCTIONS
+
+"""
+
+
+def __split_cell_id(cell_id: str) -> tuple[str, str]:
+    """
+    Splits a Pealim cell id into group and slot: `"PERF-1s"` → `("PERF", "1s")`,
+    `"ms-a"` → `("a", "ms")`, `"sc"` → `("", "sc")`.
+    """
+
+    # Splitting on the slot, which is either the last or the first dash-separated part:
+    cell_id_parts: list[str] = cell_id.split("-")
+    if cell_id_parts[-1] in PARADIGM_SLOT_LABELS:
+        return "-".join(cell_id_parts[:-1]), cell_id_parts[-1]
+    if cell_id_parts[0] in PARADIGM_SLOT_LABELS:
+        return "-".join(cell_id_parts[1:]), cell_id_parts[0]
+
+    # Returning unknown ids as their own group:
+    return cell_id, ""
+
+
+def __label(label_map: dict[str, dict[str, str]], key: str, language: str) -> str:
+    """
+    Looks a label up for the language, falling back to English and then to the key itself.
+    """
+
+    # Returning:
+    labels: Optional[dict[str, str]] = label_map.get(key)
+    if labels is None:
+        return key
+    return labels.get(language, labels["en"])
+
+
+def group_paradigm(paradigm: Optional[list[list]], language: str) -> list[dict]:
+    """
+    Groups a stored paradigm for rendering, with group and slot labels in the page language.
+
+    :param Optional[list[list]] paradigm: Structure returned by `parse_paradigm`;
+    :param str language: Page language (`"ru"`, `"en"` or `"he"`).
+
+    :return list[dict]: Groups in table order, each with a `label` and its `cells` (`label`,
+        `forms`, `transcription`).
+    """
+
+    # Grouping cells in order of first appearance:
+    group_map: dict[str, dict] = {}
+    for cell_id, form_list, transcription in paradigm or ():
+        group_key, slot_key = __split_cell_id(cell_id)
+        if group_key not in group_map:
+            group_label: str = " ".join(
+                __label(PARADIGM_GROUP_LABELS, group_part, language)
+                for group_part in group_key.split("-")
+                ) if group_key else __label(PARADIGM_GROUP_LABELS, "", language)
+            group_map[group_key] = {"label": group_label, "cells": []}
+        group_map[group_key]["cells"].append({
+            "label": __label(PARADIGM_SLOT_LABELS, slot_key, language) if slot_key else "",
+            "forms": form_list,
+            "transcription": transcription,
+            })
+
+    # Returning:
+    return list(group_map.values())
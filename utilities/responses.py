@@ -0,0 +1,172 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Compression and hashing libraries:
+import gzip
+import hashlib
+
+# Brotli is optional, responses fall back to gzip without it:
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Typing and annotations import:
+from typing import Callable
+
+# Flask-related imports:
+from flask import Response, make_response, request
+
+# Cache import:
+from utilities.cache import RenderCache
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RESPONSES VARIABLES BLOCK
+
+"""
+
+
+# Dynamic pages are always revalidated, which costs a 304 when nothing changed:
+RESPONSE_CACHE_CONTROL: str = "no-cache"
+
+# Compression settings:
+RESPONSE_COMPRESSIBLE_MIMETYPES: frozenset[str] = frozenset((
+    "text/html", "text/css", "text/plain", "text/javascript",
+    "application/javascript", "application/json", "image/svg+xml",
+    ))
+RESPONSE_COMPRESS_SIZE_MIN: int = 1024
+RESPONSE_GZIP_LEVEL: int = 6
+RESPONSE_BROTLI_QUALITY: int = 5
+
+# Compressed bodies of tagged responses, keyed by ETag and encoding:
+RESPONSE_VARIANT_CACHE_BYTES_MAX: int = 16 * 1024 * 1024
+RESPONSE_VARIANT_CACHE = RenderCache(
+    name = "compressed responses",
+    byte_limit = RESPONSE_VARIANT_CACHE_BYTES_MAX
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CONDITIONAL RESPONSE FUNCTIONS
+
+"""
+
+
+def build_etag(*parts) -> str:
+    """
+    Builds a short entity tag from the values a response depends on.
+
+    ## Example:
+        >>> build_etag("word.html", "en", 12, 3, (False, True, False))
+        '375af2f2ffb5535e'
+
+    :param parts: Values identifying the response content (version stamps, statuses, language).
+    :return str: Hexadecimal tag, without quotes.
+    """
+
+    # Returning:
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size = 8).hexdigest()
+
+
+def respond_conditionally(etag: str, render: Callable[[], str]) -> Response:
+    """
+    Answers `304 Not Modified` if the client already holds the tagged response, without
+    rendering it; renders and tags it otherwise. Tags are weak, so the compressed and plain
+    bodies of the same page share one.
+
+    :param str etag: Tag returned by `build_etag`;
+    :param Callable render: Function rendering the page body.
+
+    :return Response: Empty 304 or the rendered page.
+    """
+
+    # Short-circuiting on a matching tag:
+    if request.if_none_match.contains_weak(etag):
+        response: Response = make_response("", 304)
+    else:
+        response: Response = make_response(render())
+
+    # Tagging response:
+    response.set_etag(etag, weak = True)
+    response.headers["Cache-Control"] = RESPONSE_CACHE_CONTROL
+
+    # Returning:
+    return response
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RESPONSE HOOK FUNCTIONS
+
+"""
+
+
+def __compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compresses a response body with the given content encoding (`"br"` or `"gzip"`).
+    """
+
+    # Returning:
+    if encoding == "br":
+        return brotli.compress(data, quality = RESPONSE_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel = RESPONSE_GZIP_LEVEL, mtime = 0)
+
+
+def finalize_response(response: Response) -> Response:
+    """
+    Registered as an `after_request` hook. Dynamic text responses without a tag of their own are
+    tagged by content hash and answered with 304 when the client holds them (the page is still
+    rendered, but not re-sent). Text bodies are then compressed with brotli or gzip, whichever
+    the client prefers; compressed bodies of tagged responses are cached, so hot pages are
+    compressed once per content version. Static files are left to Flask's file handler.
+
+    :param Response response: Response returned by the view.
+    :return Response: Tagged, possibly compressed, response.
+    """
+
+    # Leaving files, errors and non-text responses as they are:
+    if response.direct_passthrough or response.status_code != 200:
+        return response
+    if response.mimetype not in RESPONSE_COMPRESSIBLE_MIMETYPES:
+        return response
+
+    # Tagging and answering conditional requests:
+    if request.method in ("GET", "HEAD") and "ETag" not in response.headers:
+        response.add_etag(weak = True)
+        response.headers.setdefault("Cache-Control", RESPONSE_CACHE_CONTROL)
+        response.make_conditional(request)
+        if response.status_code != 200:
+            return response
+
+    # Choosing encoding supported by both sides:
+    response.vary.add("Accept-Encoding")
+    if "Content-Encoding" in response.headers:
+        return response
+    encoding: str = request.accept_encodings.best_match(("br", "gzip") if brotli else ("gzip",))
+    if not encoding:
+        return response
+    data: bytes = response.get_data()
+    if len(data) < RESPONSE_COMPRESS_SIZE_MIN:
+        return response
+
+    # Compressing, reusing the cached body of a tagged response:
+    etag, _ = response.get_etag()
+    if etag:
+        compressed_data: bytes = RESPONSE_VARIANT_CACHE.get(
+            group = etag,
+            variant = encoding,
+            render = lambda: __compress(data = data, encoding = encoding)
+            )
+    else:
+        compressed_data: bytes = __compress(data = data, encoding = encoding)
+
+    # Replacing body:
+    response.set_data(compressed_data)
+    response.headers["Content-Encoding"] = encoding
+
+    # Returning:
+    return response
@@ -0,0 +1,229 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Random, array, binary search and threading imports:
+import random
+import threading
+from array import array
+from bisect import bisect_left
+
+# Ordered mapping import:
+from collections import OrderedDict
+
+# Typing and annotations import:
+from typing import Optional
+
+# Database-related import:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities import status
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SAMPLING VARIABLES BLOCK
+
+"""
+
+
+# Status filters, matching the names of `status.STATUS_COLUMNS` (plus the complement of known words):
+SAMPLING_STATUS_FAVOURITE: str = "favourite"
+SAMPLING_STATUS_TO_LEARN: str = "to_learn"
+SAMPLING_STATUS_NOT_KNOWN: str = "not_known"
+
+# Status-filtered arrays kept per process, least recently used dropped first:
+SAMPLING_FILTERED_POOLS_MAX: int = 128
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+WORD POOL CLASS INSTANCE
+
+"""
+
+
+class WordPool:
+    """
+    Dense, sorted arrays of word indexes to draw random entries from: one for the whole
+    dictionary and one for every part of speech. A learner's status filter narrows such an
+    array once into an array of its own, cached until the learner's `STATE_VERSION` (every
+    status write bumps it, see `status.apply_statuses`) or their buffered changes of the
+    filtered flag differ. Buffered changes are merged in, not flushed, so drawing never breaks
+    up the write buffer's batches. Every draw, filtered or not, is then a single
+    `random.choice`, so it costs the same for any dictionary size.
+
+    Attributes:
+        pool_map (dict): Sorted word index arrays keyed by part of speech, None for any
+        filtered_map (OrderedDict): Filtered arrays with their state stamp, keyed by
+            `(learner ID, part of speech, status filter)`, least recently used first
+    """
+
+    def __init__(self, pool_map: dict[Optional[str], array]):
+        """
+        Initialize the pool from precomputed arrays.
+
+        :param dict pool_map: Sorted word index arrays keyed by part of speech.
+        """
+
+        # Core attributes:
+        self.pool_map: dict[Optional[str], array] = pool_map
+
+        # State attributes:
+        self.filtered_map: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+
+    @property
+    def parts_of_speech(self) -> list[str]:
+        """
+        Parts of speech that have a pool, in alphabetical order.
+        """
+
+        # Returning:
+        return sorted(part_of_speech for part_of_speech in self.pool_map if part_of_speech)
+
+
+    def pick(self, part_of_speech: Optional[str] = None, user_id: Optional[int] = None, status_filter: str = "") -> Optional[int]:
+        """
+        Draws a random word index matching the filters.
+
+        :param Optional[str] part_of_speech: Part of speech (e.g. `"Verb"`), None for any;
+        :param Optional[int] user_id: Learner whose statuses the filter reads;
+        :param str status_filter: One of the `SAMPLING_STATUS_*` filters, empty for any.
+
+        :return Optional[int]: Word index, or None if no word matches.
+        """
+
+        # Choosing the matching array:
+        word_index_array: Optional[array] = self.pool_map.get(part_of_speech or None)
+        if word_index_array and status_filter:
+            word_index_array = self.__read_filtered(
+                part_of_speech = part_of_speech or None,
+                user_id = user_id,
+                status_filter = status_filter
+                )
+
+        # Returning:
+        return random.choice(word_index_array) if word_index_array else None
+
+
+    def __read_filtered(self, part_of_speech: Optional[str], user_id: Optional[int], status_filter: str) -> array:
+        """
+        Returns the array of a part of speech narrowed by a learner's status filter, building
+        it if the learner's stored or buffered statuses changed since it was cached.
+        """
+
+        # Stamping the learner's state: stored version and buffered values of the filtered flag
+        # (taken first, so a write in between is seen either way):
+        filtered_status: str = "known" if status_filter == SAMPLING_STATUS_NOT_KNOWN else status_filter
+        pending_flags: tuple[tuple[int, bool], ...] = tuple(sorted(
+            (word_index, word_pending[filtered_status])
+            for word_index, word_pending in status.STATUS_WRITE_BUFFER.pending_state(user_id = user_id).items()
+            if filtered_status in word_pending
+            ))
+        state_stamp: tuple = (status.read_state_version(user_id = user_id), pending_flags)
+
+        # Serving a current cached array:
+        key: tuple = (user_id, part_of_speech, status_filter)
+        with self.lock:
+            cached_entry: Optional[tuple[tuple, array]] = self.filtered_map.get(key)
+            if cached_entry is not None and cached_entry[0] == state_stamp:
+                self.filtered_map.move_to_end(key)
+                return cached_entry[1]
+
+        # Reading the learner's flagged words, with buffered values applied:
+        flagged_set: set[int] = set()
+        if filtered_status in status.STATUS_COLUMNS:
+            flagged_set.update(status.read_flagged_indexes(user_id = user_id, status = filtered_status))
+            for word_index, value in pending_flags:
+                if value:
+                    flagged_set.add(word_index)
+                else:
+                    flagged_set.discard(word_index)
+
+        # Narrowing the pool with them:
+        word_index_array: array = self.pool_map[part_of_speech]
+        if status_filter in (SAMPLING_STATUS_FAVOURITE, SAMPLING_STATUS_TO_LEARN):
+            filtered_array: array = array("q", (
+                word_index for word_index in sorted(flagged_set)
+                if self.__contains(word_index_array, word_index)
+                ))
+        elif status_filter == SAMPLING_STATUS_NOT_KNOWN:
+            filtered_array: array = array("q", (
+                word_index for word_index in word_index_array
+                if word_index not in flagged_set
+                )) if flagged_set else word_index_array
+        else:
+            filtered_array: array = array("q")
+
+        # Storing, dropping least recently used arrays:
+        with self.lock:
+            self.filtered_map[key] = (state_stamp, filtered_array)
+            self.filtered_map.move_to_end(key)
+            while len(self.filtered_map) > SAMPLING_FILTERED_POOLS_MAX:
+                self.filtered_map.popitem(last = False)
+
+        # Returning:
+        return filtered_array
+
+
+    @staticmethod
+    def __contains(word_index_array: array, word_index: int) -> bool:
+        """
+        Binary search in a sorted pool array.
+        """
+
+        # Returning:
+        position: int = bisect_left(word_index_array, word_index)
+        return position < len(word_index_array) and word_index_array[position] == word_index
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SAMPLING FUNCTIONS BLOCK
+
+"""
+
+
+def part_of_speech(type_en: Optional[str]) -> Optional[str]:
+    """
+    Extracts the part of speech from an English entry type: its first word, the same rule the
+    `pos:` statistics counters use.
+
+    ## Example:
+        >>> part_of_speech("Verb – pa'al")
+        'Verb'
+
+    :param Optional[str] type_en: English entry type (`Word.TYPE_LANG_EN`).
+    :return Optional[str]: Part of speech, or None if the type is empty.
+    """
+
+    # Returning:
+    return type_en.split(" ", 1)[0] if type_en else None
+
+
+def build_word_pools() -> WordPool:
+    """
+    Builds all sampling arrays with a single pass over the narrow columns of the words table.
+
+    :return WordPool: Pool for the current dictionary contents.
+    """
+
+    # Querying indexes with their part of speech:
+    word_rows = DATABASE.session.query(
+        Word.INDEX,
+        Word.TYPE_LANG_EN,
+        ).order_by(Word.INDEX).all()
+
+    # Appending every word (in index order, so arrays stay sorted) to each pool it belongs to:
+    pool_map: dict[Optional[str], array] = {}
+    for word_row in word_rows:
+        for pos_key in {None, part_of_speech(word_row.TYPE_LANG_EN)}:
+            pool_map.setdefault(pos_key, array("q")).append(word_row.INDEX)
+
+    # Logging:
+    log.info(f"Built {len(pool_map)} random word pools from {len(word_rows)} entries")
+
+    # Returning:
+    return WordPool(pool_map = pool_map)
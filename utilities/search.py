@@ -0,0 +1,259 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Typing and annotations import:
+from typing import Optional
+
+# Unicode-related library:
+import unicodedata
+
+# Database-related import:
+from sqlalchemy import text
+from utilities.database import DATABASE
+from utilities.database.scripts import SEARCH_INDEX_TABLE
+
+# Hebrew normalization import:
+from utilities import hebrew
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SEARCH VARIABLES BLOCK
+
+"""
+
+
+# Search results page size:
+SEARCH_RESULTS_PER_PAGE: int = 50
+
+# Match tiers, best first:
+MATCH_TIER_EXACT: int = 0
+MATCH_TIER_PREFIX: int = 1
+MATCH_TIER_SUBSTRING: int = 2
+
+# Conditions comparing the lowercased search tokens and transcriptions of all languages against
+# the query (lowercased in Python on both sides):
+_SQL_TIER_EXACT: str = "EXISTS (SELECT 1 FROM json_each(words.MATCH_TERMS) WHERE value = :term)"
+_SQL_TIER_PREFIX: str = "EXISTS (SELECT 1 FROM json_each(words.MATCH_TERMS) WHERE value LIKE :prefix ESCAPE '\\')"
+
+# Candidate rows from the full-text index, the normalized and folded Hebrew keys (as indexed
+# ranges) and exact inflected forms (vocalised, normalized or folded):
+_SQL_SEARCH_CANDIDATES: str = f"""
+        SELECT rowid AS ID, rank AS MATCH_SCORE FROM {SEARCH_INDEX_TABLE}
+        WHERE {SEARCH_INDEX_TABLE} MATCH :expression
+        UNION ALL
+        SELECT ID, 0 AS MATCH_SCORE FROM words
+        WHERE NORMALIZED_LANG_HE >= :key AND NORMALIZED_LANG_HE < :key_end
+        UNION ALL
+        SELECT ID, 0 AS MATCH_SCORE FROM words
+        WHERE FOLDED_LANG_HE >= :folded_key AND FOLDED_LANG_HE < :folded_key_end
+        UNION ALL
+        SELECT words.ID, 0 AS MATCH_SCORE FROM forms
+        JOIN words ON words."INDEX" = forms."INDEX"
+        WHERE forms.NORMALIZED_LANG_HE = :key OR forms.FORM_LANG_HE = :form
+        UNION ALL
+        SELECT words.ID, 0 AS MATCH_SCORE FROM forms
+        JOIN words ON words."INDEX" = forms."INDEX"
+        WHERE forms.FOLDED_LANG_HE = :folded_key"""
+
+# Total match count, answered from the indexes alone:
+SQL_SEARCH_COUNT: str = f"""
+    SELECT count(DISTINCT ID) FROM ({_SQL_SEARCH_CANDIDATES}
+        )
+    """
+
+# Single-pass search over all languages, projecting only the columns result cards need, with
+# the learner's statuses joined by primary key (all 0 without a learner):
+SQL_SEARCH_PAGE: str = f"""
+    WITH matches AS (
+        SELECT ID, min(MATCH_SCORE) AS MATCH_SCORE FROM ({_SQL_SEARCH_CANDIDATES}
+            )
+        GROUP BY ID
+        )
+    SELECT
+        words.ID,
+        words."INDEX",
+        words.TRANSLATION_LANG_HE,
+        words.TRANSLATION_LANG_EN,
+        words.TRANSLATION_LANG_RU,
+        CASE
+            WHEN {_SQL_TIER_EXACT}
+                OR words.NORMALIZED_LANG_HE = :key
+                OR words."INDEX" IN (
+                    SELECT "INDEX" FROM forms
+                    WHERE NORMALIZED_LANG_HE = :key OR FORM_LANG_HE = :form
+                    )
+            THEN {MATCH_TIER_EXACT}
+            WHEN {_SQL_TIER_PREFIX}
+                OR words.NORMALIZED_LANG_HE >= :key AND words.NORMALIZED_LANG_HE < :key_end
+                OR words.FOLDED_LANG_HE = :folded_key
+                OR words."INDEX" IN (SELECT "INDEX" FROM forms WHERE FOLDED_LANG_HE = :folded_key)
+            THEN {MATCH_TIER_PREFIX}
+            ELSE {MATCH_TIER_SUBSTRING}
+        END AS MATCH_TIER,
+        coalesce(user_word_state.STATUS_FAVOURITE, 0) AS STATUS_FAVOURITE,
+        coalesce(user_word_state.STATUS_TO_LEARN, 0) AS STATUS_TO_LEARN,
+        coalesce(user_word_state.STATUS_KNOWN, 0) AS STATUS_KNOWN
+    FROM matches
+    JOIN words ON words.ID = matches.ID
+    LEFT JOIN user_word_state ON user_word_state.USER_ID = :user AND user_word_state."INDEX" = words."INDEX"
+    ORDER BY MATCH_TIER, matches.MATCH_SCORE, words."INDEX"
+    LIMIT :limit OFFSET :offset
+    """
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SEARCH FUNCTIONS BLOCK
+
+"""
+
+
+def __unpoint_term(term: str) -> str:
+    """
+    Removes niqqud from a Hebrew query term, leaving other terms (whose combining marks may be
+    letters, e.g. Cyrillic "й") as they are.
+    """
+
+    # Returning:
+    return hebrew.strip_niqqud(term) if hebrew.is_hebrew(term) else term
+
+
+def __key_range_end(key: Optional[str]) -> Optional[str]:
+    """
+    Exclusive upper bound of the keys starting with `key`, for an indexed range scan.
+    """
+
+    # Returning the key with its last character incremented:
+    return key[:-1] + chr(ord(key[-1]) + 1) if key else None
+
+
+def compose_match_expression(query_text: str, language: Optional[str] = None) -> Optional[str]:
+    """
+    Builds an FTS5 `MATCH` expression from raw user input. Every whitespace-separated term is
+    quoted (so user input can never be parsed as FTS5 syntax) and matched as a prefix.
+
+    ## Examples:
+        >>> compose_match_expression("to wri")
+        '("to"* "wri"*)'
+        >>> compose_match_expression("write", language = "en")
+        '{TRANSLATION_LANG_EN TRANSCRIPTION_LANG_EN SEARCH_LANG_EN} : ("write"*)'
+
+    :param str query_text: Raw search query as typed by the user;
+    :param Optional[str] language: Two-letter language tag to restrict matching to that language's
+        columns, or None to match any column.
+
+    :return Optional[str]: MATCH expression, or None if the query holds no terms.
+    """
+
+    # Quoting every term as a prefix phrase, Hebrew unpointed like the indexed columns:
+    query_term_list: list[str] = [
+        '"{}"*'.format(term.replace('"', '""'))
+        for term in map(__unpoint_term, query_text.lower().split())
+        if term
+        ]
+    if not query_term_list:
+        return None
+    match_expression: str = "({})".format(" ".join(query_term_list))
+
+    # Restricting to language columns:
+    if language:
+        language_tag: str = language.upper()
+        match_expression = (
+            f"{{TRANSLATION_LANG_{language_tag} TRANSCRIPTION_LANG_{language_tag} SEARCH_LANG_{language_tag}}}"
+            f" : {match_expression}"
+            )
+
+    # Returning:
+    return match_expression
+
+
+def detect_language(query_text: str) -> str:
+    """
+    Guesses the language of a query from its script: Hebrew letters mean `'he'`, Cyrillic letters
+    mean `'ru'`, anything else is treated as `'en'` (including Latin transcriptions).
+
+    :param str query_text: Raw search query as typed by the user.
+    :return str: Two-letter language tag.
+    """
+
+    # Checking characters against script ranges:
+    for character in query_text:
+        if "\u0590" <= character <= "\u05ff":
+            return "he"
+        if "\u0400" <= character <= "\u04ff":
+            return "ru"
+
+    # Returning default:
+    return "en"
+
+
+def search_page(query_text: str, page: int = 1, per_page: int = SEARCH_RESULTS_PER_PAGE, user_id: Optional[int] = None) -> tuple[list, int]:
+    """
+    Searches all languages at once and returns a single page of results, ranked by match tier
+    (exact term, then prefix, then any other term match) and FTS5 relevance within a tier. Hebrew
+    queries additionally match the normalized headword key and any inflected form, so unpointed
+    input finds pointed headwords and conjugated forms find their dictionary entry. Matches of
+    the folded key only (other spellings, see `hebrew.fold`) rank below matches as written.
+
+    Results are lightweight rows holding only `ID`, `INDEX`, `TRANSLATION_LANG_*`,
+    `MATCH_TIER` and the learner's `STATUS_*` flags, so HTML containers are never loaded for a
+    results page.
+
+    :param str query_text: Raw search query as typed by the user;
+    :param int page: 1-based page number;
+    :param int per_page: Maximum number of rows to return;
+    :param Optional[int] user_id: Learner whose statuses are joined, None for none.
+
+    :return tuple[list, int]: Rows of the requested page and the total number of matches.
+    """
+
+    # Composing expression, returning nothing on an empty query:
+    match_expression: Optional[str] = compose_match_expression(
+        query_text = query_text
+        )
+    if not match_expression:
+        return [], 0
+
+    # Composing normalized and folded Hebrew key ranges (prefix matches on indexed columns):
+    search_key: Optional[str] = hebrew.normalize(
+        text = query_text
+        )
+    search_folded_key: Optional[str] = hebrew.fold(
+        text = query_text
+        )
+
+    # Counting matches:
+    search_parameters: dict = {
+        "expression": match_expression,
+        "key": search_key,
+        "key_end": __key_range_end(search_key),
+        "folded_key": search_folded_key,
+        "folded_key_end": __key_range_end(search_folded_key),
+        "form": unicodedata.normalize("NFC", " ".join(query_text.split())) if search_key else None,
+        }
+    search_total: int = DATABASE.session.execute(
+        text(SQL_SEARCH_COUNT),
+        search_parameters
+        ).scalar() or 0
+    if not search_total:
+        return [], 0
+
+    # Querying requested page:
+    search_term: str = " ".join(query_text.lower().split())
+    search_prefix: str = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    search_results: list = DATABASE.session.execute(
+        text(SQL_SEARCH_PAGE),
+        {
+            **search_parameters,
+            "term": search_term,
+            "prefix": search_prefix,
+            "user": user_id,
+            "limit": per_page,
+            "offset": (max(page, 1) - 1) * per_page,
+            }
+        ).all()
+
+    # Returning:
+    return search_results, search_total
@@ -0,0 +1,142 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Math and selection imports:
+import math
+from heapq import nlargest
+
+# Typing and annotations import:
+from typing import Iterable, Optional
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SIMILAR VARIABLES BLOCK
+
+"""
+
+
+# Neighbours stored per word and the weakest similarity worth showing:
+SIMILAR_WORDS_PER_ENTRY: int = 8
+SIMILAR_SCORE_MIN: float = 0.15
+
+# Terms found in a larger share of words (at least in `SIMILAR_TERM_COUNT_MAX_FLOOR` words) are
+# left out of the postings, not of the vectors: they add little to the ranking but dominate the
+# cost, which grows with the square of their frequency. This is an approximation of exact cosine,
+# see `compute_similar_words`; None keeps every term:
+SIMILAR_TERM_SHARE_MAX: Optional[float] = 0.02
+SIMILAR_TERM_COUNT_MAX_FLOOR: int = 50
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SIMILAR FUNCTIONS BLOCK
+
+"""
+
+
+def __iterate_terms(language: str, search_list: Optional[Iterable[str]]) -> Iterable[str]:
+    """
+    Yields language-tagged terms of a search token list: every token and, for multi-word tokens,
+    each of their words.
+    """
+
+    # Yielding tokens and their words:
+    for search_token in search_list or ():
+        search_token = " ".join(search_token.lower().split())
+        if not search_token:
+            continue
+        yield f"{language}:{search_token}"
+        if " " in search_token:
+            for search_word in search_token.split():
+                yield f"{language}:{search_word}"
+
+
+def compute_similar_words(
+        entry_list: Iterable[tuple[int, Optional[list[str]], Optional[list[str]]]],
+        limit: int = SIMILAR_WORDS_PER_ENTRY,
+        term_share_max: Optional[float] = SIMILAR_TERM_SHARE_MAX,
+        ) -> list[tuple[int, int, float]]:
+    """
+    Finds every word's nearest neighbours by cosine similarity of TF-IDF vectors built from its
+    English and Russian search tokens.
+
+    Vectors are sparse and L2-normalized, and an inverted index (term → postings) turns the
+    all-pairs product into accumulation over shared terms only: a word is compared with the words
+    it shares a term with, never with the whole dictionary. This is the row-by-row form of the
+    sparse product `X · Xᵀ`.
+
+    Accuracy trade-off: terms found in more than `term_share_max` of the words (and in more
+    than `SIMILAR_TERM_COUNT_MAX_FLOOR` words) get no postings. Their weights still count in
+    the vector norms, so a score is the exact cosine minus the contributions of such terms: it
+    never overestimates, and words sharing nothing but frequent terms are not found as
+    neighbours. Such terms have a low IDF weight, so the lost contributions are small. Pass
+    `term_share_max = None` for exact TF-IDF cosine, at quadratic cost in the most frequent
+    terms.
+
+    :param Iterable[tuple] entry_list: `(INDEX, SEARCH_LANG_EN, SEARCH_LANG_RU)` for every word;
+    :param int limit: Neighbours kept per word;
+    :param Optional[float] term_share_max: Largest share of words a term may appear in to be
+        compared on, None for no limit.
+
+    :return list[tuple[int, int, float]]: `(INDEX, SIMILAR_INDEX, SCORE)`, best first per word.
+    """
+
+    # Counting terms per word:
+    index_list: list[int] = []
+    term_count_list: list[dict[str, int]] = []
+    for word_index, search_list_en, search_list_ru in entry_list:
+        term_count_map: dict[str, int] = {}
+        for language, search_list in (("en", search_list_en), ("ru", search_list_ru)):
+            for term in __iterate_terms(language, search_list):
+                term_count_map[term] = term_count_map.get(term, 0) + 1
+        if term_count_map:
+            index_list.append(word_index)
+            term_count_list.append(term_count_map)
+
+    # Counting document frequencies:
+    document_count: int = len(term_count_list)
+    document_frequency: dict[str, int] = {}
+    for term_count_map in term_count_list:
+        for term in term_count_map:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+
+    # Building normalized TF-IDF vectors:
+    vector_list: list[list[tuple[str, float]]] = []
+    for term_count_map in term_count_list:
+        vector: list[tuple[str, float]] = [
+            (term, (1 + math.log(term_count)) * math.log(document_count / document_frequency[term]))
+            for term, term_count in term_count_map.items()
+            ]
+        vector_norm: float = math.sqrt(sum(weight * weight for _, weight in vector)) or 1.0
+        vector_list.append([(term, weight / vector_norm) for term, weight in vector if weight > 0])
+
+    # Building postings for terms shared by at least two, but not too many, words:
+    if term_share_max is None:
+        term_count_max: int = document_count
+    else:
+        term_count_max: int = max(SIMILAR_TERM_COUNT_MAX_FLOOR, int(document_count * term_share_max))
+    posting_map: dict[str, list[tuple[int, float]]] = {}
+    for vector_position, vector in enumerate(vector_list):
+        for term, weight in vector:
+            if 2 <= document_frequency[term] <= term_count_max:
+                posting_map.setdefault(term, []).append((vector_position, weight))
+
+    # Accumulating dot products over shared terms and keeping the best neighbours:
+    similar_list: list[tuple[int, int, float]] = []
+    for vector_position, vector in enumerate(vector_list):
+        score_map: dict[int, float] = {}
+        for term, weight in vector:
+            for other_position, other_weight in posting_map.get(term, ()):
+                score_map[other_position] = score_map.get(other_position, 0.0) + weight * other_weight
+        score_map.pop(vector_position, None)
+        for other_position, score in nlargest(limit, score_map.items(), key = lambda score_item: score_item[1]):
+            if score >= SIMILAR_SCORE_MIN:
+                similar_list.append((index_list[vector_position], index_list[other_position], round(min(score, 1.0), 4)))
+
+    # Logging:
+    log.info(f"Computed {len(similar_list)} similar word pairs for {document_count} words ({len(posting_map)} shared terms)")
+
+    # Returning:
+    return similar_list
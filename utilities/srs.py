@@ -0,0 +1,338 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Timing import:
+import time
+
+# Typing and annotations import:
+from typing import Any, Optional
+
+# Database-related import:
+from sqlalchemy import Integer, and_, case, cast, delete, func, literal, or_, select, true, update
+from sqlalchemy.dialects.sqlite import insert
+from utilities.database import DATABASE
+from utilities.database.models.review import Review
+from utilities.database.models.word import Word
+from utilities.database.models.input import Input
+from utilities.database.models.state import UserWordState
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SRS VARIABLES BLOCK
+
+"""
+
+
+# Card kinds and the key column of their items:
+SRS_KIND_WORD: str = "word"
+SRS_KIND_INPUT: str = "input"
+SRS_KIND_COLUMNS: dict[str, Any] = {
+    SRS_KIND_WORD: Word.INDEX,
+    SRS_KIND_INPUT: Input.ID,
+    }
+
+# Answer buttons and their SM-2 quality (0-5, below 3 is a lapse):
+SRS_GRADES: dict[str, int] = {
+    "again": 1,
+    "hard": 3,
+    "good": 4,
+    "easy": 5,
+    }
+
+# SM-2 parameters:
+SRS_EASE_MIN: float = 1.3
+SRS_FIRST_INTERVALS: tuple[int, int] = (1, 6)                               # <- Days
+SRS_DAY_SECONDS: int = 24 * 60 * 60
+
+# Lapsed cards come back within the same session:
+SRS_RELEARN_DELAY: int = 10 * 60
+
+# Cards shown per review page, new cards added at once and the largest count shown:
+SRS_SESSION_SIZE: int = 20
+SRS_NEW_CARDS: int = 20
+SRS_COUNT_MAX: int = 1000
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SRS QUEUE FUNCTIONS
+
+"""
+
+
+def read_due_cards(user_id: Optional[int], limit: int = SRS_SESSION_SIZE, now: Optional[int] = None) -> list[dict[str, Any]]:
+    """
+    Reads a learner's cards due by `now`, most overdue first, with their text. The filter and
+    order match `ix_reviews_due`, so this is one range read of the index with a key lookup of
+    each card's word or practice entry, however many cards are scheduled. Cards whose item no
+    longer exists are skipped (`remove_orphan_cards` deletes them).
+
+    :param Optional[int] user_id: Learner ID;
+    :param int limit: Maximum number of cards;
+    :param Optional[int] now: Unix time, the current time by default.
+
+    :return list[dict[str, Any]]: Cards with `kind`, `id`, `front`, `back` and `transcription`.
+    """
+
+    # Returning nothing without a learner:
+    if user_id is None:
+        return []
+
+    # Reading due cards with their items:
+    card_rows = DATABASE.session.execute(
+        select(
+            Review.ITEM_KIND,
+            Review.ITEM_ID,
+            func.coalesce(Word.TRANSLATION_LANG_HE, Input.WORD_HE).label("FRONT"),
+            func.coalesce(Word.TRANSLATION_LANG_EN, Input.TRANSLATION_RU).label("BACK"),
+            func.coalesce(Word.TRANSCRIPTION_LANG_EN, Input.TRANSCRIPTION_RU).label("TRANSCRIPTION"),
+            )
+        .outerjoin(Word, and_(Review.ITEM_KIND == SRS_KIND_WORD, Word.INDEX == Review.ITEM_ID))
+        .outerjoin(Input, and_(Review.ITEM_KIND == SRS_KIND_INPUT, Input.ID == Review.ITEM_ID))
+        .where(
+            Review.USER_ID == user_id,
+            Review.DUE_AT <= (now or int(time.time())),
+            or_(Word.INDEX.is_not(None), Input.ID.is_not(None))
+            )
+        .order_by(Review.DUE_AT)
+        .limit(limit)
+        )
+
+    # Returning:
+    return [
+        {
+            "kind": card_row.ITEM_KIND,
+            "id": card_row.ITEM_ID,
+            "front": card_row.FRONT,
+            "back": card_row.BACK,
+            "transcription": card_row.TRANSCRIPTION,
+            }
+        for card_row in card_rows
+        ]
+
+
+def count_due_cards(user_id: Optional[int], now: Optional[int] = None) -> dict[str, int]:
+    """
+    Counts a learner's due and scheduled cards on `ix_reviews_due`, stopping at
+    `SRS_COUNT_MAX` of each, so a page view never walks a large collection.
+
+    :param Optional[int] user_id: Learner ID;
+    :param Optional[int] now: Unix time, the current time by default.
+
+    :return dict[str, int]: `due` and `total` card counts, at most `SRS_COUNT_MAX`.
+    """
+
+    # Returning nothing without a learner:
+    if user_id is None:
+        return {"due": 0, "total": 0}
+
+    # Counting bounded ranges of the due index:
+    def count_range(*conditions) -> int:
+        return DATABASE.session.execute(
+            select(func.count()).select_from(
+                select(Review.DUE_AT).where(Review.USER_ID == user_id, *conditions).limit(SRS_COUNT_MAX).subquery()
+                )
+            ).scalar()
+
+    # Returning:
+    return {
+        "due": count_range(Review.DUE_AT <= (now or int(time.time()))),
+        "total": count_range(),
+        }
+
+
+def remove_orphan_cards() -> int:
+    """
+    Deletes cards of all learners whose word or practice entry no longer exists (e.g. entries
+    dropped by a dictionary rebuild), so they do not linger in the due queues.
+
+    :return int: Number of cards deleted.
+    """
+
+    # Deleting cards without items:
+    removed_count: int = DATABASE.session.execute(
+        delete(Review)
+        .where(or_(
+            and_(Review.ITEM_KIND == SRS_KIND_WORD, ~select(Word.INDEX).where(Word.INDEX == Review.ITEM_ID).exists()),
+            and_(Review.ITEM_KIND == SRS_KIND_INPUT, ~select(Input.ID).where(Input.ID == Review.ITEM_ID).exists()),
+            ))
+        .execution_options(synchronize_session = False)
+        ).rowcount
+    DATABASE.session.commit()
+
+    # Logging:
+    log.info(f"Removed {removed_count} review cards of missing entries")
+
+    # Returning:
+    return removed_count
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SRS SCHEDULE FUNCTIONS
+
+"""
+
+
+def __insert_cards(user_id: int, item_kind: str, item_id_select, now: int) -> int:
+    """
+    Schedules the items of a select as new cards due at `now`, skipping cards the learner
+    already has, with a single `INSERT … SELECT`.
+
+    :return int: Number of cards added.
+    """
+
+    # Inserting (existing cards keep their schedule; SQLite needs a WHERE before an upsert clause):
+    item_id_subquery = item_id_select.subquery()
+    insert_statement = insert(Review)\
+        .from_select(
+            ["USER_ID", "ITEM_KIND", "ITEM_ID", "DUE_AT"],
+            select(literal(user_id), literal(item_kind), *item_id_subquery.c, literal(now)).where(true())
+            )\
+        .on_conflict_do_nothing(index_elements = ["USER_ID", "ITEM_KIND", "ITEM_ID"])
+
+    # Returning:
+    return DATABASE.session.execute(insert_statement).rowcount
+
+
+def add_cards(user_id: int, item_kind: str, item_id_list: list[int], now: Optional[int] = None) -> int:
+    """
+    Schedules items of one kind as new cards, due now. Items that do not exist and cards the
+    learner already has are skipped.
+
+    :param int user_id: Learner ID;
+    :param str item_kind: Card kind (a key of `SRS_KIND_COLUMNS`);
+    :param list[int] item_id_list: Word indexes or practice entry IDs;
+    :param Optional[int] now: Unix time, the current time by default.
+
+    :return int: Number of cards added.
+    """
+
+    # Scheduling existing items:
+    key_column = SRS_KIND_COLUMNS[item_kind]
+    added_count: int = __insert_cards(
+        user_id = user_id,
+        item_kind = item_kind,
+        item_id_select = select(key_column).where(key_column.in_(item_id_list)),
+        now = now or int(time.time())
+        )
+    DATABASE.session.commit()
+
+    # Returning:
+    return added_count
+
+
+def add_new_cards(user_id: int, limit: int = SRS_NEW_CARDS, now: Optional[int] = None) -> int:
+    """
+    Schedules up to `limit` items the learner has no card for yet: words they marked "to learn"
+    first, then practice entries, each in key order.
+
+    :param int user_id: Learner ID;
+    :param int limit: Maximum number of cards added;
+    :param Optional[int] now: Unix time, the current time by default.
+
+    :return int: Number of cards added.
+    """
+
+    # Selecting unscheduled items of a kind:
+    def unscheduled(item_kind: str, key_column, source_select):
+        return source_select.where(~select(Review.ITEM_ID).where(and_(
+            Review.USER_ID == user_id,
+            Review.ITEM_KIND == item_kind,
+            Review.ITEM_ID == key_column,
+            )).exists())
+
+    # Adding "to learn" words, then practice entries:
+    now = now or int(time.time())
+    added_count: int = __insert_cards(
+        user_id = user_id,
+        item_kind = SRS_KIND_WORD,
+        item_id_select = unscheduled(SRS_KIND_WORD, UserWordState.INDEX, select(UserWordState.INDEX).where(
+            UserWordState.USER_ID == user_id,
+            UserWordState.STATUS_TO_LEARN == True
+            )).order_by(UserWordState.INDEX).limit(limit),
+        now = now
+        )
+    if added_count < limit:
+        added_count += __insert_cards(
+            user_id = user_id,
+            item_kind = SRS_KIND_INPUT,
+            item_id_select = unscheduled(SRS_KIND_INPUT, Input.ID, select(Input.ID))
+                .order_by(Input.ID).limit(limit - added_count),
+            now = now
+            )
+    DATABASE.session.commit()
+
+    # Logging:
+    log.info(f"Added {added_count} new review cards for user {user_id}")
+
+    # Returning:
+    return added_count
+
+
+def grade_card(user_id: int, item_kind: str, item_id: int, grade: str, now: Optional[int] = None) -> Optional[dict[str, Any]]:
+    """
+    Reschedules a card after an answer, following SM-2: the ease moves by the answer quality
+    (never below `SRS_EASE_MIN`); a passed card waits 1, then 6 days, then its previous
+    interval times the ease; a lapsed card starts over and comes back after
+    `SRS_RELEARN_DELAY`. The new schedule is computed from the stored one inside a single
+    `UPDATE … RETURNING` of the card's row, so grading is one primary key write.
+
+    :param int user_id: Learner ID;
+    :param str item_kind: Card kind (a key of `SRS_KIND_COLUMNS`);
+    :param int item_id: Word index or practice entry ID;
+    :param str grade: Answer (a key of `SRS_GRADES`);
+    :param Optional[int] now: Unix time, the current time by default.
+
+    :return Optional[dict[str, Any]]: New `interval`, `ease`, `repetitions` and `due_at`, None
+        if the learner has no such card.
+    """
+
+    # Computing ease change of the answer quality:
+    quality: int = SRS_GRADES[grade]
+    now = now or int(time.time())
+    new_ease = func.max(SRS_EASE_MIN, Review.EASE + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)))
+
+    # Passed: growing interval (SET expressions read the stored values):
+    if quality >= 3:
+        new_interval = case(
+            (Review.REPETITIONS == 0, SRS_FIRST_INTERVALS[0]),
+            (Review.REPETITIONS == 1, SRS_FIRST_INTERVALS[1]),
+            else_ = cast(func.round(Review.INTERVAL * new_ease), Integer)
+            )
+        schedule_values: dict = {
+            Review.INTERVAL: new_interval,
+            Review.REPETITIONS: Review.REPETITIONS + 1,
+            Review.DUE_AT: now + new_interval * SRS_DAY_SECONDS,
+            }
+
+    # Lapsed: starting over:
+    else:
+        schedule_values: dict = {
+            Review.INTERVAL: 0,
+            Review.REPETITIONS: 0,
+            Review.LAPSES: Review.LAPSES + 1,
+            Review.DUE_AT: now + SRS_RELEARN_DELAY,
+            }
+
+    # Updating the card's row:
+    schedule_row = DATABASE.session.execute(
+        update(Review)
+        .where(Review.USER_ID == user_id, Review.ITEM_KIND == item_kind, Review.ITEM_ID == item_id)
+        .values({**schedule_values, Review.EASE: new_ease, Review.REVIEWED_AT: now})
+        .returning(Review.INTERVAL, Review.EASE, Review.REPETITIONS, Review.DUE_AT)
+        .execution_options(synchronize_session = False)
+        ).first()
+    DATABASE.session.commit()
+    if schedule_row is None:
+        return None
+
+    # Returning:
+    return {
+        "interval": schedule_row.INTERVAL,
+        "ease": round(schedule_row.EASE, 2),
+        "repetitions": schedule_row.REPETITIONS,
+        "due_at": schedule_row.DUE_AT,
+        }
@@ -0,0 +1,138 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Typing and annotations import:
+from typing import Optional
+
+# Database-related import:
+from sqlalchemy import text
+from utilities.database import DATABASE, scripts
+from utilities.database.models.statistic import Statistic
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATISTICS VARIABLES BLOCK
+
+"""
+
+
+# Counter keys:
+STATISTIC_WORDS: str = "words"
+STATISTIC_INPUTS: str = "inputs"
+STATISTIC_VERSION: str = "dictionary_version"
+STATISTIC_POS_PREFIX: str = "pos:"
+STATISTIC_STATUS_PREFIX: str = "status:"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATISTICS FUNCTIONS BLOCK
+
+"""
+
+
+def read_statistics() -> dict[str, int]:
+    """
+    Reads all materialised counters with a single query over the small `statistics` table. If
+    they were computed for another dictionary version (or never), they are recomputed first.
+
+    :return dict[str, int]: Counter values by key.
+    """
+
+    # Loading counters:
+    statistic_map: dict[str, int] = dict(DATABASE.session.query(Statistic.KEY, Statistic.VALUE).all())
+
+    # Recomputing stale counters:
+    dictionary_version: int = scripts.read_dictionary_version()
+    if statistic_map.get(STATISTIC_VERSION) != dictionary_version:
+        log.info("Statistics are stale for the current dictionary version, recomputing")
+        scripts.rebuild_statistics(dictionary_version = dictionary_version)
+        statistic_map = dict(DATABASE.session.query(Statistic.KEY, Statistic.VALUE).all())
+
+    # Returning:
+    return statistic_map
+
+
+def read_statistic(key: str) -> int:
+    """
+    Reads a single counter, 0 if it does not exist.
+
+    :param str key: Counter key (e.g. `STATISTIC_WORDS`).
+    :return int: Counter value.
+    """
+
+    # Returning:
+    return read_statistics().get(key, 0)
+
+
+def increment_statistic(key: str, delta: int = 1) -> None:
+    """
+    Adjusts a counter inside the current session transaction, so it is committed (or rolled
+    back) together with the write it accounts for. Call it before the caller's commit.
+
+    :param str key: Counter key (e.g. `STATISTIC_INPUTS`, `"status:1:known"`);
+    :param int delta: Amount to add, negative to subtract.
+    """
+
+    # Upserting counter without committing:
+    DATABASE.session.execute(text(scripts.SQL_INCREMENT_STATISTIC), {"key": key, "delta": delta})
+
+
+def status_statistic_key(user_id: int, status: str) -> str:
+    """
+    Key of a learner's status counter.
+
+    ## Example:
+        >>> status_statistic_key(3, "known")
+        'status:3:known'
+
+    :param int user_id: Learner ID;
+    :param str status: Status name (e.g. `"favourite"`).
+
+    :return str: Counter key.
+    """
+
+    # Returning:
+    return f"{STATISTIC_STATUS_PREFIX}{user_id}:{status}"
+
+
+def read_status_statistics(user_id: Optional[int]) -> dict[str, int]:
+    """
+    Reads a learner's status counters, keyed by status name.
+
+    :param Optional[int] user_id: Learner ID, None for a session without one.
+    :return dict[str, int]: Counters, largest first, empty without a learner.
+    """
+
+    # Returning nothing without a learner:
+    if user_id is None:
+        return {}
+
+    # Returning:
+    return group_statistics(
+        statistic_map = read_statistics(),
+        prefix = status_statistic_key(user_id = user_id, status = "")
+        )
+
+
+def group_statistics(statistic_map: dict[str, int], prefix: str) -> dict[str, int]:
+    """
+    Selects counters sharing a key prefix, keyed by the rest of the key, largest first.
+
+    ## Example:
+        >>> group_statistics({"pos:Verb": 3, "pos:Noun": 5, "words": 8}, "pos:")
+        {'Noun': 5, 'Verb': 3}
+
+    :param dict[str, int] statistic_map: Counters returned by `read_statistics`;
+    :param str prefix: Key prefix (e.g. `STATISTIC_POS_PREFIX`).
+
+    :return dict[str, int]: Matching counters.
+    """
+
+    # Returning:
+    return dict(sorted(
+        ((key[len(prefix):], value) for key, value in statistic_map.items() if key.startswith(prefix)),
+        key = lambda statistic_item: -statistic_item[1]
+        ))
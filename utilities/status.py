@@ -0,0 +1,500 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Threading and exit-hook imports:
+import atexit
+import threading
+
+# Typing and annotations import:
+from typing import Any, Optional
+
+# Flask-related imports:
+from flask import Flask, current_app
+
+# Database-related import:
+from sqlalchemy import Boolean, and_, func, literal, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Query
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+from utilities.database.models.state import UserWordState
+from utilities.database.models.user import User
+from utilities import statistics
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATUS VARIABLES BLOCK
+
+"""
+
+
+# Status names used by the API and templates, with their columns:
+STATUS_COLUMNS: dict[str, Any] = {
+    "favourite": UserWordState.STATUS_FAVOURITE,
+    "to_learn": UserWordState.STATUS_TO_LEARN,
+    "known": UserWordState.STATUS_KNOWN,
+    }
+
+# Delay during which successive toggles are merged into one transaction:
+STATUS_FLUSH_DELAY: float = 0.5
+
+# Maximum number of words changed by one bulk operation:
+STATUS_BULK_MAX: int = 1000
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATUS READ FUNCTIONS
+
+"""
+
+
+def state_columns() -> tuple:
+    """
+    Status columns of a query joined with `join_state`, named like the statuses (`STATUS_KNOWN`,
+    …) and False for words the learner never flagged.
+
+    :return tuple: Labeled boolean columns, in `STATUS_COLUMNS` order.
+    """
+
+    # Returning:
+    return tuple(
+        func.coalesce(status_column, False, type_ = Boolean).label(status_column.key)
+        for status_column in STATUS_COLUMNS.values()
+        )
+
+
+def join_state(query: Query, user_id: Optional[int]) -> Query:
+    """
+    Left-joins a words query with the learner's state rows (one primary key lookup per word).
+    Without a learner nothing matches, so all statuses read as False.
+
+    :param Query query: Query selecting from `words`;
+    :param Optional[int] user_id: Learner ID (see `users.current_user_id`).
+
+    :return Query: Joined query.
+    """
+
+    # Returning:
+    return query.outerjoin(
+        UserWordState,
+        and_(UserWordState.USER_ID == user_id, UserWordState.INDEX == Word.INDEX)
+        )
+
+
+def read_stored_state(user_id: Optional[int], word_index: int) -> Optional[dict[str, bool]]:
+    """
+    Reads the learner's stored statuses of one word (one primary key lookup per table), leaving
+    buffered changes aside.
+
+    :param Optional[int] user_id: Learner ID;
+    :param int word_index: Pealim index of the word.
+
+    :return Optional[dict[str, bool]]: Flags by status name, None if the word does not exist.
+    """
+
+    # Reading flags:
+    state_row = join_state(DATABASE.session.query(*state_columns()).select_from(Word), user_id = user_id)\
+        .filter(Word.INDEX == word_index)\
+        .first()
+    if state_row is None:
+        return None
+
+    # Returning:
+    return dict(zip(STATUS_COLUMNS, state_row))
+
+
+def merge_pending(pending_state: dict[int, dict[str, bool]], word_index: int, flags: tuple) -> tuple[bool, ...]:
+    """
+    Replaces stored flags of a word (in `STATUS_COLUMNS` order) by the learner's buffered
+    values, as returned by `StatusWriteBuffer.pending_state`.
+
+    :param dict pending_state: Buffered values by word index and status name;
+    :param int word_index: Pealim index of the word;
+    :param tuple flags: Stored flags, in `STATUS_COLUMNS` order.
+
+    :return tuple[bool, ...]: Current flags, in `STATUS_COLUMNS` order.
+    """
+
+    # Returning:
+    word_pending: dict[str, bool] = pending_state.get(word_index, {})
+    return tuple(
+        bool(word_pending.get(status, flag))
+        for status, flag in zip(STATUS_COLUMNS, flags)
+        )
+
+
+def merge_pending_row(pending_state: dict[int, dict[str, bool]], word_row) -> dict[str, Any]:
+    """
+    Converts a result row with `INDEX` and status columns (`STATUS_KNOWN`, …) into a mapping
+    with the learner's buffered values applied. Templates read it like the row.
+
+    :param dict pending_state: Buffered values by word index and status name;
+    :param word_row: Result row.
+
+    :return dict[str, Any]: Row values by column name.
+    """
+
+    # Replacing status columns:
+    word_entry: dict[str, Any] = word_row._asdict()
+    for status, value in pending_state.get(word_entry["INDEX"], {}).items():
+        word_entry[STATUS_COLUMNS[status].key] = value
+
+    # Returning:
+    return word_entry
+
+
+def read_word_state(user_id: Optional[int], word_index: int) -> Optional[dict[str, bool]]:
+    """
+    Reads the learner's statuses of one word: the stored flags, replaced by buffered changes
+    that are not written yet. Nothing is flushed, so reads do not break up the buffer's batches.
+
+    :param Optional[int] user_id: Learner ID;
+    :param int word_index: Pealim index of the word.
+
+    :return Optional[dict[str, bool]]: Flags by status name, None if the word does not exist.
+    """
+
+    # Taking buffered values before reading (a write in between is then seen either way):
+    pending_state: dict[int, dict[str, bool]] = STATUS_WRITE_BUFFER.pending_state(user_id = user_id)
+    word_state: Optional[dict[str, bool]] = read_stored_state(user_id = user_id, word_index = word_index)
+    if word_state is None:
+        return None
+
+    # Returning:
+    return dict(zip(STATUS_COLUMNS, merge_pending(
+        pending_state = pending_state,
+        word_index = word_index,
+        flags = tuple(word_state.values())
+        )))
+
+
+def read_flagged_indexes(user_id: Optional[int], status: str) -> list[int]:
+    """
+    Lists the words a learner flagged with a status, in index order, reading only the status's
+    partial index. Buffered changes are left aside, callers merge `pending_state` themselves.
+
+    :param Optional[int] user_id: Learner ID;
+    :param str status: Status name (a key of `STATUS_COLUMNS`).
+
+    :return list[int]: Word indexes.
+    """
+
+    # Returning nothing without a learner:
+    if user_id is None:
+        return []
+
+    # Returning:
+    return DATABASE.session.scalars(
+        select(UserWordState.INDEX)
+        .where(UserWordState.USER_ID == user_id, STATUS_COLUMNS[status] == True)
+        .order_by(UserWordState.INDEX)
+        ).all()
+
+
+def read_state_version(user_id: Optional[int]) -> int:
+    """
+    Reads the learner's stored state version (one primary key lookup). It changes with every
+    status write, so structures derived from the learner's stored flags can be cached until it
+    does. Buffered changes are not written, callers merge `pending_state` themselves.
+
+    :param Optional[int] user_id: Learner ID.
+    :return int: State version, 0 without a learner.
+    """
+
+    # Returning nothing without a learner:
+    if user_id is None:
+        return 0
+
+    # Returning:
+    return DATABASE.session.execute(
+        select(func.coalesce(User.STATE_VERSION, 0)).where(User.ID == user_id)
+        ).scalar() or 0
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATUS WRITE FUNCTIONS
+
+"""
+
+
+def __write_status(user_id: int, status: str, value: bool, word_index_list: list[int]) -> list[int]:
+    """
+    Sets one flag of many words with a single statement, touching only rows that change:
+    setting upserts state rows for existing words, clearing updates the flagged rows.
+
+    :return list[int]: Indexes of the words that changed.
+    """
+
+    # Setting (words without a state row get one):
+    status_column = STATUS_COLUMNS[status]
+    if value:
+        write_statement = insert(UserWordState)\
+            .from_select(
+                ["USER_ID", "INDEX", status_column.key],
+                select(literal(user_id), Word.INDEX, literal(True)).where(Word.INDEX.in_(word_index_list))
+                )
+        write_statement = write_statement.on_conflict_do_update(
+            index_elements = ["USER_ID", "INDEX"],
+            set_ = {status_column.key: True},
+            where = status_column == False
+            )
+
+    # Clearing (words without a state row are already clear):
+    else:
+        write_statement = update(UserWordState)\
+            .where(
+                UserWordState.USER_ID == user_id,
+                UserWordState.INDEX.in_(word_index_list),
+                status_column == True
+                )\
+            .values({status_column: False})\
+            .execution_options(synchronize_session = False)
+
+    # Returning:
+    return DATABASE.session.execute(write_statement.returning(UserWordState.INDEX)).scalars().all()
+
+
+def apply_statuses(change_list: list[tuple[int, str, bool, list[int]]]) -> set[tuple[int, int]]:
+    """
+    Writes status changes in a single transaction, one statement per learner, status and value
+    (`… WHERE INDEX IN (…)`). The number of rows that actually changed adjusts the learner's
+    status counters, and bumps their `STATE_VERSION`, in the same transaction.
+
+    :param list change_list: `(learner ID, status name, value, word indexes)` tuples.
+    :return set[tuple[int, int]]: `(learner ID, word index)` pairs that changed.
+    """
+
+    # Updating flags and counters:
+    changed_set: set[tuple[int, int]] = set()
+    try:
+        for user_id, status, value, word_index_list in change_list:
+            changed_index_list: list[int] = __write_status(
+                user_id = user_id,
+                status = status,
+                value = value,
+                word_index_list = word_index_list
+                )
+            if changed_index_list:
+                statistics.increment_statistic(
+                    key = statistics.status_statistic_key(user_id = user_id, status = status),
+                    delta = len(changed_index_list) if value else -len(changed_index_list)
+                    )
+            changed_set.update((user_id, word_index) for word_index in changed_index_list)
+
+        # Bumping state versions of learners whose flags changed:
+        changed_user_id_set: set[int] = {user_id for user_id, _ in changed_set}
+        if changed_user_id_set:
+            DATABASE.session.execute(
+                update(User)
+                .where(User.ID.in_(changed_user_id_set))
+                .values({User.STATE_VERSION: func.coalesce(User.STATE_VERSION, 0) + 1})
+                .execution_options(synchronize_session = False)
+                )
+        DATABASE.session.commit()
+
+    # Handling exceptions and errors:
+    except Exception:
+        DATABASE.session.rollback()
+        raise
+
+    # Returning:
+    return changed_set
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATUS WRITE BUFFER CLASS INSTANCE
+
+"""
+
+
+class StatusWriteBuffer:
+    """
+    Write-behind buffer for single-word status changes. Changes are held for `delay` seconds
+    after the first one and then written together by `apply_statuses`, so a burst of clicks
+    costs SQLite one transaction, and toggling a flag back and forth costs nothing. Readers of
+    statuses merge the pending values (`pending_state`), so they never see a stale flag and
+    never break up a batch.
+
+    Attributes:
+        delay (float): Seconds between the first buffered change and the write
+        pending_map (dict): Buffered values by `(learner ID, word index, status name)`
+    """
+
+    def __init__(self, delay: float):
+        """
+        Initialize an empty buffer.
+
+        :param float delay: Seconds between the first buffered change and the write.
+        """
+
+        # Core attributes:
+        self.delay: float = delay
+
+        # State attributes:
+        self.pending_map: dict[tuple[int, int, str], bool] = {}
+        self.lock = threading.RLock()
+        self.timer: Optional[threading.Timer] = None
+        self.application: Optional[Flask] = None
+
+        # Writing remaining changes on shutdown:
+        atexit.register(self.close)
+
+
+    def set(self, user_id: int, word_index: int, status: str, value: bool) -> None:
+        """
+        Buffers a status value, replacing an earlier pending value of the same flag. Must be
+        called inside an application context, which the delayed write reuses.
+
+        :param int user_id: Learner ID;
+        :param int word_index: Pealim index of the word;
+        :param str status: Status name (a key of `STATUS_COLUMNS`);
+        :param bool value: New flag value.
+        """
+
+        # Buffering value and scheduling a write:
+        with self.lock:
+            self.pending_map[(user_id, word_index, status)] = value
+            self.application = current_app._get_current_object()
+            self.__schedule()
+
+
+    def __schedule(self) -> None:
+        """
+        Starts the delayed write unless one is scheduled already. Must be called with the lock
+        held, after `application` is set.
+        """
+
+        # Starting timer:
+        if self.timer is None:
+            self.timer = threading.Timer(self.delay, self.__flush_in_context)
+            self.timer.daemon = True
+            self.timer.start()
+
+
+    def toggle(self, user_id: int, word_index: int, status: str) -> Optional[bool]:
+        """
+        Buffers the inverse of the flag's current value (pending or stored).
+
+        :param int user_id: Learner ID;
+        :param int word_index: Pealim index of the word;
+        :param str status: Status name (a key of `STATUS_COLUMNS`).
+
+        :return Optional[bool]: New flag value, None if the word does not exist.
+        """
+
+        # Reading current value under the lock, so concurrent toggles do not cancel out (the
+        # stored value is current when none is pending, so nothing is flushed):
+        with self.lock:
+            current_value: Optional[bool] = self.pending_map.get((user_id, word_index, status))
+            if current_value is None:
+                word_state: Optional[dict[str, bool]] = read_stored_state(user_id = user_id, word_index = word_index)
+                if word_state is None:
+                    return None
+                current_value = word_state[status]
+
+            # Buffering inverse:
+            self.set(user_id = user_id, word_index = word_index, status = status, value = not current_value)
+
+        # Returning:
+        return not current_value
+
+
+    def pending_state(self, user_id: Optional[int]) -> dict[int, dict[str, bool]]:
+        """
+        Copies the learner's buffered values, for readers that show statuses without flushing
+        (see `merge_pending`).
+
+        :param Optional[int] user_id: Learner ID.
+        :return dict[int, dict[str, bool]]: Buffered values by word index and status name.
+        """
+
+        # Returning nothing without a learner or pending changes:
+        pending_state: dict[int, dict[str, bool]] = {}
+        if user_id is None or not self.pending_map:
+            return pending_state
+
+        # Copying the learner's entries:
+        with self.lock:
+            for (pending_user_id, word_index, status), value in self.pending_map.items():
+                if pending_user_id == user_id:
+                    pending_state.setdefault(word_index, {})[status] = value
+
+        # Returning:
+        return pending_state
+
+
+    def flush(self) -> int:
+        """
+        Writes all pending changes now, grouped into one statement per learner, status and
+        value. Must be called inside an application context. If the write fails, the changes
+        are buffered again (values set meanwhile win) and retried after `delay`, and the error
+        is raised.
+
+        :return int: Number of buffered changes written.
+        """
+
+        # Taking pending changes (the lock is held until they are written):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.pending_map:
+                return 0
+            pending_map: dict[tuple[int, int, str], bool] = self.pending_map
+            self.pending_map = {}
+
+            # Grouping by learner, status and value:
+            change_map: dict[tuple[int, str, bool], list[int]] = {}
+            for (user_id, word_index, status), value in pending_map.items():
+                change_map.setdefault((user_id, status, value), []).append(word_index)
+
+            # Writing, buffering the changes again on failure:
+            try:
+                changed_set: set[tuple[int, int]] = apply_statuses(change_list = [
+                    (user_id, status, value, word_index_list)
+                    for (user_id, status, value), word_index_list in change_map.items()
+                    ])
+            except Exception:
+                for pending_key, value in pending_map.items():
+                    self.pending_map.setdefault(pending_key, value)
+                if self.application is not None:
+                    self.__schedule()
+                raise
+
+        # Logging:
+        log.info(f"Flushed {len(pending_map)} buffered status changes, {len(changed_set)} words changed")
+
+        # Returning:
+        return len(pending_map)
+
+
+    def __flush_in_context(self) -> None:
+        """
+        Timer callback: flushes inside an application context of its own.
+        """
+
+        # Flushing, logging failures (the timer thread has no caller to raise to):
+        try:
+            with self.application.app_context():
+                self.flush()
+        except Exception as exception_error:
+            log.error(f"Failed to write buffered status changes: {exception_error}")
+
+
+    def close(self) -> None:
+        """
+        Writes pending changes before the process exits.
+        """
+
+        # Flushing if anything is pending:
+        if self.pending_map and self.application is not None:
+            self.__flush_in_context()
+
+
+# Process-wide buffer used by the status API:
+STATUS_WRITE_BUFFER = StatusWriteBuffer(delay = STATUS_FLUSH_DELAY)
@@ -0,0 +1,258 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Sorted array search import:
+from bisect import bisect_left
+
+# Typing and annotations import:
+from typing import Iterable, Optional
+
+# Database-related import:
+from utilities.database import DATABASE
+from utilities.database.models.word import Word
+
+# Hebrew normalization and cache import:
+from utilities import hebrew
+from utilities.cache import VersionedCache
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SUGGEST VARIABLES BLOCK
+
+"""
+
+
+# Default and maximum number of suggestions:
+SUGGEST_LIMIT_DEFAULT: int = 8
+SUGGEST_LIMIT_MAX: int = 25
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SUGGEST INDEX CLASS INSTANCE
+
+"""
+
+
+class SuggestIndex:
+    """
+    Prefix index over headwords and translations, stored as a sorted array of keys with a
+    parallel array of entry positions. A prefix lookup is two binary searches plus a walk over at
+    most `limit` distinct entries, independent of dictionary size.
+
+    Hebrew headwords are keyed by their normalized form (see `utilities.hebrew.normalize`), other
+    terms by their lowercase form. Folded Hebrew keys (see `utilities.hebrew.fold`) are kept in a
+    second array, walked only after the keys as written.
+
+    Attributes:
+        key_list (list[str]): Sorted lookup keys
+        entry_position_list (list[int]): Position in `entry_list` for every key
+        folded_key_list (list[str]): Sorted folded Hebrew keys
+        folded_entry_position_list (list[int]): Position in `entry_list` for every folded key
+        entry_list (list[tuple]): `(INDEX, TRANSLATION_LANG_HE, TRANSLATION_LANG_EN, TRANSLATION_LANG_RU)`
+    """
+
+    def __init__(self, entry_list: list[tuple], key_pair_list: list[tuple[str, int]], folded_key_pair_list: Optional[list[tuple[str, int]]] = None):
+        """
+        Initialize the index from entries and unsorted `(key, entry position)` pairs. Pairs with
+        equal keys keep their order, so full terms listed before words of multi-word terms are
+        suggested first.
+
+        :param list[tuple] entry_list: Word entries referenced by key pairs;
+        :param list[tuple[str, int]] key_pair_list: Lookup keys with their entry positions;
+        :param list[tuple[str, int]] folded_key_pair_list: Folded Hebrew keys with their entry
+            positions.
+        """
+
+        # Sorting keys once, keeping entry positions aligned:
+        key_pair_list.sort(key = lambda key_pair: key_pair[0])
+        self.key_list: list[str] = [key for key, _ in key_pair_list]
+        self.entry_position_list: list[int] = [entry_position for _, entry_position in key_pair_list]
+        folded_key_pair_list = sorted(folded_key_pair_list or ())
+        self.folded_key_list: list[str] = [key for key, _ in folded_key_pair_list]
+        self.folded_entry_position_list: list[int] = [entry_position for _, entry_position in folded_key_pair_list]
+        self.entry_list: list[tuple] = entry_list
+
+
+    def lookup(self, prefix: str, limit: int = SUGGEST_LIMIT_DEFAULT, folded_prefix: Optional[str] = None) -> list[tuple[str, tuple]]:
+        """
+        Finds up to `limit` distinct entries with a key starting with the prefix, then fills the
+        remaining places with entries whose folded key starts with the folded prefix. Keys are
+        visited in lexicographic order, so exact and shorter matches come first.
+
+        :param str prefix: Normalized prefix;
+        :param int limit: Maximum number of entries;
+        :param Optional[str] folded_prefix: Folded Hebrew prefix, None for other input.
+
+        :return list[tuple[str, tuple]]: Matched key and entry pairs.
+        """
+
+        # Walking the key ranges that start with the prefixes, as written first:
+        match_list: list[tuple[str, tuple]] = []
+        seen_position_set: set[int] = set()
+        self.__walk(self.key_list, self.entry_position_list, prefix, limit, match_list, seen_position_set)
+        if folded_prefix:
+            self.__walk(self.folded_key_list, self.folded_entry_position_list, folded_prefix, limit, match_list, seen_position_set)
+
+        # Returning:
+        return match_list
+
+
+    def __walk(self, key_list: list[str], entry_position_list: list[int], prefix: str, limit: int, match_list: list, seen_position_set: set[int]) -> None:
+        """
+        Appends distinct entries of the key range starting with the prefix to `match_list`, until
+        it holds `limit` entries.
+        """
+
+        # Walking the key range:
+        key_position: int = bisect_left(key_list, prefix)
+        while key_position < len(key_list) and len(match_list) < limit:
+            key: str = key_list[key_position]
+            if not key.startswith(prefix):
+                break
+            entry_position: int = entry_position_list[key_position]
+            if entry_position not in seen_position_set:
+                seen_position_set.add(entry_position)
+                match_list.append((key, self.entry_list[entry_position]))
+            key_position += 1
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SUGGEST INDEX FUNCTIONS
+
+"""
+
+
+def normalize_prefix(prefix: str) -> Optional[str]:
+    """
+    Normalizes typed input the same way index keys are built.
+
+    :param str prefix: Raw input.
+    :return Optional[str]: Normalized prefix, or None if nothing is left.
+    """
+
+    # Normalizing Hebrew and other input:
+    if hebrew.is_hebrew(prefix):
+        return hebrew.normalize(text = prefix)
+    normalized_prefix: str = " ".join(prefix.lower().split())
+
+    # Returning:
+    return normalized_prefix or None
+
+
+def __iterate_keys(translation_text: Optional[str], search_list: Optional[Iterable[str]]) -> Iterable[str]:
+    """
+    Yields normalized keys for a translation and its search tokens.
+    """
+
+    # Yielding translation and tokens:
+    for term in (translation_text, *(search_list or ())):
+        if term:
+            normalized_term: Optional[str] = normalize_prefix(term)
+            if normalized_term:
+                yield normalized_term
+
+
+def __iterate_words(key_set: set[str]) -> Iterable[str]:
+    """
+    Yields each word of the multi-word keys that is not a key of its own, so "wri" finds
+    "to write".
+    """
+
+    # Yielding words:
+    word_set: set[str] = set()
+    for key in key_set:
+        if " " in key:
+            word_set.update(key.split())
+    yield from word_set - key_set
+
+
+def build_suggest_index() -> SuggestIndex:
+    """
+    Builds the suggestion index from translation and search token columns. HTML containers are
+    not loaded.
+
+    :return SuggestIndex: Populated index.
+    """
+
+    # Loading translation columns:
+    word_rows = DATABASE.session.query(
+        Word.INDEX,
+        Word.TRANSLATION_LANG_HE,
+        Word.TRANSLATION_LANG_EN,
+        Word.TRANSLATION_LANG_RU,
+        Word.SEARCH_LANG_HE,
+        Word.SEARCH_LANG_EN,
+        Word.SEARCH_LANG_RU,
+        ).all()
+
+    # Collecting entries and deduplicated keys:
+    entry_list: list[tuple] = []
+    key_pair_list: list[tuple[str, int]] = []
+    word_key_pair_list: list[tuple[str, int]] = []
+    folded_key_pair_list: list[tuple[str, int]] = []
+    for entry_position, word_row in enumerate(word_rows):
+        entry_list.append(tuple(word_row[:4]))
+        key_set: set[str] = set()
+        key_set.update(__iterate_keys(word_row.TRANSLATION_LANG_HE, word_row.SEARCH_LANG_HE))
+        key_set.update(__iterate_keys(word_row.TRANSLATION_LANG_EN, word_row.SEARCH_LANG_EN))
+        key_set.update(__iterate_keys(word_row.TRANSLATION_LANG_RU, word_row.SEARCH_LANG_RU))
+        key_pair_list.extend((key, entry_position) for key in key_set)
+        word_key_pair_list.extend((word_key, entry_position) for word_key in __iterate_words(key_set))
+        folded_key_pair_list.extend(
+            (folded_key, entry_position) for folded_key
+            in {hebrew.fold(term) for term in (word_row.TRANSLATION_LANG_HE, *(word_row.SEARCH_LANG_HE or ()))} - {None}
+            )
+
+    # Returning:
+    return SuggestIndex(
+        entry_list = entry_list,
+        key_pair_list = key_pair_list + word_key_pair_list,
+        folded_key_pair_list = folded_key_pair_list
+        )
+
+
+# Per-process suggestion index, rebuilt on dictionary version change:
+SUGGEST_INDEX_CACHE = VersionedCache(
+    name = "suggest index",
+    loader = build_suggest_index
+    )
+
+
+def suggest(prefix: str, limit: int = SUGGEST_LIMIT_DEFAULT) -> list[dict]:
+    """
+    Returns autocomplete suggestions for a typed prefix in any of the three languages.
+
+    :param str prefix: Raw input as typed by the user;
+    :param int limit: Maximum number of suggestions (capped at `SUGGEST_LIMIT_MAX`).
+
+    :return list[dict]: Suggestions with the matched key, word index and translations.
+    """
+
+    # Normalizing prefix, returning nothing on empty input:
+    normalized_prefix: Optional[str] = normalize_prefix(prefix)
+    if not normalized_prefix:
+        return []
+
+    # Looking the prefix up in the cached index:
+    match_list = SUGGEST_INDEX_CACHE.get().lookup(
+        prefix = normalized_prefix,
+        limit = max(1, min(limit, SUGGEST_LIMIT_MAX)),
+        folded_prefix = hebrew.fold(text = prefix)
+        )
+    suggestion_list: list[dict] = [
+        {
+            "term": key,
+            "index": word_index,
+            "translation_he": translation_he,
+            "translation_en": translation_en,
+            "translation_ru": translation_ru,
+            }
+        for key, (word_index, translation_he, translation_en, translation_ru) in match_list
+        ]
+
+    # Returning:
+    return suggestion_list
@@ -0,0 +1,114 @@
+# Default logger import:
+import logging
+log = logging.getLogger(__name__)
+
+# Timing import:
+import time
+
+# Typing and annotations import:
+from typing import Optional
+
+# Flask-related imports:
+from flask import request, session
+
+# Database-related import:
+from sqlalchemy import func, select, update
+from utilities.database import DATABASE
+from utilities.database.models.user import User
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+USERS VARIABLES BLOCK
+
+"""
+
+
+# Session key holding the learner's `users.ID`:
+USER_SESSION_KEY: str = "USER_ID"
+
+# WSGI environ key marking requests the application makes to itself (exports), which never adopt
+# a learner:
+USER_ANONYMOUS_ENVIRON_KEY: str = "dictionary.anonymous"
+
+# Learners migrated from the shared statuses of an older database are created with this stamp:
+USER_UNCLAIMED_CREATED_AT: int = 0
+
+# Whether an unclaimed learner may still exist, cleared once none is found:
+__UNCLAIMED_STATE: dict = {"pending": True}
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+USERS FUNCTIONS BLOCK
+
+"""
+
+
+def current_user_id(create: bool = False) -> Optional[int]:
+    """
+    Identifies the learner of the current request by the signed session cookie. Browsing does
+    not create learners: a new one is only numbered when `create` is set (on the first status
+    change), so crawlers and exports never add rows. A session without a learner first adopts
+    the one migrated from an older database, if nobody has yet.
+
+    :param bool create: Create and remember a learner if the session has none.
+    :return Optional[int]: Learner ID, None for a session without one.
+    """
+
+    # Reading remembered learner:
+    user_id: Optional[int] = session.get(USER_SESSION_KEY)
+    if user_id is not None:
+        return user_id
+
+    # Adopting a learner migrated from shared statuses:
+    if __UNCLAIMED_STATE["pending"] and not request.environ.get(USER_ANONYMOUS_ENVIRON_KEY):
+        user_id = __adopt_unclaimed_user()
+        if user_id is not None:
+            return user_id
+    if not create:
+        return None
+
+    # Creating learner:
+    user: User = User(CREATED_AT = int(time.time()))
+    DATABASE.session.add(user)
+    DATABASE.session.commit()
+    session[USER_SESSION_KEY] = user.ID
+
+    # Logging:
+    log.info(f"Created local user {user.ID}")
+
+    # Returning:
+    return user.ID
+
+
+def __adopt_unclaimed_user() -> Optional[int]:
+    """
+    Claims the learner created by `scripts.migrate_legacy_statuses` for the current session. The
+    claim is one conditional UPDATE, so concurrent sessions can not adopt the same learner, and
+    the check stops once no unclaimed learner is left.
+
+    :return Optional[int]: Adopted learner ID, None if there was none.
+    """
+
+    # Claiming oldest unclaimed learner:
+    unclaimed_id_query = select(func.min(User.ID))\
+        .where(User.CREATED_AT == USER_UNCLAIMED_CREATED_AT)\
+        .scalar_subquery()
+    user_id: Optional[int] = DATABASE.session.execute(
+        update(User)
+        .where(User.ID == unclaimed_id_query, User.CREATED_AT == USER_UNCLAIMED_CREATED_AT)
+        .values(CREATED_AT = int(time.time()))
+        .returning(User.ID)
+        ).scalar()
+    DATABASE.session.commit()
+    if user_id is None:
+        __UNCLAIMED_STATE["pending"] = False
+        return None
+    session[USER_SESSION_KEY] = user_id
+
+    # Logging:
+    log.info(f"Adopted migrated local user {user_id}")
+
+    # Returning:
+    return user_id
@@ -14,9 +14,8 @@ import json
 # Local settings and session import:
 from configuration import SETTINGS
 
-# Database-related import:
-from utilities.database import DATABASE
-from sqlalchemy import func
+# Statistics import:
+from utilities import statistics
 
 
 """
@@ -62,17 +61,16 @@ def __verify_database_attached() -> bool:
 
 def __calc_database_entry_count() -> int:
     """
-    Count the number of Word entries in the database. Performs a database query to count all Word 
-    model instances in the words table. This provides the current state of the database for 
+    Count the number of Word entries in the database. Reads the materialised `words` counter
+    instead of scanning the words table. This provides the current state of the database for 
     comparison with JSON data.
     
     :return int: Number of Word entries in the database, or 0 if query fails.
     """
 
-    # Attempting SQL Alchemy's native function for efficiency:
+    # Attempting to read the materialised counter:
     try:
-        from utilities.database.models.word import Word
-        entry_count: int | None = DATABASE.session.query(func.count(Word.ID)).scalar()
+        entry_count: int = statistics.read_statistic(statistics.STATISTIC_WORDS)
         calc_result: int = entry_count or 0
         log.info(f"Database contains {entry_count} Word entries")
 